@@ -1,9 +1,18 @@
 from docx import Document
-from docx.shared import Pt
+from docx.shared import Pt, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import OxmlElement, parse_xml
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+import hashlib
+from xml.sax.saxutils import escape
+import zipfile
+import io
+import json
+import time
 import sys
 import os
 
@@ -17,7 +26,8 @@ PROJECT_ROOT = BASE_DIR.parent
 # Folders in the root directory that contain modules
 DEPENDENCY_DIRS = [
     BASE_DIR / "excel_engine",
-    PROJECT_ROOT / "utils"
+    PROJECT_ROOT / "utils",
+    PROJECT_ROOT / "notes_engine"
 ]
 
 # Add each dependency directory to sys.path if not already added
@@ -27,8 +37,11 @@ for path in DEPENDENCY_DIRS:
         sys.path.append(path_str)
 
 import utils                      # utils directory
+import json_funcs                 # utils directory
+import file_utils                 # utils directory
 import TanachXML_engine           # xml_engine directory
 import excel_engine               # excel_engine directory
+import notes_engine               # notes_engine directory
 
 # DOCX Constants
 DOCX_HEBREW_FONT = "Frank Ruehl"  # Use Frank Ruehl for Hebrew text on Word
@@ -36,35 +49,218 @@ DOCX_ENGLISH_FONT = "Times New Roman"  # Use Times New Roman for English text
 FONT_SIZE_HEB = 16  # Font size in points
 FONT_SIZE_ENG = 12  # Font size in points
 MARGIN_SIZE = Pt(12)  # Margin size in points
+NOTES_COLOR = RGBColor(211, 211, 211)  # Light grey for the notes placeholders
 
-def create_docx_with_header(eng_str: str, heb_str: str, file_path: str, file_name: str):
+# Written in place of a verse the Metsudah sheet has no English for
+ENGLISH_MISSING_TEXT = "[English text missing from the Metsudah sheet]"
+
+# Paragraph kinds produced by the builders
+PARA_HEBREW = "hebrew"
+PARA_ENGLISH = "english"
+PARA_NOTES = "notes"
+PARA_CHAPTER_HEADING = "chapter_heading"
+
+# Named paragraph styles, defined once per document and applied by reference
+STYLE_HEBREW = "Torah Hebrew"
+STYLE_ENGLISH = "Torah English"
+STYLE_NOTES = "Torah Notes"
+STYLE_ENGLISH_HEADER = "Torah English Header"
+STYLE_CHAPTER_HEADING = "Torah Chapter Heading"
+
+# Document layouts: alternating Hebrew/English paragraphs, or a two-column table
+LAYOUT_PARAGRAPHS = "paragraphs"
+LAYOUT_TABLE = "table"
+
+# Bump when the document layout code changes, so existing outputs are rebuilt
+DOCX_TEMPLATE_VERSION = 2
+
+# Per-process template (serialized .docx bytes), built on first use and cloned for each new output
+DOCX_TEMPLATE = None
+
+# Per-process snapshot of the preloaded sources, {book: corpus}, set by the pool initializer
+TORAH_CORPUS = {}
+
+# Streaming writer: WordprocessingML namespace and page size (US Letter, in twips)
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+PAGE_WIDTH_TWIPS = 12240
+PAGE_HEIGHT_TWIPS = 15840
+
+# Package parts written as is by the streaming writer
+STREAM_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+STREAM_PACKAGE_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+STREAM_DOCUMENT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+def define_paragraph_style(doc: Document, name: str, font_name: str, font_size: int, alignment,
+                           rtl: bool = False, italic: bool = False, color: RGBColor = None,
+                           bold: bool = False):
     """
-    Create a DOCX document with a styled bilingual header.
+    Adds a named paragraph style to a document, or returns it if it already exists.
 
-    Args:
-        eng_str (str): English header text.
-        heb_str (str): Hebrew header text.
-        file_path (str): Folder path to save the document.
-        file_name (str): Name of the DOCX file to save.
+    For right-to-left styles the complex-script font and size (which Word uses for
+    Hebrew runs) and the run direction are set as well. The paragraph itself stays
+    right-aligned rather than bidi, since Word mirrors left/right justification
+    inside bidi paragraphs.
 
     Returns:
-        Document: A python-docx Document object with the header created.
+        _ParagraphStyle: The style object.
     """
-    doc = Document()
+    try:
+        return doc.styles[name]
+    except KeyError:
+        pass
+
+    style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = doc.styles["Normal"]
+    style.quick_style = True
+
+    font = style.font
+    font.name = font_name
+    font.size = Pt(font_size)
+    if italic:
+        font.italic = True
+    if bold:
+        font.bold = True
+    if color is not None:
+        font.color.rgb = color
+
+    if rtl:
+        rPr = style.element.get_or_add_rPr()
+        rPr.get_or_add_rFonts().set(qn("w:cs"), font_name)
+        sz_cs = OxmlElement("w:szCs")
+        sz_cs.set(qn("w:val"), str(font_size * 2))
+        rPr.find(qn("w:sz")).addnext(sz_cs)
+        font.rtl = True
+
+    style.paragraph_format.alignment = alignment
+    return style
+
+def add_paragraph_styles(doc: Document):
+    """
+    Defines the Hebrew/English/notes/chapter heading paragraph styles on a document
+    (once per document).
+
+    Returns:
+        dict: {paragraph kind: style object}, plus "english_header".
+    """
+    return {
+        PARA_HEBREW: define_paragraph_style(doc, STYLE_HEBREW, DOCX_HEBREW_FONT, FONT_SIZE_HEB,
+                                            WD_ALIGN_PARAGRAPH.RIGHT, rtl=True),
+        PARA_ENGLISH: define_paragraph_style(doc, STYLE_ENGLISH, DOCX_ENGLISH_FONT, FONT_SIZE_ENG,
+                                             WD_ALIGN_PARAGRAPH.LEFT),
+        PARA_NOTES: define_paragraph_style(doc, STYLE_NOTES, DOCX_ENGLISH_FONT, FONT_SIZE_ENG,
+                                           WD_ALIGN_PARAGRAPH.LEFT, italic=True, color=NOTES_COLOR),
+        PARA_CHAPTER_HEADING: define_paragraph_style(doc, STYLE_CHAPTER_HEADING, DOCX_ENGLISH_FONT, FONT_SIZE_HEB,
+                                                     WD_ALIGN_PARAGRAPH.CENTER, bold=True),
+        "english_header": define_paragraph_style(doc, STYLE_ENGLISH_HEADER, DOCX_ENGLISH_FONT, FONT_SIZE_ENG,
+                                                 WD_ALIGN_PARAGRAPH.CENTER),
+    }
+
+@lru_cache(maxsize=None)
+def hash_file_contents(path: str, mtime_ns: int, size: int):
+    """
+    Returns the SHA-256 of a file. mtime_ns and size are part of the cache key, so a
+    file is hashed once per process unless it changes on disk.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_source_hash(path):
+    """
+    Returns the content hash of a source file, or None if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return hash_file_contents(str(path), stat.st_mtime_ns, stat.st_size)
+
+def get_metsudah_docx_fingerprint(book: str, **settings):
+    """
+    Fingerprints everything a Metsudah document is generated from: the UXLC XML, the
+    Metsudah xlsx and the numeral map of the book, the notes database when notes are
+    added, the template settings, and any per-output settings (range, notes flag, title...).
 
-    # Add Hebrew header
-    heb_para = doc.add_paragraph()
-    heb_run = heb_para.add_run(heb_str)
-    heb_run.font.name = DOCX_HEBREW_FONT
-    heb_run.font.size = Pt(FONT_SIZE_HEB)
-    heb_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    Returns:
+        str: Hex digest identifying the inputs of the output document.
+    """
+    sources = [
+        utils.HEB_TORAH_BOOK_DATA_XML / f"{book}.xml",
+        utils.METSUDAH_XLSX_ENG_FILES / f"{book}.xlsx",
+        utils.H_VERSE_NUM_JSON,
+    ]
+    if settings.get("add_notes"):
+        sources.append(utils.NOTES_DB)
+    payload = {
+        "sources": {Path(path).name: get_source_hash(path) for path in sources},
+        "template": [DOCX_TEMPLATE_VERSION, DOCX_HEBREW_FONT, DOCX_ENGLISH_FONT, FONT_SIZE_HEB,
+                     FONT_SIZE_ENG, int(MARGIN_SIZE)],
+        "settings": settings,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def get_fingerprint_path(output_path, file_name: str):
+    """
+    Returns the hidden sidecar file holding the input fingerprint of an output document.
+    One sidecar per document keeps parallel workers from sharing a file.
+    """
+    return Path(output_path) / f".{file_name}.fingerprint"
+
+def is_docx_up_to_date(output_path, file_name: str, fingerprint: str):
+    """
+    Checks whether a document exists and was generated from exactly these inputs.
+    """
+    fingerprint_path = get_fingerprint_path(output_path, file_name)
+    if not (Path(output_path) / file_name).exists() or not fingerprint_path.exists():
+        return False
+    return fingerprint_path.read_text(encoding="utf-8").strip() == fingerprint
 
-    # Add English header
-    eng_para = doc.add_paragraph()
-    eng_run = eng_para.add_run(eng_str)
-    eng_run.font.name = DOCX_ENGLISH_FONT
-    eng_run.font.size = Pt(FONT_SIZE_ENG)
-    eng_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+def record_docx_fingerprint(output_path, file_name: str, fingerprint: str):
+    """
+    Records the input fingerprint of a document. Call only after the document is saved.
+    """
+    get_fingerprint_path(output_path, file_name).write_text(fingerprint, encoding="utf-8")
+
+def build_docx_template():
+    """
+    Builds the template every output document starts from: margins, the named paragraph
+    styles and the (empty) Hebrew/English header paragraphs.
+
+    Returns:
+        Document: The template document.
+    """
+    doc = Document()
+    styles = add_paragraph_styles(doc)
+
+    # Hebrew and English header placeholders, filled in per document
+    doc.add_paragraph(style=styles[PARA_HEBREW])
+    doc.add_paragraph(style=styles["english_header"])
 
     # Set margins
     sections = doc.sections
@@ -74,89 +270,797 @@ def create_docx_with_header(eng_str: str, heb_str: str, file_path: str, file_nam
         section.left_margin = MARGIN_SIZE
         section.right_margin = MARGIN_SIZE
 
+    return doc
+
+def new_docx_from_template():
+    """
+    Returns a new document cloned in memory from the per-process template.
+
+    The template is built and serialized on first use only; each new document is
+    loaded from those in-memory bytes, so creating many documents does not repeat the
+    default-template read, the style definitions or the page setup.
+
+    Returns:
+        Document: An independent document with the template's content.
+    """
+    global DOCX_TEMPLATE
+    if DOCX_TEMPLATE is None:
+        buffer = io.BytesIO()
+        build_docx_template().save(buffer)
+        DOCX_TEMPLATE = buffer.getvalue()
+    return Document(io.BytesIO(DOCX_TEMPLATE))
+
+def create_docx_with_header(eng_str: str, heb_str: str, file_path: str, file_name: str, save: bool = True):
+    """
+    Create a DOCX document with a styled bilingual header.
+
+    Args:
+        eng_str (str): English header text.
+        heb_str (str): Hebrew header text.
+        file_path (str): Folder path to save the document.
+        file_name (str): Name of the DOCX file to save.
+        save (bool): Whether to save the document right away. Builders that add
+                     content afterwards pass False and save once at the end.
+
+    Returns:
+        Document: A python-docx Document object with the header created.
+    """
+    doc = new_docx_from_template()
+
+    # Fill in the Hebrew and English header
+    heb_para, eng_para = doc.paragraphs[:2]
+    heb_para.add_run(heb_str)
+    eng_para.add_run(eng_str)
+
     # Save file
-    os.makedirs(file_path, exist_ok=True)
-    full_path = os.path.join(file_path, file_name)
-    doc.save(full_path)
+    if save:
+        os.makedirs(file_path, exist_ok=True)
+        full_path = os.path.join(file_path, file_name)
+        doc.save(full_path)
 
     return doc
 
-def append_paragraph_to_docx(doc: Document, text: str, is_hebrew: bool = False):
+def append_paragraph_to_docx(doc: Document, text: str, is_hebrew: bool = False, style=None):
     """
     Appends a paragraph with specified text to a DOCX Document object.
 
+    Formatting comes from a named paragraph style (see add_paragraph_styles), so no
+    per-run font or alignment is written.
+
     Args:
         doc (Document): An existing python-docx Document object.
         text (str): Text content to append.
-        is_hebrew (bool): Whether the text is Hebrew (sets font/alignment accordingly).
-    """
-    para = doc.add_paragraph()
-    run = para.add_run(text)
-    
-    if is_hebrew:
-        run.font.name = DOCX_HEBREW_FONT
-        run.font.size = Pt(FONT_SIZE_HEB)
-        para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    else:
-        run.font.name = DOCX_ENGLISH_FONT
-        run.font.size = Pt(FONT_SIZE_ENG)
-        para.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        is_hebrew (bool): Whether the text is Hebrew (selects the Hebrew or English style).
+        style (str or _ParagraphStyle, optional): Explicit style; passing the style object
+                                                  returned by add_paragraph_styles avoids a
+                                                  lookup by name.
+    """
+    if style is None:
+        style = add_paragraph_styles(doc)[PARA_HEBREW if is_hebrew else PARA_ENGLISH]
+    doc.add_paragraph(text, style=style)
+
+def format_heb_string(verse_num: str, words: list):
+    return f"{verse_num}   {' '.join(words)}"
+
+def format_eng_string(verse_label: str, verse_text: str):
+    return f"{verse_label} {verse_text}"
+
+def get_eng_paragraph_string(chapter: int, verse: int, english_rows: list, missing: list = None):
+    """
+    Returns the English paragraph of a verse from its chapter's Metsudah rows. Some
+    sheets are short or have blank rows; such a verse gets a placeholder instead of
+    failing the whole document, and (chapter, verse) is appended to missing so the
+    caller can report the gaps.
+    """
+    if verse <= len(english_rows) and english_rows[verse - 1][1].strip():
+        return format_eng_string(*english_rows[verse - 1])
+
+    if missing is not None:
+        missing.append((chapter, verse))
+    return format_eng_string(f"Verse {verse}:", ENGLISH_MISSING_TEXT)
+
+def report_missing_english(book: str, missing: list):
+    """
+    Prints the verses written with the missing-English placeholder, if any.
+    """
+    if missing:
+        verses = ", ".join(f"{chapter}:{verse}" for chapter, verse in missing)
+        print(f"[ERROR] {book}: no English text for {len(missing)} verse(s), placeholder written: {verses}")
 
 def get_heb_string(book_xml, chapter, verse):
     verse_num = utils.get_hebrew_verse_num(verse, utils.H_VERSE_NUM_JSON)
-    verse_text = " ".join(TanachXML_engine.get_verse(utils.HEB_TORAH_BOOK_DATA_XML, book_xml, chapter, verse))
-    return f"{verse_num}   {verse_text}"
+    words = TanachXML_engine.get_verse(utils.HEB_TORAH_BOOK_DATA_XML, book_xml, chapter, verse)
+    return format_heb_string(verse_num, words)
 
 def get_eng_string(book, chapter, verse):
     row = verse + 1  # Excel row offset
     sheet = f"{book} CH{chapter}"
     path = utils.METSUDAH_XLSX_ENG_FILES / f"{book}.xlsx"
     a, b = excel_engine.get_excel_row_ab(path, sheet, row)
-    return f"{a} {b}"
+    return format_eng_string(a, b)
 
-def get_notes_string(book, chapter, verse):
-    notes = f"[notes]( {book} Ch {chapter}, Verse {verse} )[end_notes]"
-    return f"{notes}"
+def get_notes_string(book, chapter, verse, notes: dict = None):
+    """
+    Returns the notes paragraph of a verse: its note from the annotation store when
+    notes (as returned by notes_engine.get_notes_for_range) has one, otherwise a
+    placeholder naming the verse.
+    """
+    note = (notes or {}).get((chapter, verse))
+    if note is None:
+        note = f"{book} Ch {chapter}, Verse {verse}"
+    return f"[notes]( {note} )[end_notes]"
 
-def get_metsudah_ch_docx(hc_book: str, hc_book_heb: str, hc_chapter: int, add_notes: bool = False):
+def load_metsudah_book_corpus(book: str):
     """
-    Export a full chapter of Torah to a DOCX file with Hebrew and English verses.
+    Loads all sources for a whole book in one read each: the UXLC XML, every sheet of the
+    Metsudah xlsx, the Hebrew numeral map and the book's notes.
+
+    Args:
+        book (str): Name of the Torah book (e.g., 'Genesis').
+
+    Returns:
+        dict: {"hebrew": {chapter: {verse: [words]}},
+               "english": {sheet name: [(verse label, verse text), ...]},
+               "verse_nums": {verse: Hebrew numeral},
+               "notes": {(chapter, verse): note}}
+    """
+    return {
+        "hebrew": TanachXML_engine.get_book_verses(utils.HEB_TORAH_BOOK_DATA_XML, f"{book}.xml"),
+        "english": excel_engine.read_excel_sheets_ab(utils.METSUDAH_XLSX_ENG_FILES / f"{book}.xlsx"),
+        "verse_nums": utils.get_hebrew_verse_num_map(),
+        "notes": notes_engine.get_book_notes(book),
+    }
+
+def load_metsudah_ch_sources(book: str, chapter: int, corpus: dict = None):
+    """
+    Fetches everything a chapter document needs with one bulk read per source.
+
+    Args:
+        book (str): Name of the Torah book (e.g., 'Genesis').
+        chapter (int): Chapter number.
+        corpus (dict, optional): A preloaded book corpus from load_metsudah_book_corpus();
+                                 when given, nothing is read from disk.
+
+    Returns:
+        tuple: (hebrew_verses, english_rows, verse_nums) where
+            hebrew_verses (dict): {verse: [Hebrew words]} from the UXLC XML,
+            english_rows (list): [(verse label, verse text), ...] from the Metsudah xlsx,
+            verse_nums (dict): {verse: Hebrew numeral}.
+    """
+    sheet = f"{book} CH{chapter}"
+
+    if corpus is not None:
+        if chapter not in corpus["hebrew"]:
+            raise ValueError(f"Chapter not found: {chapter} in {book}.xml")
+        if sheet not in corpus["english"]:
+            raise ValueError(f"Sheet '{sheet}' does not exist in the file.")
+        return corpus["hebrew"][chapter], corpus["english"][sheet], corpus["verse_nums"]
+
+    hebrew_verses = TanachXML_engine.get_chapter_verses(utils.HEB_TORAH_BOOK_DATA_XML, f"{book}.xml", chapter)
+
+    path = utils.METSUDAH_XLSX_ENG_FILES / f"{book}.xlsx"
+    english_rows = excel_engine.read_excel_sheets_ab(path, sheet_names=[sheet])[sheet]
+
+    verse_nums = utils.get_hebrew_verse_num_map()
+
+    return hebrew_verses, english_rows, verse_nums
+
+def get_metsudah_ch_paragraphs(book: str, chapter: int, hebrew_verses: dict, english_rows: list,
+                               verse_nums: dict, add_notes: bool = False, first_verse: int = 1,
+                               last_verse: int = None, notes: dict = None):
+    """
+    Yields the (text, paragraph kind) paragraphs of a chapter from already-loaded sources.
+
+    first_verse/last_verse restrict the output to part of the chapter (inclusive).
+    notes are the preloaded {(chapter, verse): note} of the annotation store.
+
+    A verse the English sheet has no text for is written with a placeholder, and the
+    chapter's gaps are reported once it is done (see get_eng_paragraph_string()).
+    """
+    missing = []
+    for verse in sorted(hebrew_verses):
+        if verse < first_verse or (last_verse is not None and verse > last_verse):
+            continue
+
+        yield format_heb_string(verse_nums.get(verse, "Invalid verse number"), hebrew_verses[verse]), PARA_HEBREW
+        yield get_eng_paragraph_string(chapter, verse, english_rows, missing), PARA_ENGLISH
+        if add_notes:
+            yield get_notes_string(book, chapter, verse, notes), PARA_NOTES
+
+    report_missing_english(book, missing)
+
+def get_metsudah_range_paragraphs(book: str, start: tuple, end: tuple, corpus: dict, add_notes: bool = False):
+    """
+    Yields the (text, paragraph kind) paragraphs of a verse range, in one pass over a
+    preloaded book corpus, with a chapter heading at the start of each chapter.
+
+    Args:
+        book (str): Name of the Torah book (e.g., 'Genesis').
+        start (tuple): (chapter, verse) of the first verse, inclusive.
+        end (tuple): (chapter, verse) of the last verse, inclusive.
+        corpus (dict): Book corpus from load_metsudah_book_corpus().
+        add_notes (bool): Whether to add a notes placeholder after each verse.
+    """
+    (start_ch, start_vs), (end_ch, end_vs) = start, end
+    verse_nums = corpus["verse_nums"]
+
+    for chapter in range(start_ch, end_ch + 1):
+        hebrew_verses, english_rows, _ = load_metsudah_ch_sources(book, chapter, corpus)
+
+        yield f"Chapter {chapter} - פרק {verse_nums.get(chapter, chapter)}", PARA_CHAPTER_HEADING
+        yield from get_metsudah_ch_paragraphs(
+            book, chapter, hebrew_verses, english_rows, verse_nums, add_notes,
+            first_verse=start_vs if chapter == start_ch else 1,
+            last_verse=end_vs if chapter == end_ch else None,
+            notes=corpus["notes"],
+        )
+
+def get_bilingual_table_rows(paragraphs):
+    """
+    Groups (text, paragraph kind) paragraphs into table rows: a chapter heading becomes a
+    row of its own, and each Hebrew verse opens a row that collects the English
+    translation (and notes) that follow it.
+
+    Yields:
+        dict: {paragraph kind: text}
+    """
+    row = None
+    for text, kind in paragraphs:
+        if kind in (PARA_CHAPTER_HEADING, PARA_HEBREW):
+            if row is not None:
+                yield row
+            row = {kind: text}
+        else:
+            row[kind] = text
+    if row is not None:
+        yield row
+
+def build_bilingual_table_xml(rows):
+    """
+    Builds a two-column table, English on the left and Hebrew on the right, as a single
+    XML string. Chapter heading rows span both columns; notes go under the English text.
+
+    Args:
+        rows (iterable): Rows from get_bilingual_table_rows().
+
+    Returns:
+        str: The <w:tbl> element.
+    """
+    column_width = (PAGE_WIDTH_TWIPS - 2 * int(MARGIN_SIZE.pt * 20)) // 2
+    parts = [
+        f'<w:tbl {nsdecls("w")}>'
+        '<w:tblPr><w:tblStyle w:val="TableGrid"/>'
+        f'<w:tblW w:w="{column_width * 2}" w:type="dxa"/><w:tblLayout w:type="fixed"/></w:tblPr>'
+        f'<w:tblGrid><w:gridCol w:w="{column_width}"/><w:gridCol w:w="{column_width}"/></w:tblGrid>'
+    ]
+    cell_pr = f'<w:tcPr><w:tcW w:w="{column_width}" w:type="dxa"/></w:tcPr>'
+
+    for row in rows:
+        if PARA_CHAPTER_HEADING in row:
+            parts.append(
+                f'<w:tr><w:tc><w:tcPr><w:tcW w:w="{column_width * 2}" w:type="dxa"/><w:gridSpan w:val="2"/>'
+                f'</w:tcPr>{format_paragraph_xml(row[PARA_CHAPTER_HEADING], PARA_CHAPTER_HEADING)}</w:tc></w:tr>'
+            )
+            continue
+
+        english = format_paragraph_xml(row.get(PARA_ENGLISH, ""), PARA_ENGLISH)
+        if PARA_NOTES in row:
+            english += format_paragraph_xml(row[PARA_NOTES], PARA_NOTES)
+        hebrew = format_paragraph_xml(row[PARA_HEBREW], PARA_HEBREW)
+        parts.append(f'<w:tr><w:tc>{cell_pr}{english}</w:tc><w:tc>{cell_pr}{hebrew}</w:tc></w:tr>')
+
+    parts.append('</w:tbl>')
+    return "".join(parts)
+
+def append_bilingual_table(doc: Document, rows):
+    """
+    Appends the two-column bilingual table to a document. The whole table is parsed once
+    and inserted as a single element instead of being built cell by cell through the
+    python-docx table API, which keeps a whole book to a few seconds.
+
+    Args:
+        doc (Document): A document created from the template (its styles must exist).
+        rows (iterable): Rows from get_bilingual_table_rows().
+    """
+    table = parse_xml(build_bilingual_table_xml(rows))
+    body = doc.element.body
+    if body.sectPr is not None:
+        body.sectPr.addprevious(table)
+    else:
+        body.append(table)
+
+def add_metsudah_content(doc: Document, paragraphs, layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Adds (text, paragraph kind) paragraphs to a document in the requested layout.
+    """
+    if layout == LAYOUT_TABLE:
+        append_bilingual_table(doc, get_bilingual_table_rows(paragraphs))
+        return
+
+    styles = add_paragraph_styles(doc)
+    for text, kind in paragraphs:
+        append_paragraph_to_docx(doc, text, style=styles[kind])
+
+def get_layout_file_name(file_name: str, layout: str):
+    """
+    Returns the output file name for a layout; table documents get a "_Table" suffix so
+    both layouts of the same range can sit side by side.
     """
-    book_xml = f"{hc_book}.xml"
-    num_verses = utils.get_torah_ch_verse_num(hc_book, hc_chapter)
+    if layout == LAYOUT_TABLE:
+        stem, ext = os.path.splitext(file_name)
+        return f"{stem}_Table{ext}"
+    return file_name
 
+def get_metsudah_ch_docx_target(hc_book: str, hc_book_heb: str, hc_chapter: int, add_notes: bool = False,
+                                layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Returns where a chapter document goes and the fingerprint of its inputs, without
+    loading any source.
+
+    Returns:
+        tuple: (output_path, file_name, fingerprint)
+    """
+    heb_header = f"תּוֹרָה - סֵפֶר {hc_book_heb}"
+    file_name = get_layout_file_name(f"{hc_book}_Ch_{hc_chapter}.docx", layout)
+    fingerprint = get_metsudah_docx_fingerprint(hc_book, chapter=hc_chapter, heb_header=heb_header,
+                                                add_notes=add_notes, layout=layout)
+    return utils.METSUDAH_DOCX_ENG_OUTPUT, file_name, fingerprint
+
+def get_metsudah_ch_docx(hc_book: str, hc_book_heb: str, hc_chapter: int, add_notes: bool = False,
+                         corpus: dict = None, force: bool = False, layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Export a full chapter of Torah to a DOCX file with Hebrew and English verses.
+
+    The Hebrew verses, English verses and Hebrew numerals are each fetched in one bulk
+    read (or taken from a preloaded corpus), the document is rendered in memory and
+    saved exactly once. If the existing document was generated from the same inputs
+    (see get_metsudah_docx_fingerprint) it is kept as is, unless force is True.
+
+    layout is LAYOUT_PARAGRAPHS (alternating paragraphs) or LAYOUT_TABLE (side by side).
+    """
     header = f"{hc_book} Chapter {hc_chapter}"
     heb_header = f"תּוֹרָה - סֵפֶר {hc_book_heb}"
-    file_name = f"{hc_book}_Ch_{hc_chapter}.docx"
-    output_path = utils.METSUDAH_DOCX_ENG_OUTPUT
+    output_path, file_name, fingerprint = get_metsudah_ch_docx_target(hc_book, hc_book_heb, hc_chapter,
+                                                                      add_notes, layout)
+    if not force and is_docx_up_to_date(output_path, file_name, fingerprint):
+        print(f"[INFO] Up to date, skipping: {os.path.join(output_path, file_name)}")
+        return os.path.join(output_path, file_name)
 
-    doc = create_docx_with_header(header, heb_header, output_path, file_name)
+    hebrew_verses, english_rows, verse_nums = load_metsudah_ch_sources(hc_book, hc_chapter, corpus)
+    notes = None
+    if add_notes:
+        notes = corpus["notes"] if corpus is not None else notes_engine.get_notes_for_range(
+            hc_book, (hc_chapter, 1), (hc_chapter, max(hebrew_verses, default=0)))
 
-    for verse in range(1, num_verses + 1):
-        append_paragraph_to_docx(doc, get_heb_string(book_xml, hc_chapter, verse), is_hebrew=True)
-        append_paragraph_to_docx(doc, get_eng_string(hc_book, hc_chapter, verse), is_hebrew=False)
-        if (add_notes):
-            append_paragraph_to_docx(doc, get_notes_string(hc_book, hc_chapter, verse), is_hebrew=False)
+    doc = create_docx_with_header(header, heb_header, output_path, file_name, save=False)
+    add_metsudah_content(doc, get_metsudah_ch_paragraphs(hc_book, hc_chapter, hebrew_verses, english_rows,
+                                                         verse_nums, add_notes, notes=notes), layout)
 
+    os.makedirs(output_path, exist_ok=True)
     doc.save(os.path.join(output_path, file_name))
+    record_docx_fingerprint(output_path, file_name, fingerprint)
     print(f"[INFO] Saved chapter to: {os.path.join(output_path, file_name)}")
+    return os.path.join(output_path, file_name)
 
-def metsudah_book_chapters_to_word(book_name, book_name_heb, file_path):
+def metsudah_book_chapters_to_word(book_name, book_name_heb, add_notes=False, force=False):
     """
     Given a Torah book name, retrieves each chapter from the Book with a Metsudah English
     translation and hebrew text and saves each chapter to a separate docx.
 
+    Chapters whose document is already up to date with its inputs are skipped.
+
     Args:
         book_name (str): Name of the Torah book (e.g., 'Genesis')
         book_name_heb (str): Name of the Torah book (e.g., 'בראשית')
-        file_name (str): Path and Name of the DOCX file to save.
+        add_notes (bool): Whether to add a notes placeholder after each verse.
+        force (bool): Regenerate every chapter even if it is up to date.
     """
 
     chapter_count = utils.get_torah_book_num_chapters(book_name)
 
     for num_chapter in range(1, chapter_count + 1):
         print(f"Processing {book_name} ...")
-        get_metsudah_ch_docx(book_name, book_name_heb, num_chapter)
+        get_metsudah_ch_docx(book_name, book_name_heb, num_chapter, add_notes, force=force)
+
+def export_metsudah_range_docx(book: str, start: tuple, end: tuple, title: str, file_name: str,
+                               add_notes: bool = False, corpus: dict = None, force: bool = False,
+                               layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Export an arbitrary verse range of a book into a single DOCX document.
+
+    The book's sources are loaded once, the range is rendered in one streaming pass with
+    chapter headings inserted at chapter boundaries, and the document is saved once.
+    Nothing is loaded or written if the existing document is up to date with its inputs.
+
+    Args:
+        book (str): Name of the Torah book (e.g., 'Genesis').
+        start (tuple): (chapter, verse) of the first verse, inclusive.
+        end (tuple): (chapter, verse) of the last verse, inclusive.
+        title (str): English title shown under the Hebrew header.
+        file_name (str): Name of the DOCX file to save.
+        add_notes (bool): Whether to add a notes placeholder after each verse.
+        corpus (dict, optional): A preloaded book corpus from load_metsudah_book_corpus().
+        force (bool): Regenerate the document even if it is up to date.
+        layout (str): LAYOUT_PARAGRAPHS or LAYOUT_TABLE; table documents are saved with
+                      a "_Table" suffix.
+
+    Returns:
+        str: Full path of the saved document.
+    """
+    heb_header = f"תּוֹרָה - סֵפֶר {utils.TORAH_BOOKS_HEB.get(book, book)}"
+    output_path = utils.METSUDAH_DOCX_ENG_OUTPUT
+    file_name = get_layout_file_name(file_name, layout)
+
+    fingerprint = get_metsudah_docx_fingerprint(book, start=start, end=end, title=title, add_notes=add_notes,
+                                                layout=layout)
+    if not force and is_docx_up_to_date(output_path, file_name, fingerprint):
+        print(f"[INFO] Up to date, skipping: {os.path.join(output_path, file_name)}")
+        return os.path.join(output_path, file_name)
+
+    corpus = corpus or load_metsudah_book_corpus(book)
+
+    doc = create_docx_with_header(title, heb_header, output_path, file_name, save=False)
+    add_metsudah_content(doc, get_metsudah_range_paragraphs(book, start, end, corpus, add_notes), layout)
+
+    os.makedirs(output_path, exist_ok=True)
+    full_path = os.path.join(output_path, file_name)
+    doc.save(full_path)
+    record_docx_fingerprint(output_path, file_name, fingerprint)
+    print(f"[INFO] Saved {title} to: {full_path}")
+    return full_path
+
+def export_metsudah_book_docx(book: str, add_notes: bool = False, force: bool = False,
+                              layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Export a whole Torah book into a single DOCX document.
+    """
+    chapters = utils.load_json("TorahChapterLengths.json")["books"][book]["chapters"]
+    last_chapter = max(int(chapter) for chapter in chapters)
+    last_verse = chapters[str(last_chapter)]
+    return export_metsudah_range_docx(book, (1, 1), (last_chapter, last_verse), book, f"{book}.docx",
+                                      add_notes, force=force, layout=layout)
+
+def export_metsudah_parasha_docx(parasha_name: str, add_notes: bool = False, force: bool = False,
+                                 layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Export a parasha, as listed in data/ParashotData.json, into a single DOCX document.
+    """
+    parasha = json_funcs.find_parasha(parasha_name)
+    if parasha is None:
+        print(f"[ERROR] Parasha '{parasha_name}' not found.")
+        return None
+
+    book = parasha["Book"]
+    start = (parasha["Start"]["Chapter"], parasha["Start"]["Verse"])
+    end = (parasha["End"]["Chapter"], parasha["End"]["Verse"])
+    title = f"{parasha['standard']} ({book} {start[0]}:{start[1]} - {end[0]}:{end[1]})"
+    file_name = f"{parasha['number']:02d}_{parasha['standard'].replace(' ', '_')}.docx"
+    return export_metsudah_range_docx(book, start, end, title, file_name, add_notes, force=force, layout=layout)
+
+def export_metsudah_aliyah_docx(parasha_name: str, aliyah, add_notes: bool = False, force: bool = False,
+                                layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Export one aliyah ("1" to "7") or the maftir of a parasha, as listed in
+    data/aliyot_maftir_all_parshiyot.json, into a single DOCX document.
+    """
+    aliyah_range = json_funcs.get_aliyah_range(parasha_name, aliyah)
+    if aliyah_range is None:
+        available = ", ".join(json_funcs.get_aliyot_parasha_names())
+        print(f"[ERROR] Aliyah '{aliyah}' of parasha '{parasha_name}' not found. "
+              f"Aliyot are listed for: {available}.")
+        return None
+
+    book, start, end = aliyah_range
+    label = "Maftir" if str(aliyah).lower() == "maftir" else f"Aliyah {aliyah}"
+    title = f"{parasha_name} {label} ({book} {start[0]}:{start[1]} - {end[0]}:{end[1]})"
+    file_name = f"{parasha_name.replace(' ', '_')}_{label.replace(' ', '_')}.docx"
+    return export_metsudah_range_docx(book, start, end, title, file_name, add_notes, force=force, layout=layout)
+
+def init_corpus_worker(corpus: dict):
+    """
+    Process pool initializer: installs the preloaded {book: corpus} snapshot in the worker.
+    """
+    global TORAH_CORPUS
+    TORAH_CORPUS = corpus
+
+def export_metsudah_ch_docx_worker(book: str, book_heb: str, chapter: int, add_notes: bool = False,
+                                   force: bool = False, layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Process pool worker: writes one chapter document from the worker's corpus snapshot.
+
+    Returns:
+        tuple: (book, chapter, elapsed_seconds)
+    """
+    start_time = time.perf_counter()
+    get_metsudah_ch_docx(book, book_heb, chapter, add_notes, corpus=TORAH_CORPUS.get(book), force=force,
+                         layout=layout)
+    return book, chapter, time.perf_counter() - start_time
+
+def metsudah_chapters_to_word_parallel(book_names=None, add_notes: bool = False, max_workers: int = None,
+                                       force: bool = False, layout: str = LAYOUT_PARAGRAPHS):
+    """
+    Writes every chapter document of the given Torah books using a pool of worker processes.
+
+    Chapters whose document is up to date with its inputs are filtered out first, from
+    their fingerprints alone, so a rerun with nothing to do loads no source at all. The
+    sources of the books that still have stale chapters are loaded once in the parent and
+    handed to each worker as a read-only snapshot when it starts, so workers only render
+    and save. Each chapter goes to its own file, so workers never write the same document.
+
+    Args:
+        book_names (list[str], optional): Books to export. Defaults to all five Torah books.
+        add_notes (bool): Whether to add a notes placeholder after each verse.
+        max_workers (int, optional): Upper bound on concurrent worker processes.
+                                     Defaults to the number of CPUs.
+        force (bool): Regenerate every chapter even if it is up to date with its inputs.
+        layout (str): LAYOUT_PARAGRAPHS or LAYOUT_TABLE.
+
+    Returns:
+        int: Number of chapter documents written (up-to-date chapters are not counted).
+    """
+    book_names = book_names or utils.TORAH_BOOKS
+    max_workers = max_workers or os.cpu_count() or 1
+
+    start_time = time.perf_counter()
+    jobs = []
+    skipped = 0
+    for book in book_names:
+        for chapter in range(1, utils.get_torah_book_num_chapters(book) + 1):
+            target = get_metsudah_ch_docx_target(book, utils.TORAH_BOOKS_HEB[book], chapter, add_notes, layout)
+            if not force and is_docx_up_to_date(*target):
+                skipped += 1
+            else:
+                jobs.append((book, chapter))
+
+    if not jobs:
+        print(f"[INFO] All {skipped} chapter documents are up to date, nothing to write.")
+        return 0
+
+    stale_books = list(dict.fromkeys(book for book, _ in jobs))
+    corpus = {book: load_metsudah_book_corpus(book) for book in stale_books}
+    print(f"[INFO] Loaded {len(stale_books)} book(s) in {time.perf_counter() - start_time:.1f}s")
+
+    failed = []
+
+    # The jobs are already filtered, so workers write without checking fingerprints again
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_corpus_worker,
+                             initargs=(corpus,)) as executor:
+        futures = {
+            executor.submit(export_metsudah_ch_docx_worker, book, utils.TORAH_BOOKS_HEB[book], chapter,
+                            add_notes, True, layout):
+                (book, chapter)
+            for book, chapter in jobs
+        }
+
+        for future in as_completed(futures):
+            book, chapter = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed.append((book, chapter))
+                print(f"[ERROR] {book} Chapter {chapter} failed: {e}")
+
+    written = len(jobs) - len(failed)
+    print(f"[INFO] Wrote {written} chapter documents, skipped {skipped} up to date, {len(failed)} failed, "
+          f"with {max_workers} workers in {time.perf_counter() - start_time:.1f}s")
+    return written
+
+def get_style_id(style_name: str):
+    """
+    Returns the style id Word (and python-docx) derive from a style name, e.g. "TorahHebrew".
+    """
+    return style_name.replace(" ", "")
+
+def get_streaming_style_xml(name: str, font_name: str, font_size: int, jc: str, rtl: bool = False,
+                            italic: bool = False, color: RGBColor = None, bold: bool = False):
+    """
+    Returns the <w:style> element of a named paragraph style, with the same formatting
+    define_paragraph_style() gives it, for the streaming writer.
+    """
+    rpr = f'<w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}"' + (f' w:cs="{font_name}"' if rtl else "") + "/>"
+    if bold:
+        rpr += "<w:b/>"
+    if italic:
+        rpr += "<w:i/>"
+    if color is not None:
+        rpr += f'<w:color w:val="{color}"/>'
+    rpr += f'<w:sz w:val="{font_size * 2}"/>'
+    if rtl:
+        rpr += f'<w:szCs w:val="{font_size * 2}"/><w:rtl/>'
+
+    return (f'<w:style w:type="paragraph" w:customStyle="1" w:styleId="{get_style_id(name)}">'
+            f'<w:name w:val="{name}"/><w:basedOn w:val="Normal"/><w:qFormat/>'
+            f'<w:pPr><w:jc w:val="{jc}"/></w:pPr><w:rPr>{rpr}</w:rPr></w:style>')
+
+def get_streaming_styles_xml():
+    """
+    Returns word/styles.xml for the streaming writer: a Normal style plus the Hebrew,
+    English, notes, English header and chapter heading styles of add_paragraph_styles().
+    """
+    styles = [
+        get_streaming_style_xml(STYLE_HEBREW, DOCX_HEBREW_FONT, FONT_SIZE_HEB, "right", rtl=True),
+        get_streaming_style_xml(STYLE_ENGLISH, DOCX_ENGLISH_FONT, FONT_SIZE_ENG, "left"),
+        get_streaming_style_xml(STYLE_NOTES, DOCX_ENGLISH_FONT, FONT_SIZE_ENG, "left", italic=True,
+                                color=NOTES_COLOR),
+        get_streaming_style_xml(STYLE_CHAPTER_HEADING, DOCX_ENGLISH_FONT, FONT_SIZE_HEB, "center", bold=True),
+        get_streaming_style_xml(STYLE_ENGLISH_HEADER, DOCX_ENGLISH_FONT, FONT_SIZE_ENG, "center"),
+    ]
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:styles xmlns:w="{W_NAMESPACE}">'
+            '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/>'
+            '</w:style>'
+            + "".join(styles) +
+            '</w:styles>')
+
+# Paragraph kind -> style id used by the streaming writer
+STREAM_STYLE_IDS = {
+    PARA_HEBREW: get_style_id(STYLE_HEBREW),
+    PARA_ENGLISH: get_style_id(STYLE_ENGLISH),
+    PARA_NOTES: get_style_id(STYLE_NOTES),
+    PARA_CHAPTER_HEADING: get_style_id(STYLE_CHAPTER_HEADING),
+    "english_header": get_style_id(STYLE_ENGLISH_HEADER),
+}
+
+def format_paragraph_xml(text: str, kind: str):
+    """
+    Returns one styled <w:p> element as XML text, for the streaming writer and the
+    bulk-built table layout.
+    """
+    return (f'<w:p><w:pPr><w:pStyle w:val="{STREAM_STYLE_IDS[kind]}"/></w:pPr>'
+            f'<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>')
+
+def write_streaming_docx(full_path: str, paragraphs):
+    """
+    Writes a DOCX file straight from a (text, paragraph kind) generator.
+
+    Unlike python-docx, no document tree is built: each paragraph is serialized and
+    written into the compressed word/document.xml entry as soon as it is produced, so
+    memory use stays constant however large the document gets. The output uses the same
+    named styles, margins and page size as the python-docx exports.
+
+    The file is written next to its destination and moved into place once complete.
+
+    Args:
+        full_path (str): Path of the DOCX file to write.
+        paragraphs (iterable): (text, kind) pairs, kind being PARA_HEBREW, PARA_ENGLISH,
+                               PARA_NOTES, PARA_CHAPTER_HEADING or "english_header".
+
+    Returns:
+        int: Number of paragraphs written.
+    """
+    margin = int(MARGIN_SIZE.pt * 20)
+    sect_pr = (f'<w:sectPr><w:pgSz w:w="{PAGE_WIDTH_TWIPS}" w:h="{PAGE_HEIGHT_TWIPS}"/>'
+               f'<w:pgMar w:top="{margin}" w:right="{margin}" w:bottom="{margin}" w:left="{margin}" '
+               f'w:header="720" w:footer="720" w:gutter="0"/></w:sectPr>')
+
+    def write_package(tmp_path):
+        count = 0
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("[Content_Types].xml", STREAM_CONTENT_TYPES_XML)
+            zf.writestr("_rels/.rels", STREAM_PACKAGE_RELS_XML)
+            zf.writestr("word/_rels/document.xml.rels", STREAM_DOCUMENT_RELS_XML)
+            zf.writestr("word/styles.xml", get_streaming_styles_xml())
+
+            with zf.open("word/document.xml", "w", force_zip64=True) as part:
+                part.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                            f'<w:document xmlns:w="{W_NAMESPACE}"><w:body>').encode("utf-8"))
+                for text, kind in paragraphs:
+                    part.write(format_paragraph_xml(text, kind).encode("utf-8"))
+                    count += 1
+                part.write(f"{sect_pr}</w:body></w:document>".encode("utf-8"))
+        return count
+
+    os.makedirs(os.path.dirname(full_path) or ".", exist_ok=True)
+    written = []
+    file_utils.replace_file_atomic(full_path, lambda tmp_path: written.append(write_package(tmp_path)),
+                                  suffix=".docx")
+    return written[0]
+
+def iter_metsudah_range_paragraphs(book: str, start: tuple, end: tuple, add_notes: bool = False):
+    """
+    Yields the (text, paragraph kind) paragraphs of a verse range like
+    get_metsudah_range_paragraphs(), but without loading the book: the Hebrew XML is
+    parsed incrementally and the Metsudah sheets are read one chapter at a time.
+
+    Verses the English sheet has no text for are written with a placeholder, and the
+    range's gaps are reported once it is done (see get_eng_paragraph_string()).
+    """
+    (start_ch, start_vs), (end_ch, end_vs) = start, end
+    verse_nums = utils.get_hebrew_verse_num_map()
+    notes = notes_engine.get_notes_for_range(book, start, end) if add_notes else None
+    english_sheets = excel_engine.iter_excel_sheets_ab(
+        utils.METSUDAH_XLSX_ENG_FILES / f"{book}.xlsx",
+        sheet_names=[f"{book} CH{chapter}" for chapter in range(start_ch, end_ch + 1)],
+    )
+
+    current_chapter = None
+    english_rows = []
+    missing = []
+    try:
+        for chapter, verse, words in TanachXML_engine.iter_book_verses(utils.HEB_TORAH_BOOK_DATA_XML,
+                                                                       f"{book}.xml"):
+            if (chapter, verse) < (start_ch, start_vs):
+                continue
+            if (chapter, verse) > (end_ch, end_vs):
+                break
+
+            if chapter != current_chapter:
+                current_chapter = chapter
+                _, english_rows = next(english_sheets)
+                yield f"Chapter {chapter} - פרק {verse_nums.get(chapter, chapter)}", PARA_CHAPTER_HEADING
+
+            yield format_heb_string(verse_nums.get(verse, "Invalid verse number"), words), PARA_HEBREW
+            yield get_eng_paragraph_string(chapter, verse, english_rows, missing), PARA_ENGLISH
+            if add_notes:
+                yield get_notes_string(book, chapter, verse, notes), PARA_NOTES
+    finally:
+        english_sheets.close()
+
+    report_missing_english(book, missing)
+
+def stream_metsudah_range_docx(book: str, start: tuple, end: tuple, title: str, file_name: str,
+                               add_notes: bool = False, force: bool = False):
+    """
+    Same output as export_metsudah_range_docx(), written with the streaming writer so
+    memory stays constant whatever the size of the range.
+
+    Returns:
+        str: Full path of the saved document.
+    """
+    heb_header = f"תּוֹרָה - סֵפֶר {utils.TORAH_BOOKS_HEB.get(book, book)}"
+    output_path = utils.METSUDAH_DOCX_ENG_OUTPUT
+    full_path = os.path.join(output_path, file_name)
+
+    fingerprint = get_metsudah_docx_fingerprint(book, start=start, end=end, title=title, add_notes=add_notes)
+    if not force and is_docx_up_to_date(output_path, file_name, fingerprint):
+        print(f"[INFO] Up to date, skipping: {full_path}")
+        return full_path
+
+    def paragraphs():
+        yield heb_header, PARA_HEBREW
+        yield title, "english_header"
+        yield from iter_metsudah_range_paragraphs(book, start, end, add_notes)
+
+    count = write_streaming_docx(full_path, paragraphs())
+    record_docx_fingerprint(output_path, file_name, fingerprint)
+    print(f"[INFO] Streamed {count} paragraphs of {title} to: {full_path}")
+    return full_path
+
+def stream_metsudah_torah_docx(add_notes: bool = False, file_name: str = "Torah.docx", force: bool = False):
+    """
+    Writes the whole Torah, all five books with every chapter, as one bilingual DOCX
+    document using the streaming writer. Each book starts with a centered
+    "Book - ספר" heading.
+
+    Returns:
+        str: Full path of the saved document.
+    """
+    output_path = utils.METSUDAH_DOCX_ENG_OUTPUT
+    full_path = os.path.join(output_path, file_name)
+    chapter_lengths = utils.load_json("TorahChapterLengths.json")["books"]
+
+    fingerprint = hashlib.sha256("".join(
+        get_metsudah_docx_fingerprint(book, torah=True, add_notes=add_notes) for book in utils.TORAH_BOOKS
+    ).encode("utf-8")).hexdigest()
+    if not force and is_docx_up_to_date(output_path, file_name, fingerprint):
+        print(f"[INFO] Up to date, skipping: {full_path}")
+        return full_path
+
+    def paragraphs():
+        yield "תּוֹרָה", PARA_HEBREW
+        yield "Torah", "english_header"
+        for book in utils.TORAH_BOOKS:
+            chapters = chapter_lengths[book]["chapters"]
+            last_chapter = max(int(chapter) for chapter in chapters)
+            yield f"{book} - {utils.TORAH_BOOKS_HEB[book]}", PARA_CHAPTER_HEADING
+            yield from iter_metsudah_range_paragraphs(book, (1, 1), (last_chapter, chapters[str(last_chapter)]),
+                                                      add_notes)
+
+    start_time = time.perf_counter()
+    count = write_streaming_docx(full_path, paragraphs())
+    record_docx_fingerprint(output_path, file_name, fingerprint)
+    print(f"[INFO] Streamed {count} paragraphs to {full_path} in {time.perf_counter() - start_time:.1f}s")
+    return full_path
 
 # Example usage:
 # create_docx_with_header("Genesis - Chapter 1", "\u05d1\u05e8\u05d0\u05e9\u05d9\u05ea \u05e4\u05e8\u05e7 \u05d0", "/path/to/folder", "output.docx")
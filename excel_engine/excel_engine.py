@@ -1,10 +1,162 @@
 import os
+import sys
+import json
+import time
+import unicodedata
 from openpyxl import Workbook
 from openpyxl import load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill
 from openpyxl.utils import get_column_letter
 from pathlib import Path
 
+# -------------------------
+# Bootstrapping Dependencies
+# -------------------------
+# Get the absolute path to the *parent* of the current file's directory
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+
+# Folders in the root directory that contain modules
+DEPENDENCY_DIRS = [
+    PROJECT_ROOT / "utils",
+    PROJECT_ROOT / "xml_engine"
+]
+
+# Add each dependency directory to sys.path if not already added
+for path in DEPENDENCY_DIRS:
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.append(path_str)
+
+import utils                      # utils directory
+import file_utils                 # utils directory
+import TanachXML_engine           # xml_engine directory
+
+# Header style shared by every generated sheet
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
+HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+HEBREW_ALIGN = Alignment(horizontal="right", vertical="top", wrap_text=False, readingOrder=2)
+
+# Bilingual workbook columns
+BILINGUAL_HEADERS = ["Verse", "Verse_Heb", "Hebrew_String", "Verse_String"]
+
+# Sidecar manifest recording the completed sheets of a workbook
+MANIFEST_SUFFIX = ".manifest.json"
+
+def save_workbook_atomic(wb, file_path):
+    """
+    Saves an openpyxl workbook crash-safely (temp file + atomic rename).
+
+    Args:
+        wb (Workbook): The workbook to save.
+        file_path (str or Path): Path of the .xlsx file.
+    """
+    file_utils.replace_file_atomic(file_path, wb.save, suffix=".xlsx.tmp")
+
+def get_manifest_path(file_path):
+    """
+    Returns the path of the sidecar manifest for a workbook (e.g. 'Genesis.xlsx.manifest.json').
+    """
+    return Path(f"{file_path}{MANIFEST_SUFFIX}")
+
+def load_sheet_manifest(file_path):
+    """
+    Loads the sidecar manifest of completed sheets for a workbook.
+
+    A manifest whose workbook no longer exists is stale and treated as empty.
+
+    Args:
+        file_path (str or Path): Path of the .xlsx file.
+
+    Returns:
+        dict: {"sheets": {sheet_name: {...details}}}
+    """
+    manifest_path = get_manifest_path(file_path)
+    if not os.path.exists(file_path) or not manifest_path.exists():
+        return {"sheets": {}}
+
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"[ERROR] Ignoring unreadable manifest {manifest_path}: {e}")
+        return {"sheets": {}}
+
+    manifest.setdefault("sheets", {})
+    return manifest
+
+def save_sheet_manifest(file_path, manifest):
+    """
+    Writes the sidecar manifest of a workbook crash-safely.
+
+    Args:
+        file_path (str or Path): Path of the .xlsx file.
+        manifest (dict): The manifest to write.
+    """
+    file_utils.write_json_atomic(get_manifest_path(file_path), manifest)
+
+def mark_sheet_complete(file_path, sheet_name, **details):
+    """
+    Records a sheet as completely written. Call only after the workbook has been saved.
+
+    Args:
+        file_path (str or Path): Path of the .xlsx file.
+        sheet_name (str): Name of the completed sheet.
+        **details: Extra values stored with the entry (e.g. rows=31).
+    """
+    manifest = load_sheet_manifest(file_path)
+    manifest["sheets"][sheet_name] = {"completed_at": time.strftime("%Y-%m-%dT%H:%M:%S"), **details}
+    save_sheet_manifest(file_path, manifest)
+
+def get_sheet_content_hash(headers, rows):
+    """
+    Returns a SHA-256 fingerprint of a sheet's header and row values.
+
+    Args:
+        headers (list): Header row values.
+        rows (iterable): Row value sequences, in order.
+
+    Returns:
+        str: Hex digest identifying the sheet content.
+    """
+    return file_utils.get_content_hash([list(headers), [list(row) for row in rows]])
+
+def is_sheet_up_to_date(file_path, sheet_name, content_hash):
+    """
+    Checks whether a sheet was already completely written with exactly the given content.
+
+    Args:
+        file_path (str or Path): Path of the .xlsx file.
+        sheet_name (str): Name of the sheet.
+        content_hash (str): Fingerprint from get_sheet_content_hash() of the new content.
+
+    Returns:
+        bool: True if the manifest records the same hash and the sheet exists in the workbook.
+    """
+    entry = load_sheet_manifest(file_path)["sheets"].get(sheet_name)
+    if not entry or entry.get("content_hash") != content_hash:
+        return False
+
+    wb = load_workbook(filename=file_path, read_only=True)
+    try:
+        return sheet_name in wb.sheetnames
+    finally:
+        wb.close()
+
+def get_completed_sheets(file_path):
+    """
+    Returns the names of the sheets recorded as complete for a workbook.
+
+    Args:
+        file_path (str or Path): Path of the .xlsx file.
+
+    Returns:
+        set[str]: Completed sheet names (empty if the workbook or manifest is missing).
+    """
+    return set(load_sheet_manifest(file_path)["sheets"])
+
 def create_excel_file(filename, directory, sheet_name="Sheet1"):
     """
     Creates or updates an Excel file with the given filename and specified sheet name in the given directory.
@@ -36,13 +188,17 @@ def create_excel_file(filename, directory, sheet_name="Sheet1"):
             # Remove existing sheet to overwrite it
             std = wb[sheet_name]
             wb.remove(std)
+            # The sheet is no longer complete until it is rewritten
+            manifest = load_sheet_manifest(file_path)
+            if manifest["sheets"].pop(sheet_name, None) is not None:
+                save_sheet_manifest(file_path, manifest)
         wb.create_sheet(title=sheet_name)
     else:
         wb = Workbook()
         ws = wb.active
         ws.title = sheet_name
 
-    wb.save(file_path)
+    save_workbook_atomic(wb, file_path)
     return file_path
 
 def style_excel_header(file_path, header_names, sheet_name=None):
@@ -65,17 +221,13 @@ def style_excel_header(file_path, header_names, sheet_name=None):
         wb = load_workbook(file_path)
         ws = wb[sheet_name] if sheet_name and sheet_name in wb.sheetnames else wb.active
 
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        header_align = Alignment(horizontal="center", vertical="center")
-
         for col_idx, header in enumerate(header_names, start=1):
             cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_align
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGN
 
-        wb.save(file_path)
+        save_workbook_atomic(wb, file_path)
         return True
 
     except Exception as e:
@@ -102,7 +254,7 @@ def freeze_excel_header_row(file_path, sheet_name=None):
         ws.freeze_panes = ws['A2']
 
         # Save changes
-        wb.save(file_path)
+        save_workbook_atomic(wb, file_path)
         return True
 
     except FileNotFoundError:
@@ -178,13 +330,118 @@ def write_string_to_excel(file_path, sheet_name, cell, text):
     ws[cell] = text
 
     # Save the workbook
-    wb.save(file_path)
+    save_workbook_atomic(wb, file_path)
+
+def get_text_display_width(value):
+    """
+    Returns the number of character columns a cell value occupies when displayed.
+
+    Hebrew vowel points (niqqud), cantillation marks and bidi control characters
+    (e.g. RLM/LRE markers) are rendered on top of, or between, the base letters and
+    take up no width of their own, so they are not counted. Wide (East Asian) characters
+    count as two columns. For multi-line values the longest line is used.
+
+    Args:
+        value: The cell value (any type, converted with str()).
+
+    Returns:
+        int: The display width of the value, 0 for None or empty values.
+    """
+    if value is None:
+        return 0
+
+    max_width = 0
+    for line in str(value).splitlines() or [""]:
+        width = 0
+        for char in line:
+            if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+                continue
+            width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+        max_width = max(max_width, width)
+
+    return max_width
+
+def track_column_widths(column_widths, row_values, start_column=1):
+    """
+    Updates a running {column_index: max_width} dictionary with the values of one row.
+
+    Args:
+        column_widths (dict): Running maximum display width per 1-based column index.
+        row_values (iterable): The values written to the row, in column order.
+        start_column (int): 1-based column index of the first value. Defaults to 1.
+
+    Returns:
+        dict: The updated column_widths dictionary.
+    """
+    for col_idx, value in enumerate(row_values, start=start_column):
+        width = get_text_display_width(value)
+        if width > column_widths.get(col_idx, 0):
+            column_widths[col_idx] = width
+    return column_widths
+
+def apply_column_widths(ws, column_widths, padding=2):
+    """
+    Sets the width of each tracked column on a worksheet.
+
+    Args:
+        ws (Worksheet): The openpyxl worksheet to adjust.
+        column_widths (dict): Maximum display width per 1-based column index.
+        padding (int): Extra characters added for readability. Defaults to 2.
+    """
+    for col_idx, width in column_widths.items():
+        ws.column_dimensions[get_column_letter(col_idx)].width = width + padding
+
+def write_rows_to_excel(file_path, sheet_name, rows, start_row=2, autofit=True):
+    """
+    Writes a block of rows to a worksheet in a single load/save cycle.
+
+    Column widths are tracked while the rows are written (seeded with the rows above
+    start_row, e.g. the header), so auto-fitting needs no second pass over the sheet.
+
+    :param file_path: Path to the Excel file
+    :param sheet_name: Name of the sheet to write to (creates if missing)
+    :param rows: Iterable of row value sequences, written starting at column A
+    :param start_row: 1-based row number of the first written row. Defaults to 2 (below the header).
+    :param autofit: Whether to adjust the column widths to the written content.
+    :return: int - Number of rows written
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File '{file_path}' does not exist.")
+
+    wb = load_workbook(file_path)
+
+    if sheet_name in wb.sheetnames:
+        ws = wb[sheet_name]
+    else:
+        ws = wb.create_sheet(title=sheet_name)
+
+    column_widths = {}
+    if autofit and start_row > 1:
+        for header_row in ws.iter_rows(max_row=start_row - 1, values_only=True):
+            track_column_widths(column_widths, header_row)
+
+    row_count = 0
+    for row_idx, row_values in enumerate(rows, start=start_row):
+        for col_idx, value in enumerate(row_values, start=1):
+            ws.cell(row=row_idx, column=col_idx, value=value)
+        if autofit:
+            track_column_widths(column_widths, row_values)
+        row_count += 1
+
+    if autofit:
+        apply_column_widths(ws, column_widths)
+
+    save_workbook_atomic(wb, file_path)
+    return row_count
 
 def autofit_excel_columns(file_path, sheet_name):
     """
     Adjust the width of each column in the specified sheet to fit its longest cell content,
     emulating Excel's auto-fit behavior.
 
+    Prefer write_rows_to_excel(), which tracks widths while writing and avoids the
+    extra load/save cycle; this is kept for sheets written by other means.
+
     Args:
         file_path (str or Path): Path to the Excel file.
         sheet_name (str): The name of the worksheet to adjust.
@@ -197,21 +454,13 @@ def autofit_excel_columns(file_path, sheet_name):
 
     ws = wb[sheet_name]
 
-    for col in ws.columns:
-        max_length = 0
-        column = col[0].column  # Get the column number (1-based)
-        column_letter = get_column_letter(column)
-        for cell in col:
-            try:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            except:
-                pass
+    column_widths = {}
+    for row_values in ws.iter_rows(values_only=True):
+        track_column_widths(column_widths, row_values)
 
-        adjusted_width = max_length + 2  # Padding for readability
-        ws.column_dimensions[column_letter].width = adjusted_width
+    apply_column_widths(ws, column_widths)
 
-    wb.save(file_path)
+    save_workbook_atomic(wb, file_path)
 
 def get_excel_row_ab(file_path, sheet_name, row_number):
     """
@@ -241,3 +490,158 @@ def get_excel_row_ab(file_path, sheet_name, row_number):
         raise ValueError(f"Row {row_number} is empty or out of bounds.")
 
     return str(cell_a) if cell_a is not None else "", str(cell_b) if cell_b is not None else ""
+
+
+def iter_excel_sheets_ab(file_path, sheet_names=None, skip_header=True):
+    """
+    Yields the column A and B values of one sheet at a time, keeping the workbook open
+    in read-only mode so only the current sheet is held in memory.
+
+    :param file_path: str - Path to the Excel (.xlsx) file.
+    :param sheet_names: list[str] - Only read these sheets, in this order. Defaults to all sheets.
+    :param skip_header: bool - Whether to skip the first row of each sheet.
+    :return: generator - (sheet_name, [(A value, B value), ...]) with None values as ""
+    :raises FileNotFoundError: If the file is not found.
+    :raises ValueError: If a requested sheet does not exist.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Excel file not found: {file_path}")
+
+    wb = load_workbook(filename=file_path, read_only=True)
+    try:
+        for sheet_name in sheet_names or wb.sheetnames:
+            if sheet_name not in wb.sheetnames:
+                raise ValueError(f"Sheet '{sheet_name}' does not exist in the file.")
+
+            min_row = 2 if skip_header else 1
+            yield sheet_name, [
+                (str(a) if a is not None else "", str(b) if b is not None else "")
+                for a, b in wb[sheet_name].iter_rows(min_row=min_row, max_col=2, values_only=True)
+            ]
+    finally:
+        wb.close()
+
+def read_excel_sheets_ab(file_path, sheet_names=None, skip_header=True):
+    """
+    Returns the column A and B values of every row of every sheet, read in one pass.
+
+    :param file_path: str - Path to the Excel (.xlsx) file.
+    :param sheet_names: list[str] - Only read these sheets. Defaults to all sheets.
+    :param skip_header: bool - Whether to skip the first row of each sheet.
+    :return: dict - {sheet_name: [(A value, B value), ...]} with None values as ""
+    :raises FileNotFoundError: If the file is not found.
+    :raises ValueError: If a requested sheet does not exist.
+    """
+    return dict(iter_excel_sheets_ab(file_path, sheet_names, skip_header))
+
+def write_workbook_m(file_path, sheets, rtl_columns=()):
+    """
+    Writes a complete workbook in a single streaming pass.
+
+    Every sheet gets the styled header, a frozen header row and column widths fitted
+    to its content. Widths are computed from the in-memory rows before writing, so
+    the workbook is saved once and never reloaded. Any existing file is replaced.
+
+    Args:
+        file_path (str or Path): Path of the .xlsx file to write.
+        sheets (dict): {sheet_name: (headers, rows)} in the order the sheets should appear.
+        rtl_columns (iterable[int]): 1-based column indexes holding Hebrew text, which are
+                                     right-aligned with a right-to-left reading order.
+
+    Returns:
+        Path: The path of the written workbook.
+    """
+    rtl_columns = set(rtl_columns)
+    wb = Workbook(write_only=True)
+
+    for sheet_name, (headers, rows) in sheets.items():
+        ws = wb.create_sheet(title=sheet_name)
+
+        column_widths = track_column_widths({}, headers)
+        for row_values in rows:
+            track_column_widths(column_widths, row_values)
+        apply_column_widths(ws, column_widths)
+        ws.freeze_panes = "A2"
+
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGN
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        for row_values in rows:
+            if rtl_columns:
+                row_values = list(row_values)
+                for col_idx in rtl_columns:
+                    cell = WriteOnlyCell(ws, value=row_values[col_idx - 1])
+                    cell.alignment = HEBREW_ALIGN
+                    row_values[col_idx - 1] = cell
+            ws.append(row_values)
+
+    save_workbook_atomic(wb, file_path)
+    return Path(file_path)
+
+def save_bilingual_torah_book_to_excel_m(book_name, directory=None):
+    """
+    Builds one workbook for a Torah book with the UXLC Hebrew next to the Metsudah English.
+
+    Everything comes from local data: the Tanach.xml book is parsed once, the Metsudah
+    English workbook is read once and the Hebrew verse numerals are loaded once, then
+    the joined rows are written in a single pass, one sheet per chapter. No web access.
+
+    Args:
+        book_name (str): Name of the Torah book (e.g., 'Genesis').
+        directory (Path, optional): Output directory. Defaults to utils.OUT_BILINGUAL_TORAH_XLSX.
+
+    Returns:
+        Path: Path of the written workbook.
+    """
+    directory = Path(directory or utils.OUT_BILINGUAL_TORAH_XLSX)
+    os.makedirs(directory, exist_ok=True)
+
+    hebrew_book = TanachXML_engine.get_book_verses(utils.HEB_TORAH_BOOK_DATA_XML, f"{book_name}.xml")
+    english_sheets = read_excel_sheets_ab(utils.METSUDAH_XLSX_ENG_FILES / f"{book_name}.xlsx")
+    verse_nums = utils.get_hebrew_verse_num_map()
+
+    sheets = {}
+    for chapter, verses in hebrew_book.items():
+        sheet_name = f"{book_name} CH{chapter}"
+        english_rows = english_sheets.get(sheet_name, [])
+        if not english_rows:
+            print(f"[ERROR] No English sheet '{sheet_name}' found, writing Hebrew only.")
+
+        rows = []
+        blank_verses = []
+        for verse, words in verses.items():
+            _, english_text = english_rows[verse - 1] if verse <= len(english_rows) else ("", "")
+            if english_rows and not english_text:
+                blank_verses.append(verse)
+            rows.append((verse, verse_nums.get(verse, ""), " ".join(words), english_text))
+        sheets[sheet_name] = (BILINGUAL_HEADERS, rows)
+
+        # Short or gappy English sheets are written with blank English, but never silently
+        if blank_verses:
+            print(f"[ERROR] {sheet_name}: no English text for verse(s) {blank_verses}, left blank.")
+
+    xlsx_path = write_workbook_m(directory / f"{book_name}.xlsx", sheets, rtl_columns=(2, 3))
+    print(f"[INFO] Saved bilingual {book_name} ({len(sheets)} chapters) to: {xlsx_path}")
+    return xlsx_path
+
+def save_bilingual_torah_to_excel_m(book_names=None, directory=None):
+    """
+    Builds the bilingual Hebrew/English workbook for each given Torah book.
+
+    Args:
+        book_names (list[str], optional): Books to export. Defaults to all five Torah books.
+        directory (Path, optional): Output directory. Defaults to utils.OUT_BILINGUAL_TORAH_XLSX.
+
+    Returns:
+        list[Path]: Paths of the written workbooks.
+    """
+    start_time = time.perf_counter()
+    paths = [save_bilingual_torah_book_to_excel_m(book, directory) for book in book_names or utils.TORAH_BOOKS]
+    print(f"[INFO] Wrote {len(paths)} bilingual workbooks in {time.perf_counter() - start_time:.1f}s")
+    return paths
@@ -45,6 +45,9 @@ def main():
     hc_chapter = 1
     hc_verse = 1
     hc_word_index = 1
+    hc_parasha = "Shemot"
+    hc_aliyah_parasha = "Bereshit"  # data/aliyot_maftir_all_parshiyot.json lists only Bereshit and Noach so far
+    hc_aliyah = "1"
     get_notes = True
 
     # Ask the user to choose between the options
@@ -75,6 +78,36 @@ def main():
     elif choice == "8":
         # Get all chapters in a Book using eng Metsudah translation and the Hebrew.
         docx_engine.metsudah_book_chapters_to_word(hc_book, hc_book_heb, get_notes)
+    elif choice == "9":
+        # Get all five Torah books from the Metsudah Eng translation site, in parallel, and save them in excel.
+        metsudah_chumash_web_nav.save_torah_books_to_excel_parallel_m()
+    elif choice == "10":
+        # Build a Hebrew + Metsudah English workbook for each of the five books from local data.
+        excel_engine.save_bilingual_torah_to_excel_m()
+    elif choice == "11":
+        # Get every chapter of all five books using eng Metsudah translation and the Hebrew, in parallel.
+        docx_engine.metsudah_chapters_to_word_parallel(add_notes=get_notes)
+    elif choice == "12":
+        # Get a whole Book in one document using eng Metsudah translation and the Hebrew.
+        docx_engine.export_metsudah_book_docx(hc_book, get_notes)
+    elif choice == "13":
+        # Get a whole Parasha in one document using eng Metsudah translation and the Hebrew.
+        docx_engine.export_metsudah_parasha_docx(hc_parasha, get_notes)
+    elif choice == "14":
+        # Get a single Aliyah in one document using eng Metsudah translation and the Hebrew.
+        docx_engine.export_metsudah_aliyah_docx(hc_aliyah_parasha, hc_aliyah, get_notes)
+    elif choice == "15":
+        # Stream the whole Torah into one document using eng Metsudah translation and the Hebrew.
+        docx_engine.stream_metsudah_torah_docx(get_notes)
+    elif choice == "16":
+        # Get a whole Parasha as a side by side Hebrew/English table.
+        docx_engine.export_metsudah_parasha_docx(hc_parasha, get_notes, layout=docx_engine.LAYOUT_TABLE)
+    elif choice == "17":
+        # Scrape all five books from the Metsudah site with a pool of headless browsers and save them in excel.
+        metsudah_chumash_web_nav.save_torah_books_to_excel_pooled_m()
+    elif choice == "18":
+        # Same as 17, submitting the Metsudah search form over HTTP instead of driving browsers.
+        metsudah_chumash_web_nav.save_torah_books_to_excel_pooled_m(fetcher=utils.METSUDAH_FETCHER_HTTP)
     else:
         print("Have a nice day !")
 
@@ -0,0 +1,134 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+# Local annotation store for the notes written under each verse of the documents.
+# Notes live in a single SQLite file (utils.NOTES_DB), one row per book/chapter/verse.
+
+# -------------------------
+# Bootstrapping Dependencies
+# -------------------------
+# Get the absolute path to the *parent* of the current file's directory
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+
+# Folders in the root directory that contain modules
+DEPENDENCY_DIRS = [
+    PROJECT_ROOT / "utils"
+]
+
+# Add each dependency directory to sys.path if not already added
+for path in DEPENDENCY_DIRS:
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.append(path_str)
+
+# -------------------------
+# Import Dependencies
+# -------------------------
+import utils                      # utils directory
+
+NOTES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    book    TEXT    NOT NULL,
+    chapter INTEGER NOT NULL,
+    verse   INTEGER NOT NULL,
+    note    TEXT    NOT NULL,
+    PRIMARY KEY (book, chapter, verse)
+) WITHOUT ROWID
+"""
+
+def connect_notes_db(db_path=None):
+    """
+    Opens the notes database, creating the file and the table if needed.
+
+    Args:
+        db_path (str or Path, optional): Path of the SQLite file. Defaults to utils.NOTES_DB.
+
+    Returns:
+        sqlite3.Connection: An open connection.
+    """
+    db_path = Path(db_path or utils.NOTES_DB)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(NOTES_SCHEMA)
+    return conn
+
+def set_note(book: str, chapter: int, verse: int, note: str, db_path=None):
+    """
+    Adds or replaces the note of one verse.
+    """
+    set_notes([(book, chapter, verse, note)], db_path)
+
+def set_notes(notes, db_path=None):
+    """
+    Adds or replaces many notes in one transaction.
+
+    Args:
+        notes (iterable): (book, chapter, verse, note) tuples.
+        db_path (str or Path, optional): Path of the SQLite file. Defaults to utils.NOTES_DB.
+
+    Returns:
+        int: Number of notes written.
+    """
+    conn = connect_notes_db(db_path)
+    try:
+        with conn:
+            cursor = conn.executemany(
+                "INSERT OR REPLACE INTO notes (book, chapter, verse, note) VALUES (?, ?, ?, ?)",
+                notes,
+            )
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+def delete_note(book: str, chapter: int, verse: int, db_path=None):
+    """
+    Removes the note of one verse, if any.
+    """
+    conn = connect_notes_db(db_path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM notes WHERE book = ? AND chapter = ? AND verse = ?", (book, chapter, verse))
+    finally:
+        conn.close()
+
+def get_notes_for_range(book: str, start: tuple, end: tuple, db_path=None):
+    """
+    Returns every note of a verse range with a single query.
+
+    Args:
+        book (str): Name of the Torah book (e.g., 'Genesis').
+        start (tuple): (chapter, verse) of the first verse, inclusive.
+        end (tuple): (chapter, verse) of the last verse, inclusive.
+        db_path (str or Path, optional): Path of the SQLite file. Defaults to utils.NOTES_DB.
+
+    Returns:
+        dict: {(chapter, verse): note}. Empty if the database does not exist yet.
+    """
+    if not Path(db_path or utils.NOTES_DB).exists():
+        return {}
+
+    (start_ch, start_vs), (end_ch, end_vs) = start, end
+    conn = connect_notes_db(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT chapter, verse, note FROM notes WHERE book = ?"
+            " AND (chapter > ? OR (chapter = ? AND verse >= ?))"
+            " AND (chapter < ? OR (chapter = ? AND verse <= ?))",
+            (book, start_ch, start_ch, start_vs, end_ch, end_ch, end_vs),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return {(chapter, verse): note for chapter, verse, note in rows}
+
+def get_book_notes(book: str, db_path=None):
+    """
+    Returns every note of a book with a single query.
+
+    Returns:
+        dict: {(chapter, verse): note}
+    """
+    return get_notes_for_range(book, (0, 0), (sys.maxsize, sys.maxsize), db_path)
@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+
+# -------------------------
+# Bootstrapping Dependencies
+# -------------------------
+# The modules import each other by folder (e.g. `import excel_engine`), as the scripts do
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+DEPENDENCY_DIRS = [
+    PROJECT_ROOT / "torah_search_bar",
+    PROJECT_ROOT / "web_navigator",
+    PROJECT_ROOT / "utils",
+    PROJECT_ROOT / "excel_engine",
+    PROJECT_ROOT / "xml_engine",
+    PROJECT_ROOT,
+]
+
+for path in DEPENDENCY_DIRS:
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.append(path_str)
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import crawl_manifest
+from conftest import PROJECT_ROOT
+
+# Records `count` failed units of one book in a shared crawl manifest, from its own process
+WRITER_SCRIPT = """
+import sys
+sys.path.append({web_navigator!r})
+import crawl_manifest
+for chapter in range(1, {count} + 1):
+    crawl_manifest.record_unit("metsudah_excel", f"{book}/{{chapter}}", crawl_manifest.STATUS_FAILED,
+                               error="chapter could not be fetched or saved", manifest_dir={manifest_dir!r})
+"""
+
+def test_concurrent_processes_keep_every_entry(tmp_path):
+    count = 40
+    writers = [
+        subprocess.Popen([sys.executable, "-c", WRITER_SCRIPT.format(
+            web_navigator=str(PROJECT_ROOT / "web_navigator"), count=count, book=book, manifest_dir=str(tmp_path))])
+        for book in ("Genesis", "Exodus")
+    ]
+    assert [writer.wait(timeout=120) for writer in writers] == [0, 0]
+
+    units = crawl_manifest.load_crawl_manifest("metsudah_excel", tmp_path)["units"]
+    assert len(units) == 2 * count
+    assert all(entry["status"] == crawl_manifest.STATUS_FAILED for entry in units.values())
+
+def test_clear_unit_removes_only_that_unit(tmp_path):
+    crawl_manifest.record_unit("metsudah_excel", "Genesis/1", crawl_manifest.STATUS_FAILED, manifest_dir=tmp_path)
+    crawl_manifest.record_unit("metsudah_excel", "Genesis/2", crawl_manifest.STATUS_FAILED, manifest_dir=tmp_path)
+
+    crawl_manifest.clear_unit("metsudah_excel", "Genesis/1", manifest_dir=tmp_path)
+
+    assert set(crawl_manifest.load_crawl_manifest("metsudah_excel", tmp_path)["units"]) == {"Genesis/2"}
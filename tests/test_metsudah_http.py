@@ -0,0 +1,100 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+import metsudah_chumash_web_nav
+import page_cache
+import retry_policy
+import utils
+
+METSUDAH_PAGES_DIR = utils.METSUDAH_SAMPLE_PAGES_DIR
+SEARCH_PAGE = (METSUDAH_PAGES_DIR / "chumash_search.html").read_text(encoding="utf-8")
+
+# Option values of the search form's book select
+BOOK_VALUES = {"1": "Genesis", "2": "Exodus", "3": "Leviticus", "4": "Numbers", "5": "Deuteronomy"}
+
+class MetsudahHandler(BaseHTTPRequestHandler):
+    """Serves the search form on GET and the saved result page of the submitted chapter on POST."""
+
+    def do_GET(self):
+        self.send_page(SEARCH_PAGE)
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8"))
+        self.server.submitted_forms.append(form)
+
+        page_path = METSUDAH_PAGES_DIR / f"{BOOK_VALUES[form['bookq'][0]]}_{form['chapterq'][0]}.html"
+        if not page_path.exists():
+            self.send_error(404)
+            return
+        self.send_page(page_path.read_text(encoding="utf-8"))
+
+    def send_page(self, page):
+        body = page.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def metsudah_server(monkeypatch, tmp_path):
+    server = HTTPServer(("127.0.0.1", 0), MetsudahHandler)
+    server.submitted_forms = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_port}/texis/vtx/chumash"
+    monkeypatch.setattr(metsudah_chumash_web_nav, "load_eng_website_link", lambda *args: (url, None, None, None))
+    monkeypatch.setattr(metsudah_chumash_web_nav, "CHUMASH_SEARCH_PAGE", None)
+    monkeypatch.setattr(page_cache, "PAGE_CACHE_DIR", tmp_path / "page_cache")
+    monkeypatch.setattr(utils, "HOST_MIN_REQUEST_INTERVAL", 0)
+    monkeypatch.setattr(retry_policy, "RETRY_BASE_DELAY", 0)
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+@pytest.mark.parametrize("book, chapter, first_verse", [
+    ("Genesis", 1, "In the beginning El-him created the heavens and the earth."),
+    ("Genesis", 2, "The heavens and the earth were completed, and [so were] all their conglomerations."),
+])
+def test_http_fetch_parses_every_verse(metsudah_server, book, chapter, first_verse):
+    verse_data = metsudah_chumash_web_nav.get_metsudah_ch_http(book, chapter)
+
+    assert list(verse_data) == [f"Verse {verse}:" for verse in range(1, utils.get_torah_ch_verse_num(book, chapter) + 1)]
+    assert verse_data["Verse 1:"] == first_verse
+    assert all(verse_data.values())
+
+    # The form went out with the option values, not the option texts
+    assert metsudah_server.submitted_forms[-1]["bookq"] == ["1"]
+    assert metsudah_server.submitted_forms[-1]["chapterq"] == [str(chapter)]
+    assert metsudah_server.submitted_forms[-1]["textq"] == ["1"]
+
+def test_http_fetch_reads_a_complete_chapter_from_the_cache(metsudah_server):
+    first_fetch = metsudah_chumash_web_nav.get_metsudah_ch_http("Deuteronomy", 6)
+
+    assert metsudah_chumash_web_nav.get_metsudah_ch_http("Deuteronomy", 6) == first_fetch
+    assert len(metsudah_server.submitted_forms) == 1
+
+def test_http_fetch_refuses_an_incomplete_page(metsudah_server):
+    assert metsudah_chumash_web_nav.get_metsudah_ch_http("Numbers", 6) is None
+    assert page_cache.get_cached_page(source="metsudah", book="Numbers", chapter=6) is None
+
+@pytest.mark.parametrize("book, chapter, field", [
+    ("Joshua", 1, "bookq"),
+    ("Genesis", 51, "chapterq"),
+])
+def test_form_request_refuses_a_missing_option(book, chapter, field):
+    with pytest.raises(ValueError, match=f"No '{field}' option"):
+        metsudah_chumash_web_nav.build_chumash_form_request(SEARCH_PAGE, "http://127.0.0.1/", book, chapter)
+
+def test_http_fetch_sends_nothing_without_a_matching_option(metsudah_server):
+    assert metsudah_chumash_web_nav.get_metsudah_ch_http("Genesis", 51) is None
+    assert metsudah_server.submitted_forms == []
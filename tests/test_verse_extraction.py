@@ -0,0 +1,37 @@
+import pytest
+
+import html_backend
+import metsudah_chumash_web_nav
+import utils
+
+CHAPTER_PAGES = sorted(path for path in utils.METSUDAH_SAMPLE_PAGES_DIR.glob("*.html")
+                       if metsudah_chumash_web_nav.VERSE_LABEL_PATTERN.search(path.read_text(encoding="utf-8")))
+
+def test_sample_pages_are_present():
+    assert [path.stem for path in CHAPTER_PAGES] == ["Deuteronomy_6", "Genesis_1", "Genesis_2", "Numbers_6"]
+
+@pytest.mark.parametrize("page_path", CHAPTER_PAGES, ids=lambda path: path.stem)
+def test_parser_backends_extract_the_same_verses(page_path):
+    if not html_backend.is_parser_available(html_backend.HTML_PARSER_LXML):
+        pytest.skip("lxml is not installed")
+    page_source = page_path.read_text(encoding="utf-8")
+
+    builtin_verses = metsudah_chumash_web_nav.extract_chapter_verses(page_source, parser=html_backend.HTML_PARSER_BUILTIN)
+    lxml_verses = metsudah_chumash_web_nav.extract_chapter_verses(page_source, parser=html_backend.HTML_PARSER_LXML)
+
+    assert lxml_verses == builtin_verses
+    assert all(text for _, text in builtin_verses.values())
+
+@pytest.mark.parametrize("book, chapter", [("Genesis", 1), ("Genesis", 2), ("Deuteronomy", 6)])
+def test_complete_pages_have_every_verse(book, chapter):
+    page_source = (utils.METSUDAH_SAMPLE_PAGES_DIR / f"{book}_{chapter}.html").read_text(encoding="utf-8")
+
+    verses = metsudah_chumash_web_nav.extract_chapter_verses(page_source)
+
+    assert sorted(verses) == list(range(1, utils.get_torah_ch_verse_num(book, chapter) + 1))
+
+def test_benchmark_defaults_to_the_sample_pages():
+    results = metsudah_chumash_web_nav.benchmark_verse_extraction(repeat=1)
+
+    assert html_backend.HTML_PARSER_BUILTIN in results
+    assert all(result["matches"] for result in results.values())
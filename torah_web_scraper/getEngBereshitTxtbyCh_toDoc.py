@@ -1,16 +1,18 @@
 from selenium import webdriver                                      # For automating and controlling the web browser
 from selenium.webdriver.common.by import By                         # For locating elements on the web page
-from selenium.webdriver.chrome.service import Service               # For initializing and configuring the ChromeDriver
-from webdriver_manager.chrome import ChromeDriverManager            # Manages downloading and setting up ChromeDriver
 from selenium.webdriver.support.ui import Select                    # For interacting with drop-down menus (select elements)
 import time                                                         # For pausing the execution of the program (e.g., sleep or wait)
 import subprocess                                                   # For running system commands and interacting with the system shell
-from bs4 import BeautifulSoup                                       # For parsing and navigating HTML or XML content
 from selenium.webdriver.support.ui import WebDriverWait             # For waiting for elements to appear on the page
 from selenium.webdriver.support import expected_conditions as EC    # For defining the expected conditions for elements
 from docx import Document                                           # For creating and modifying Word documents
 import os                                                           # For file and directory operations (e.g., working with paths, creating folders)
 import shutil                                                       # For file operations (e.g., moving, copying, and deleting files)
+import sys                                                          # For adding the project's web_navigator folder to the import path
+from pathlib import Path                                            # For building that folder's path
+sys.path.append(str(Path(__file__).resolve().parent.parent / "web_navigator"))
+import html_backend                                                 # Fastest available HTML parser (lxml when installed)
+import driver_resolver                                              # Resolves ChromeDriver once and caches it
                                                                     ################################################################################################
 
 ##################################################################################
@@ -73,8 +75,8 @@ def grab_verses(driver):
         # Get the page source after it has fully loaded
         page_source = driver.page_source
 
-        # Parse the page with BeautifulSoup
-        soup = BeautifulSoup(page_source, "html.parser")
+        # Parse the page with BeautifulSoup, using the fastest available parser
+        soup = html_backend.make_soup(page_source)
 
         # Find all <b> tags that represent the verses
         verses = soup.find_all('b')
@@ -133,7 +135,7 @@ def save_to_word(verses, filename):
 ##################################################################################
 def extract_full_string(html_content):
     # Parse the HTML with BeautifulSoup
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = html_backend.make_soup(html_content)
     
     # Find all links in the HTML content
     links = soup.find_all('a', href=True)
@@ -152,7 +154,7 @@ def extract_full_string(html_content):
 # Main process to get Genesis and feed the URL into the verse-grabbing function
 ##################################################################################
 def get_Genesis_and_verses(chapter_number):
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = driver_resolver.new_chrome_driver()
     driver.get("http://www.mnemotrix.com/texis/vtx/chumash")  # Replace with your desired URL
 
     try:
@@ -1,8 +1,6 @@
 import json                                                         # For encoding and decoding JSON data.                                                             
 from selenium import webdriver                                      # For automating and controlling the web browser
 from selenium.webdriver.common.by import By                         # For locating elements on the web page
-from selenium.webdriver.chrome.service import Service               # For initializing and configuring the ChromeDriver
-from webdriver_manager.chrome import ChromeDriverManager            # Manages downloading and setting up ChromeDriver
 from selenium.webdriver.support.ui import Select                    # For interacting with drop-down menus (select elements)
 import time                                                         # For pausing the execution of the program (e.g., sleep or wait)
 import subprocess                                                   # For running system commands and interacting with the system shell
@@ -18,6 +16,20 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 import inspect
+import sys
+from pathlib import Path
+
+# The on-disk page cache lives in the project's web_navigator folder, the crash-safe
+# writer and content hashes in its utils folder (file_utils; this folder's own utils
+# module still wins for `import utils`, as the script's folder comes first on the path)
+sys.path.append(str(Path(__file__).resolve().parent.parent / "web_navigator"))
+sys.path.append(str(Path(__file__).resolve().parent.parent / "utils"))
+import page_cache
+import crawl_manifest
+import retry_policy
+import file_utils                                                   # Content hashes of the scraped verse ranges
+import driver_resolver                                              # Resolves ChromeDriver once and caches it
+import utils                                                        # torah_web_scraper settings, incl. the project-wide ones
                                                                     ################################################################################################
 
 
@@ -41,6 +53,9 @@ DOCX_HEBREW_FONT = "Frank Ruehl" # Use Frank Ruehl for Hebrew text on Word
 FONT_SIZE = 18  # Font size in points
 MARGIN_SIZE = Pt(18)  # Margin size in points
 VERSE_ID_FONT_SIZE = 12  # Smaller font size for the verse ID
+WAIT_TIMEOUT = utils.WAIT_TIMEOUT  # Ceiling, in seconds, on waits for page elements (the project's scraper_settings.WEB_WAIT_TIMEOUT)
+HEB_PARASHOT_CRAWL = "chabad_parashot"  # Crawl manifest of process_all_parashot_main (see crawl_manifest)
+REUSED_POPUP_TIMEOUT = 2  # The subscribe popup is normally shown once per browser, so don't wait long for it again
 
 # Load data from the external JSON file
 # Function to load JSON data from a file in the 'data' directory
@@ -224,11 +239,15 @@ def number_to_hebrew(n):
     result = hundreds[h] + tens[t] + units[u]
     return result
 
-def traverse_tanakh_scraper(tanakh_division_name, book_name=None, chapter_choice=None, end_chapter_choice=None, start_verse_choice=1, end_verse_choice=None, file_path=load_tanakh_path(HEB_DOCX_FOLDER)):
+def traverse_tanakh_scraper(tanakh_division_name, book_name=None, chapter_choice=None, end_chapter_choice=None, start_verse_choice=1, end_verse_choice=None, file_path=load_tanakh_path(HEB_DOCX_FOLDER), crawl_name=None):
     """
     Traverses the Tanakh JSON structure and performs scraping for specified sections.
+
+    With a crawl_name, each chapter's outcome is recorded in that crawl manifest and
+    chapters it records as done (with their document still on disk) are skipped.
     """
     DEBUG = True  # Toggle for debug print statements
+    driver = None  # One browser for every chapter, replaced only after a failure
 
     try:
         # Load the JSON file
@@ -257,19 +276,34 @@ def traverse_tanakh_scraper(tanakh_division_name, book_name=None, chapter_choice
                 start_verse = start_verse_choice if current_chapter == chapter_choice else 1
                 end_verse = end_verse_choice if current_chapter == end_chapter_choice else verse_count
 
+                if crawl_name and crawl_manifest.is_unit_complete(crawl_name, get_crawl_unit(current_book_name, current_chapter, start_verse, end_verse)):
+                    if DEBUG:
+                        print(f"Skipping {current_book_name}, Chapter {current_chapter}, Verses {start_verse}-{end_verse} (already complete)")
+                    continue
+
                 if DEBUG:
                     print(f"Processing {current_book_name}, Chapter {current_chapter}, Verses {start_verse}-{end_verse}")
 
-                time.sleep(1) 
+                # Cached chapters are saved without a browser
+                if driver is None and get_cached_verse_texts(current_book_name, current_chapter, start_verse, end_verse) is None:
+                    driver = driver_resolver.new_chrome_driver()
+
                 # Perform scraping for the current range
-                perform_tanakh_scraping(
+                scraped = perform_tanakh_scraping(
                     tanakh_division_name=tanakh_division_name,
                     book_name=current_book_name,
                     chapter_choice=current_chapter,
                     start_verse_choice=start_verse,
                     end_verse_choice=end_verse,
-                    file_path=file_path
+                    file_path=file_path,
+                    driver=driver,
+                    crawl_name=crawl_name
                 )
+
+                # Recycle the browser after a failure
+                if not scraped and driver is not None:
+                    driver.quit()
+                    driver = None
                 
     except FileNotFoundError:
         print(f"Error: The file 'Pentateuch.json' was not found in the 'data' folder.")
@@ -278,6 +312,9 @@ def traverse_tanakh_scraper(tanakh_division_name, book_name=None, chapter_choice
     except Exception as e:
         if DEBUG:
             print(f"An unexpected error occurred: {e}")
+    finally:
+        if driver is not None:
+            driver.quit()
 
 ##################################################################################
 ##################################################################################
@@ -285,12 +322,47 @@ def traverse_tanakh_scraper(tanakh_division_name, book_name=None, chapter_choice
 ##################################################################################
 ##################################################################################
 
-def perform_tanakh_scraping(tanakh_division_name, book_name, chapter_choice, start_verse_choice, end_verse_choice, file_path=load_tanakh_path(HEB_DOCX_FOLDER)):
+def get_crawl_unit(book_name, chapter_choice, start_verse_choice, end_verse_choice):
+    """
+    Returns the crawl manifest key of a verse range, e.g. 'Genesis/6:1-8'.
+    """
+    return f"{book_name}/{int(chapter_choice)}:{int(start_verse_choice)}-{int(end_verse_choice)}"
+
+
+def perform_tanakh_scraping(tanakh_division_name, book_name, chapter_choice, start_verse_choice, end_verse_choice, file_path=load_tanakh_path(HEB_DOCX_FOLDER), driver=None, crawl_name=None):
+    """
+    Scrapes a verse range of one chapter and saves it to a Word document.
+
+    Pass an open driver to reuse one browser across chapters (it is left open);
+    otherwise a browser is launched and quit for this chapter.
+
+    The scraped verses are kept in the page cache, so a cached verse range is saved
+    without opening a browser. With a crawl_name, the outcome is recorded in that
+    crawl manifest.
+
+    Returns True if the chapter was scraped and saved, False otherwise.
+    """
     DEBUG = True  # Toggle for debug print statements
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-    driver.get(SCRAPER_URL)
+
+    crawl_unit = get_crawl_unit(book_name, chapter_choice, start_verse_choice, end_verse_choice)
+
+    verse_texts = get_cached_verse_texts(book_name, chapter_choice, start_verse_choice, end_verse_choice)
+    if verse_texts is not None:
+        if DEBUG:
+            print(f"Loaded {book_name} {chapter_choice}:{start_verse_choice}-{end_verse_choice} from the page cache")
+        save_path = create_hebrew_word_document(book_name, chapter_choice, start_verse_choice, end_verse_choice, verse_texts, file_path=file_path)
+        if crawl_name:
+            crawl_manifest.record_unit(crawl_name, crawl_unit, crawl_manifest.STATUS_DONE,
+                                       content_hash=get_verse_texts_hash(verse_texts), output=save_path)
+        return True
+
+    owns_driver = driver is None
+    if owns_driver:
+        driver = driver_resolver.new_chrome_driver()
 
     try:
+        driver.get(SCRAPER_URL)
+
         # Map user-friendly names to scraper-specific names
         if tanakh_division_name == TORAH_BOOKS:
             tanakh_division_name = TORAH_SECTION
@@ -301,35 +373,51 @@ def perform_tanakh_scraping(tanakh_division_name, book_name, chapter_choice, sta
         else:
             if DEBUG:
                 print(f"Invalid choice: {tanakh_division_name}, line: {inspect.currentframe().f_lineno}: Exiting...")
-            return
-
-        # Perform the scraping steps
-        select_option(driver, "Section", tanakh_division_name)
-        select_option(driver, "Book", book_name)
-        choose_chapter_with_driver(driver, chapter_choice)
-        click_go_button(driver)
-        click_close_button(driver)
+            return False
+
+        # Perform the scraping steps, retrying each one with backoff
+        host = retry_policy.get_host(SCRAPER_URL)
+        retry_policy.call_with_retry(select_tanakh_options, driver, tanakh_division_name, book_name, chapter_choice,
+                                     step="select_tanakh_options", host=host)
+        retry_policy.call_with_retry(click_go_button, driver, step="click_go_button", host=host)
+        click_close_button(driver, WAIT_TIMEOUT if owns_driver else REUSED_POPUP_TIMEOUT)
         click_hebrew_toggle(driver)
 
         if DEBUG:
             print("Current website:", driver.current_url)
 
-        # Fetch verse texts
-        verse_texts = get_verse_texts(driver, int(start_verse_choice), int(end_verse_choice))
+        # Wait for the first verse to be rendered, then fetch verse texts
+        WebDriverWait(driver, WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, f"td.hebrew a[id='v{int(start_verse_choice)}'] + span.co_VerseText"))
+        )
+        verse_texts = retry_policy.call_with_retry(get_verse_texts, driver, int(start_verse_choice), int(end_verse_choice),
+                                                   step="get_verse_texts", host=host)
+        store_verse_texts(book_name, chapter_choice, start_verse_choice, end_verse_choice, verse_texts)
 
         # Pass variables dynamically to create the Word document
-        create_hebrew_word_document(book_name, chapter_choice, start_verse_choice, end_verse_choice, verse_texts, file_path=file_path)
+        save_path = create_hebrew_word_document(book_name, chapter_choice, start_verse_choice, end_verse_choice, verse_texts, file_path=file_path)
+        if crawl_name:
+            crawl_manifest.record_unit(crawl_name, crawl_unit, crawl_manifest.STATUS_DONE,
+                                       content_hash=get_verse_texts_hash(verse_texts), output=save_path)
+        return True
 
     except Exception as e:
         if DEBUG:
             print(f"An error occurred during scraping: {e}")
+        if crawl_name:
+            crawl_manifest.record_unit(crawl_name, crawl_unit, crawl_manifest.STATUS_FAILED,
+                                       error=e.to_dict() if isinstance(e, retry_policy.FetchError) else e)
+        return False
     finally:
-        driver.quit()
+        if owns_driver:
+            driver.quit()
 
 
 def create_hebrew_word_document(book_name, chapter_choice, start_verse_choice, end_verse_choice, verse_texts, file_path=load_tanakh_path(HEB_DOCX_FOLDER)):
     """
     Create a Word document with Hebrew-friendly formatting.
+
+    Returns the path of the saved document.
     """
     # Toggle to include or exclude verse IDs
     include_verse_id = True
@@ -380,6 +468,10 @@ def create_hebrew_word_document(book_name, chapter_choice, start_verse_choice, e
         f"{book_name}_CH_{chapter_choice}_Verses_{start_verse_choice}_to_{end_verse_choice}.docx"
     )
 
+    # Do post processing on the document in memory, then save it once
+    remove_colons_from_doc(document)
+    add_colons_to_doc(document)
+
     # Delete the file if it exists
     if os.path.exists(save_path):
         print(f"File exists, deleting: {save_path}")
@@ -388,18 +480,19 @@ def create_hebrew_word_document(book_name, chapter_choice, start_verse_choice, e
     # Save the new document
     document.save(save_path)
     print(f"Saved Hebrew-friendly Word document: {save_path}")
-
-    # Do post processing
-    docx_remove_colons(save_path, save_path)
-    docx_add_colons(save_path, save_path)
+    return save_path
 
 def docx_remove_colons(input_path, output_path):
 
-    # Removes all colons (:) from a Word document while preserving the formatting.
-
-    # Load the document
+    # Removes all colons (:) from a Word document file while preserving the formatting.
     doc = Document(input_path)
-    
+    remove_colons_from_doc(doc)
+    doc.save(output_path)
+
+def remove_colons_from_doc(doc):
+
+    # Removes all colons (:) from an open Word document while preserving the formatting.
+
     # Remove all the ":" from the document
     for paragraph in doc.paragraphs:
         for run in paragraph.runs:
@@ -412,16 +505,17 @@ def docx_remove_colons(input_path, output_path):
                 for paragraph in cell.paragraphs:
                     for run in paragraph.runs:
                         run.text = run.text.replace(":", "")  # Replace ":" in table cells
-    
-    # Save the modified document
-    doc.save(output_path)
 
 def docx_add_colons(input_path, output_path):
-    
-    # Adds a colon at the end of each Hebrew sentence in a Word document, ensuring proper placement for right-to-left text.
 
-    # Load the document
+    # Adds a colon at the end of each Hebrew sentence in a Word document file.
     doc = Document(input_path)
+    add_colons_to_doc(doc)
+    doc.save(output_path)
+
+def add_colons_to_doc(doc):
+    
+    # Adds a colon at the end of each Hebrew sentence in an open Word document, ensuring proper placement for right-to-left text.
 
     # Process paragraphs
     for paragraph in doc.paragraphs:
@@ -440,9 +534,6 @@ def docx_add_colons(input_path, output_path):
             run.text = text
             run.font.name = "David"  # Example Hebrew font
             run._element.rPr.rFonts.set(qn("w:eastAsia"), "David")
-    
-    # Save the modified document
-    doc.save(output_path)
 
 ##################################################################################
 # Generic function to select an option from a dropdown
@@ -454,6 +545,7 @@ def select_option(driver, dropdown_name, option_text):
         print(f"Option '{option_text}' selected from dropdown '{dropdown_name}'.")
     except Exception as e:
         print(f"Error selecting option '{option_text}' from dropdown '{dropdown_name}': {e}")
+        raise
 
 ##################################################################################
 # Function to click a specific link
@@ -475,7 +567,7 @@ def choose_chapter_with_driver(driver, chapter_choice):
     print(f"Looking for: {chapter_name}")  # Debug
     
     # Wait for the dropdown to be available
-    dropdown = WebDriverWait(driver, 10).until(
+    dropdown = WebDriverWait(driver, WAIT_TIMEOUT).until(
         EC.presence_of_element_located((By.ID, "autoListChapter"))
     )
     
@@ -489,7 +581,16 @@ def choose_chapter_with_driver(driver, chapter_choice):
             select.select_by_visible_text(option.text)
             return None
     
-    return None  # Return None if the chapter is not found
+    raise ValueError(f"{chapter_name} not found in the chapter list")
+
+
+##################################################################################
+# Select the section, book and chapter in one retryable step
+##################################################################################
+def select_tanakh_options(driver, tanakh_division_name, book_name, chapter_choice):
+    select_option(driver, "Section", tanakh_division_name)
+    select_option(driver, "Book", book_name)
+    choose_chapter_with_driver(driver, chapter_choice)
 
 ##################################################################################
 # Click the go button
@@ -497,7 +598,7 @@ def choose_chapter_with_driver(driver, chapter_choice):
 def click_go_button(driver):
     try:
         # Wait for the "Go" button to be present
-        go_button = WebDriverWait(driver, 10).until(
+        go_button = WebDriverWait(driver, WAIT_TIMEOUT).until(
             EC.presence_of_element_located((By.XPATH, "//span[text()='Go']"))
         )
         # Click the button
@@ -505,11 +606,12 @@ def click_go_button(driver):
         print("Clicked the 'Go' button successfully.")
     except Exception as e:
         print(f"Failed to click the 'Go' button: {e}")
+        raise
 
-def click_close_button(driver):
+def click_close_button(driver, timeout=WAIT_TIMEOUT):
     try:
         # Wait for the close button to be clickable
-        close_button = WebDriverWait(driver, 10).until(
+        close_button = WebDriverWait(driver, timeout).until(
             EC.element_to_be_clickable((By.CLASS_NAME, "subscribe-popup-clmc__close-button"))
         )
         # Click the close button
@@ -521,10 +623,15 @@ def click_close_button(driver):
 def click_hebrew_toggle(driver):
     try:
         # Wait for the "Hebrew" input element to be present
-        hebrew_input = WebDriverWait(driver, 10).until(
+        hebrew_input = WebDriverWait(driver, WAIT_TIMEOUT).until(
             EC.presence_of_element_located((By.ID, "ToggleButtonsContainer_Hebrew"))
         )
         
+        # A reused browser may remember the choice from the previous chapter
+        if hebrew_input.is_selected():
+            print("The 'Hebrew' button is already toggled on.")
+            return True
+
         # Use JavaScript to click the element
         driver.execute_script("arguments[0].click();", hebrew_input)
         print("Successfully toggled the 'Hebrew' button.")
@@ -534,6 +641,49 @@ def click_hebrew_toggle(driver):
         return False
 
 
+def get_verse_cache_params(book_name, chapter_choice, start_verse_choice, end_verse_choice):
+    """
+    Returns the page cache parameters of a scraped verse range.
+    """
+    return {
+        "source": "chabad",
+        "book": book_name,
+        "chapter": int(chapter_choice),
+        "start_verse": int(start_verse_choice),
+        "end_verse": int(end_verse_choice),
+    }
+
+
+def get_cached_verse_texts(book_name, chapter_choice, start_verse_choice, end_verse_choice):
+    """
+    Returns the cached verse texts of a verse range (see get_verse_texts()), or None.
+
+    The Hebrew text is only rendered after the page's language toggle, so the cache
+    holds the extracted verses as JSON rather than the raw page.
+    """
+    cached = page_cache.get_cached_page(**get_verse_cache_params(book_name, chapter_choice, start_verse_choice, end_verse_choice))
+    return json.loads(cached) if cached is not None else None
+
+
+def store_verse_texts(book_name, chapter_choice, start_verse_choice, end_verse_choice, verse_texts):
+    """
+    Caches the verse texts of a verse range, but only if every verse was fetched.
+    """
+    expected_count = int(end_verse_choice) - int(start_verse_choice) + 1
+    if len(verse_texts) == expected_count and all(verse_texts.values()):
+        page_cache.store_page(
+            json.dumps(verse_texts, ensure_ascii=False),
+            **get_verse_cache_params(book_name, chapter_choice, start_verse_choice, end_verse_choice)
+        )
+
+
+def get_verse_texts_hash(verse_texts):
+    """
+    Returns the content hash of a scraped verse range ({verse id: text}) for its crawl
+    manifest entry.
+    """
+    return file_utils.get_content_hash(verse_texts)
+
 def get_verse_texts(driver, N1, N):
     """
     Fetches the text of verses from N1 to N.
@@ -545,6 +695,9 @@ def get_verse_texts(driver, N1, N):
 
     Returns:
         dict: A dictionary where keys are verse IDs (e.g., 'v1') and values are the verse texts.
+
+    Raises:
+        Exception: If a verse is missing, rather than returning a partial chapter.
     """
     verses = {}
 
@@ -557,6 +710,7 @@ def get_verse_texts(driver, N1, N):
             verses[verse_id] = verse_element.text
     except Exception as e:
         print(f"Error occurred while fetching verses: {e}")
+        raise
 
     return verses
 
@@ -635,12 +789,13 @@ def get_tanakh_range_from_input_main():
         end_verse_choice=end_verse_choice
     )
 
-def get_tanakh_range_from_json_main(parasha_name, file_path="data/torah_parashot.json"):
+def get_tanakh_range_from_json_main(parasha_name, file_path="data/torah_parashot.json", crawl_name=None):
     """
     Gets the Tanakh range based on the specified parasha name from torah_parashot.json.
 
     :param parasha_name: Name of the Torah portion (e.g., "Bereshit", "Noach").
     :param file_path: Path to the torah_parashot.json file.
+    :param crawl_name: Crawl manifest to record and resume the chapters in (see traverse_tanakh_scraper).
     """
     try:
         # Load the parasha data from the JSON file
@@ -682,7 +837,8 @@ def get_tanakh_range_from_json_main(parasha_name, file_path="data/torah_parashot
             end_chapter_choice=end_chapter,
             start_verse_choice=start_verse,
             end_verse_choice=end_verse,
-            file_path=folder_path
+            file_path=folder_path,
+            crawl_name=crawl_name
         )
     
     except FileNotFoundError:
@@ -692,13 +848,22 @@ def get_tanakh_range_from_json_main(parasha_name, file_path="data/torah_parashot
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
-def process_all_parashot_main(file_path="data/torah_parashot.json"):
+def process_all_parashot_main(file_path="data/torah_parashot.json", pause_between_parashot=0, resume=True):
     """
     Processes all the parashot in the torah_parashot.json file by passing their names to
     the get_tanakh_range_from_json_main function.
 
+    Each chapter waits for its own page elements, so no fixed delay is needed between
+    parashot; pause_between_parashot adds one if the site needs to be given a break.
+
     :param file_path: Path to the torah_parashot.json file.
+    :param pause_between_parashot: Seconds to pause before each parasha. Defaults to 0.
+    :param resume: Skip the chapters a previous run completed, as recorded in the
+                   HEB_PARASHOT_CRAWL manifest after each chapter. Pass False to start over.
     """
+    if not resume:
+        crawl_manifest.reset_crawl(HEB_PARASHOT_CRAWL)
+
     try:
         # Load the parasha data from the JSON file
         with open(file_path, 'r', encoding='utf-8') as file:
@@ -709,8 +874,9 @@ def process_all_parashot_main(file_path="data/torah_parashot.json"):
             parasha_name = parasha.get("Name")
             if parasha_name:
                 print(f"Processing parasha: {parasha_name}")
-                time.sleep(20)
-                get_tanakh_range_from_json_main(parasha_name, file_path)
+                if pause_between_parashot:
+                    time.sleep(pause_between_parashot)
+                get_tanakh_range_from_json_main(parasha_name, file_path, crawl_name=HEB_PARASHOT_CRAWL)
             else:
                 print("Skipping a parasha with missing 'Name' field.")
     
@@ -721,6 +887,10 @@ def process_all_parashot_main(file_path="data/torah_parashot.json"):
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
+    failed_units = crawl_manifest.get_failed_units(HEB_PARASHOT_CRAWL)
+    if failed_units:
+        print(f"Chapters left incomplete (rerun to resume): {', '.join(failed_units)}")
+
 def rename_folders_by_timestamp_main(directory_path):
     try:
         # Get all folders in the directory
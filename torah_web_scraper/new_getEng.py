@@ -2,18 +2,18 @@
 import utils
 
 import os
+import sys
 import json
 import time
 import shutil
 import subprocess
+from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
 
 from docx import Document
 from docx.shared import Pt
@@ -22,6 +22,12 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
+# The on-disk page cache lives in the project's web_navigator folder
+sys.path.append(str(Path(__file__).resolve().parent.parent / "web_navigator"))
+import page_cache
+import html_backend
+import driver_resolver
+
 def reformat_eng_docx(file_path):
     """
     Reformat the DOCX file so that each 'Verse' paragraph is on its own line,
@@ -83,7 +89,9 @@ def select_option(driver, dropdown_name, option_text):
 
 def click_submit_button(driver):
     try:
-        submit_button = driver.find_element(By.XPATH, "//input[@type='submit' and @value='GO']")
+        submit_button = WebDriverWait(driver, utils.WAIT_TIMEOUT).until(
+            EC.element_to_be_clickable((By.XPATH, "//input[@type='submit' and @value='GO']"))
+        )
         submit_button.click()
         print("Submit button clicked.")
     except Exception as e:
@@ -102,31 +110,39 @@ def get_current_url(driver):
 
 def grab_verses(driver):
     try:
-        WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.TAG_NAME, "b")))
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, "html.parser")
-        verses = soup.find_all('b')
+        WebDriverWait(driver, utils.WAIT_TIMEOUT).until(EC.presence_of_all_elements_located((By.TAG_NAME, "b")))
+        return grab_verses_from_html(driver.page_source)
 
-        verse_texts = []
+    except Exception as e:
+        print(f"An error occurred while grabbing verses: {e}")
+        return []
 
-        for verse in verses:
-            verse_number = verse.get_text(strip=True)
-            verse_text = ""
-            if verse.next_sibling:
-                verse_text = verse.next_sibling.strip()
-            else:
-                next_p = verse.find_next('p')
-                if next_p:
-                    verse_text = next_p.get_text(strip=True)
 
-            if verse_number and verse_text:
-                verse_texts.append((verse_number, verse_text))
+def grab_verses_from_html(page_source, parser=None):
+    """
+    Extracts the (verse number, verse text) pairs of a chapter page; used for live
+    pages and for pages served from the page cache alike. The page is parsed with
+    html_backend's parser (lxml when installed) unless another one is given.
+    """
+    soup = html_backend.make_soup(page_source, parser)
+    verses = soup.find_all('b')
 
-        return verse_texts
+    verse_texts = []
 
-    except Exception as e:
-        print(f"An error occurred while grabbing verses: {e}")
-        return []
+    for verse in verses:
+        verse_number = verse.get_text(strip=True)
+        verse_text = ""
+        if verse.next_sibling:
+            verse_text = verse.next_sibling.strip()
+        else:
+            next_p = verse.find_next('p')
+            if next_p:
+                verse_text = next_p.get_text(strip=True)
+
+        if verse_number and verse_text:
+            verse_texts.append((verse_number, verse_text))
+
+    return verse_texts
 
 
 def save_to_word(verses, filename, book_name, chapter_number, file_path="."):
@@ -155,41 +171,64 @@ def save_to_word(verses, filename, book_name, chapter_number, file_path="."):
 
 
 def get_Tanakh_and_verses(chapter_number, book_name, parasha_name):
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    # Serve the chapter page from the page cache when possible; no browser is needed then
+    cache_params = {"source": "mnemotrix", "book": book_name, "chapter": int(chapter_number)}
+    page_source = page_cache.get_cached_page(**cache_params)
+    if page_source is not None:
+        print(f"Loaded {book_name} ch: {chapter_number} from the page cache")
+        verses = grab_verses_from_html(page_source)
+    else:
+        verses = scrape_Tanakh_verses(chapter_number, book_name, cache_params)
+
+    filename = f"{book_name}_{chapter_number}.docx"
+    folder_path = utils.load_tanakh_path(utils.ENG_DOCX_FOLDER)
+    folder_path = os.path.join(folder_path, parasha_name)
+    save_to_word(verses, filename, book_name, chapter_number, file_path=folder_path)
+
+    # Now format the document
+    folder_path = os.path.join(folder_path, filename)
+    # TODO FIX BUG .docx twice
+    folder_path = folder_path + ".docx"
+    reformat_eng_docx(folder_path)
+
+
+def scrape_Tanakh_verses(chapter_number, book_name, cache_params):
+    """
+    Navigates the chumash search form to a chapter and grabs its verses. The chapter
+    page is stored in the page cache under cache_params if any verse was found.
+    """
+    driver = driver_resolver.new_chrome_driver()
     driver.get("http://www.mnemotrix.com/texis/vtx/chumash")
 
     try:
         select_option(driver, "bookq", book_name)
         select_option(driver, "chapterq", f"Chapter {chapter_number}")
-        time.sleep(3)
         click_submit_button(driver)
-        time.sleep(2)
 
+        # Wait for the results list, then for the chapter page the link opens
         partial_text = get_partial_text(book_name)
-        links = driver.find_elements(By.PARTIAL_LINK_TEXT, partial_text)
+        try:
+            links = WebDriverWait(driver, utils.WAIT_TIMEOUT).until(
+                EC.presence_of_all_elements_located((By.PARTIAL_LINK_TEXT, partial_text))
+            )
+        except TimeoutException:
+            links = []
         if links:
+            results_url = driver.current_url
             links[0].click()
+            WebDriverWait(driver, utils.WAIT_TIMEOUT).until(EC.url_changes(results_url))
         else:
             print(f"----> No matching link found for {book_name} ch: {chapter_number}")
-        time.sleep(2)
 
         final_url = get_current_url(driver)
         driver.get(final_url)
         verses = grab_verses(driver)
 
-        filename = f"{book_name}_{chapter_number}.docx"
-        folder_path = utils.load_tanakh_path(utils.ENG_DOCX_FOLDER)
-        folder_path = os.path.join(folder_path, parasha_name)
-        save_to_word(verses, filename, book_name, chapter_number, file_path=folder_path)
-
-        # Now format the document
-        folder_path = os.path.join(folder_path, filename)
-        # TODO FIX BUG .docx twice
-        folder_path = folder_path + ".docx"
-        reformat_eng_docx(folder_path)
+        if verses:
+            page_cache.store_page(driver.page_source, **cache_params)
+        return verses
 
     finally:
-        time.sleep(3)
         driver.quit()
 
 
@@ -223,7 +262,7 @@ def process_specific_parasha(parasha_name, file_path="data/torah_parashot_eng.js
 def getChFromLink(parasha_link, book_name, chapter_choice):
 
     #Step 1 get driver
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = driver_resolver.new_chrome_driver()
     driver.get(parasha_link)  # Replace with your desired URL
     # Step 2 grab verses
     verses = grab_verses(driver)
@@ -250,17 +289,15 @@ def main_open_website_with_chrome(website_url):
         print(f"An error occurred: {e}")
 
 def get_Tanakh_from_link(hardcoded_url, book_name, chapter_number, parasha_name):
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = driver_resolver.new_chrome_driver()
     
     try:
         # Go directly to the hardcoded Tanakh chapter page
         driver.get(hardcoded_url)
-        time.sleep(2)
 
         # Optional: grab the actual final redirected URL if needed
         final_url = driver.current_url
         driver.get(final_url)
-        time.sleep(2)
 
         # Grab verses (assuming this function is defined elsewhere)
         verses = grab_verses(driver)
@@ -278,7 +315,6 @@ def get_Tanakh_from_link(hardcoded_url, book_name, chapter_number, parasha_name)
         reformat_eng_docx(docx_path)
 
     finally:
-        time.sleep(3)
         driver.quit()
 
 ##################################################################################
@@ -57,6 +57,25 @@ def weave_torah_files(parasha_name, hebrew_file_path, english_file_path, output_
     hebrew_doc = Document(hebrew_file_path)
     english_doc = Document(english_file_path)
 
+    output_doc = weave_torah_docs(hebrew_doc, english_doc)
+    final_path_result = get_woven_docx_path(parasha_name, hebrew_doc, output_file_path)
+    save_docx(output_doc, final_path_result)
+    print(f"Combined document saved as: {final_path_result}")
+    
+    return final_path_result
+
+def weave_torah_docs(hebrew_doc, english_doc):
+    """
+    Combine open Hebrew and English Word documents into a new document, alternating
+    Hebrew and English paragraphs. Nothing is read from or written to disk.
+
+    Args:
+        hebrew_doc (Document): The Hebrew document.
+        english_doc (Document): The English document.
+
+    Returns:
+        Document: The combined document.
+    """
     # Prepare the output Word document
     output_doc = Document()
 
@@ -111,6 +130,13 @@ def weave_torah_files(parasha_name, hebrew_file_path, english_file_path, output_
 
             english_index += 1
 
+    return output_doc
+
+def get_woven_docx_path(parasha_name, hebrew_doc, output_file_path):
+    """
+    Returns the path of the combined document, named after the parasha and the first
+    line of the Hebrew document. Creates the output folder if needed.
+    """
     # Check if Hebrew paragraphs exist and prepare the first line for the file name
     if hebrew_doc.paragraphs:
         first_line_hebrew = hebrew_doc.paragraphs[0].text.strip()
@@ -124,18 +150,18 @@ def weave_torah_files(parasha_name, hebrew_file_path, english_file_path, output_
     # Define the output file path using the cleaned Hebrew text
     docx_name = f"{parasha_name}_{safe_first_line_hebrew}.docx"
     docx_name = clean_hebrew_filename(docx_name)
-    final_path_result = os.path.join(output_file_path, docx_name)
+    return os.path.join(output_file_path, docx_name)
 
+def save_docx(doc, file_path):
+    """
+    Saves a document, replacing any existing file at that path.
+    """
     # Remove the existing file if it already exists
-    if os.path.exists(final_path_result):
-        os.remove(final_path_result)
-        print(f"Existing file found and removed: {final_path_result}")
+    if os.path.exists(file_path):
+        os.remove(file_path)
+        print(f"Existing file found and removed: {file_path}")
 
-    # Save the combined document
-    output_doc.save(final_path_result)
-    print(f"Combined document saved as: {final_path_result}")
-    
-    return final_path_result
+    doc.save(file_path)
 
 def add_notes_to_verses(file_path):
     """
@@ -145,9 +171,21 @@ def add_notes_to_verses(file_path):
     Args:
         file_path (str): Path to the .docx file to process.
     """
-    # Load the document
-    doc = Document(file_path)
-    
+    new_doc = add_notes_to_doc(Document(file_path))
+    save_docx(new_doc, file_path)
+    print(f"Formatted document saved as: {file_path}")
+
+def add_notes_to_doc(doc):
+    """
+    Returns a copy of an open document with a notes paragraph after each verse,
+    preserving formatting. The output document has narrow margins.
+
+    Args:
+        doc (Document): The document to process.
+
+    Returns:
+        Document: The new document with notes.
+    """
     # Extract the header (assumes it's the first paragraph with the chapter name)
     header_text = None
     for para in doc.paragraphs:
@@ -197,15 +235,8 @@ def add_notes_to_verses(file_path):
                 # Optional: Style the notes text (customize if needed)
                 notes_run.italic = True
                 notes_run.font.color.rgb = RGBColor(211, 211, 211)  # Set the notes text to light grey
-    
-    # Delete the original file if it exists
-    if os.path.exists(file_path):
-        os.remove(file_path)
-        print(f"Existing file deleted: {file_path}")
-    
-    # Save the reformatted content back to the original file
-    new_doc.save(file_path)
-    print(f"Formatted document saved as: {file_path}")
+
+    return new_doc
 
 def clean_hebrew_filename(filename):
     """
@@ -243,9 +274,21 @@ def format_docx_file(file_path):
     Args:
         file_path (str): Path to the .docx file to process.
     """
-    # Load the document
-    doc = Document(file_path)
-    
+    new_doc = format_doc(Document(file_path))
+    save_docx(new_doc, file_path)
+    print(f"Formatted document saved as: {file_path}")
+
+def format_doc(doc):
+    """
+    Returns a copy of an open document with consistent fonts and sizes applied
+    (Hebrew or English depending on each run's content), preserving the content as-is.
+
+    Args:
+        doc (Document): The document to process.
+
+    Returns:
+        Document: The formatted document.
+    """
     # Create a new document to rewrite the content
     new_doc = Document()
 
@@ -284,14 +327,7 @@ def format_docx_file(file_path):
                 new_run.font.name = utils.DOCX_ENGLISH_FONT
                 new_run.font.size = Pt(utils.FONT_SIZE_ENG)
 
-    # Delete the original file if it exists
-    if os.path.exists(file_path):
-        os.remove(file_path)
-        print(f"Existing file deleted: {file_path}")
-    
-    # Save the reformatted content back to the original file
-    new_doc.save(file_path)
-    print(f"Formatted document saved as: {file_path}")
+    return new_doc
 
 def get_user_input():
     """Ask the user whether to add notes to verses."""
@@ -337,20 +373,75 @@ def weave_and_save_files(parasha_name_heb, heb_file, english_file, output_folder
 
 def process_document(final_output, add_notes):
     """Process the document by adding notes (if needed), removing colons, and formatting."""
-    if add_notes == 'yes':
-        add_notes_to_verses(final_output)
-        print("\nNotes have been added to the verses.")
+    doc = run_docx_pipeline(Document(final_output), get_process_stages(add_notes))
+    save_docx(doc, final_output)
+    print(f"\nDocument saved and formatted: {final_output}")
 
-    doc = Document(final_output)
-    
-    # Remove second Hebrew verse number colon
+def remove_second_colons(doc):
+    """Remove the second Hebrew verse number colon from every paragraph."""
     for para in doc.paragraphs:
         para_text = para.text.strip()
         remove_second_colon(para_text, para)
 
-    doc.save(final_output)
-    format_docx_file(final_output)
-    print(f"\nDocument saved and formatted: {final_output}")
+def format_eng_paragraphs(doc):
+    """Replace "::" with ":" in every paragraph."""
+    for para in doc.paragraphs:
+        format_eng_paragraph(para)
+
+def get_process_stages(add_notes):
+    """Stages of process_document: notes (if needed), colon removal and formatting."""
+    stages = [add_notes_to_doc] if add_notes == 'yes' else []
+    return stages + [remove_second_colons, format_doc]
+
+def get_parasha_chapter_stages(parasha_name_heb, add_notes):
+    """
+    Every stage applied to a woven parasha chapter, in order: the process_document
+    stages, then the second line update and the Hebrew and English formatting.
+    """
+    return get_process_stages(add_notes) + [
+        lambda doc: update_second_line(doc, parasha_name_heb),
+        format_hebrew_paragraph,
+        format_eng_paragraphs,
+    ]
+
+def run_docx_pipeline(doc, stages):
+    """
+    Run a document through a list of stages in memory.
+
+    Each stage takes the current document and either edits it in place (returning None)
+    or returns a new document that replaces it for the following stages.
+
+    Args:
+        doc (Document): The document to transform.
+        stages (list[callable]): The stages, in order.
+
+    Returns:
+        Document: The transformed document.
+    """
+    for stage in stages:
+        result = stage(doc)
+        if result is not None:
+            doc = result
+    return doc
+
+def process_parasha_chapter(parasha_name_heb, heb_file, english_file, output_folder_path, add_notes):
+    """
+    Weave, annotate and format one parasha chapter entirely in memory: the Hebrew and
+    English documents are each read once and the result is written exactly once.
+
+    Returns:
+        str: Path of the saved document.
+    """
+    hebrew_doc = Document(heb_file)
+    english_doc = Document(english_file)
+
+    doc = run_docx_pipeline(weave_torah_docs(hebrew_doc, english_doc),
+                            get_parasha_chapter_stages(parasha_name_heb, add_notes))
+
+    final_output = get_woven_docx_path(parasha_name_heb, hebrew_doc, output_folder_path)
+    save_docx(doc, final_output)
+    print(f"\nFinal document saved and formatted:\t {final_output}")
+    return final_output
 
 def contains_hebrew(text):
     """
@@ -529,28 +620,11 @@ if __name__ == "__main__":
             english_file = get_file_paths(parasha_name, book_name, chapter, is_hebrew=False)
             heb_file = get_file_paths(parasha_name_heb, book_name_heb, chapter, num_parasha, is_hebrew=True)
 
-            # Weave and save document
-            final_output = weave_and_save_files(parasha_name_heb, heb_file, english_file, utils.load_tanakh_path(utils.OUTPUT_DOCX_FOLDER))
-
-            # Process final document
-            process_document(final_output, add_notes)
-
-            doc = Document(final_output)
-
-            # Setp 2: Update the line after the header
-            update_second_line(doc,parasha_name_heb)
-
-            # Step 3: Format the Hebrew text in Word
-            #    - Align the Heb text to the right (RTL).
-            #    - Move the verse number to the beginning of the paragraph.
-            #    - Apply specific fonts and font sizes.
-            format_hebrew_paragraph(doc)
-
-            # Step 4: Format the Eng text in Word
-            #    - replace "::" with ":" in the Engs
-            for para in doc.paragraphs:
-                format_eng_paragraph(para)
-
-            # Step 5: Save the updated document
-            doc.save(final_output)
-            print("File has been updated and saved.")
+            # Weave, add notes (if needed) and format the chapter in memory, then save it once:
+            #    - Remove the second Hebrew verse number colon and apply consistent fonts.
+            #    - Update the line after the header.
+            #    - Align the Heb text to the right (RTL), move the verse number to the
+            #      beginning of the paragraph and apply specific fonts and font sizes.
+            #    - Replace "::" with ":" in the Engs.
+            process_parasha_chapter(parasha_name_heb, heb_file, english_file,
+                                    utils.load_tanakh_path(utils.OUTPUT_DOCX_FOLDER), add_notes)
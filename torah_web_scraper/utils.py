@@ -3,12 +3,12 @@ import json
 import time
 import shutil
 import subprocess
+import sys
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 from docx import Document
 from docx.shared import Pt
@@ -17,6 +17,15 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
+# ChromeDriver resolution is shared with the project's web_navigator folder
+sys.path.append(str(Path(__file__).resolve().parent.parent / "web_navigator"))
+import driver_resolver
+
+# Scraper settings shared with the rest of the project (the root utils module has the same
+# name as this one, so they live in its stdlib-only scraper_settings module)
+sys.path.append(str(Path(__file__).resolve().parent.parent / "utils"))
+import scraper_settings
+
 # Eng Constants
 PARASHOT_NOW = "now_parasha.json"
 TANAKH_OUTLINE_ENG = "tanakhOutlineEng.json"
@@ -34,6 +43,7 @@ DOCX_HEBREW_FONT = "Frank Ruehl" # Use Frank Ruehl for Hebrew text on Word
 FONT_SIZE = 18  # Font size in points
 MARGIN_SIZE = Pt(18)  # Margin size in points
 VERSE_ID_FONT_SIZE = 12  # Smaller font size for the verse ID
+WAIT_TIMEOUT = scraper_settings.WEB_WAIT_TIMEOUT  # Ceiling, in seconds, on waits for page elements
 
 # Heb Constants
 TANAKH_DOCX_FOLDER = "tanakh_docs"
@@ -192,9 +202,8 @@ def init_webdriver():
 
     :return: Configured WebDriver instance.
     """
-    service = Service(ChromeDriverManager().install())
     options = webdriver.ChromeOptions()
-    return webdriver.Chrome(service=service, options=options)
+    return driver_resolver.new_chrome_driver(options)
 
 def get_tanakh_scraper_inputs(get_end_chapter=False):
     """
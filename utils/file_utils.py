@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+# Crash-safe file writing and content hashing shared by the engines, the crawl manifests
+# and the scrapers. Standard library only, so any folder (including torah_web_scraper,
+# whose own utils module shadows the project's) can import it without pulling in
+# openpyxl or selenium.
+
+# Mode of newly created files under the process umask (mkstemp's own files are 0600),
+# worked out on first use by get_default_file_mode()
+DEFAULT_FILE_MODE = None
+DEFAULT_FILE_MODE_LOCK = threading.Lock()
+
+def get_umask():
+    """
+    Returns the process umask without changing it (os.umask() can only read it by
+    setting it, which would affect files created meanwhile by other threads). On Linux
+    it is read from /proc; elsewhere it is derived from the mode of a probe file
+    created with 0o666.
+
+    :return: int - The umask
+    """
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+
+    probe_dir = tempfile.mkdtemp()
+    probe_path = os.path.join(probe_dir, "probe")
+    try:
+        os.close(os.open(probe_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+        return 0o666 & ~os.stat(probe_path).st_mode & 0o777
+    finally:
+        if os.path.exists(probe_path):
+            os.remove(probe_path)
+        os.rmdir(probe_dir)
+
+def get_default_file_mode():
+    """
+    Returns the mode a new file gets under the process umask (0o666 & ~umask),
+    reading the umask only once per process.
+
+    :return: int - The file mode
+    """
+    global DEFAULT_FILE_MODE
+    with DEFAULT_FILE_MODE_LOCK:
+        if DEFAULT_FILE_MODE is None:
+            DEFAULT_FILE_MODE = 0o666 & ~get_umask()
+        return DEFAULT_FILE_MODE
+
+def replace_file_atomic(file_path, write_func, suffix=".tmp"):
+    """
+    Writes a file through a temporary file in the same directory, then atomically
+    renames it over the target, so a crash never leaves a half-written file behind.
+    The file keeps the permissions of the file it replaces (or the usual umask default
+    for a new file) instead of the temporary file's 0600.
+
+    :param file_path: str or Path - Final path of the file
+    :param write_func: callable - Called with the temporary path; must write the full content to it
+    :param suffix: str - Suffix of the temporary file
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=suffix, dir=directory)
+    os.close(fd)
+
+    try:
+        write_func(tmp_path)
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, tmp_path)
+        else:
+            os.chmod(tmp_path, get_default_file_mode())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_text_atomic(file_path, text):
+    """
+    Writes a UTF-8 text file crash-safely (see replace_file_atomic()).
+
+    :param file_path: str or Path - Path of the file
+    :param text: str - The full content
+    """
+    def write_text(tmp_path):
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    replace_file_atomic(file_path, write_text)
+
+def write_json_atomic(file_path, data):
+    """
+    Writes a JSON file crash-safely (see replace_file_atomic()).
+
+    :param file_path: str or Path - Path of the file
+    :param data: JSON-serializable content
+    """
+    write_text_atomic(file_path, json.dumps(data, indent=2, ensure_ascii=False))
+
+def get_content_hash(content):
+    """
+    Returns a SHA-256 fingerprint of JSON-serializable content (e.g. a sheet's rows or
+    a scraped verse range).
+
+    :param content: JSON-serializable content; values it cannot encode are hashed as str()
+    :return: str - Hex digest identifying the content
+    """
+    payload = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -65,4 +65,94 @@ def get_parasha(book, chapter, verse, json_path=None):
            (chapter < end_ch or (chapter == end_ch and verse <= end_vs)):
             return parasha.get("standard")
 
-    return None
\ No newline at end of file
+    return None
+
+def find_parasha(parasha_name, json_path=None):
+    """
+    Returns the ParashotData.json entry for a parasha, matched case-insensitively
+    against its standard name and its spelling variations.
+
+    :param parasha_name: str - The parasha name (e.g., "Noach", "Noah" or "נח")
+    :param json_path: Optional path to the ParashotData.json file
+    :return: dict or None - The parasha entry, or None if not found
+    """
+    if json_path is None:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        json_path = os.path.join(current_dir, '..', 'data', 'ParashotData.json')
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    wanted = parasha_name.strip().lower()
+    for parasha in data.get("ParashaNames", []):
+        names = [parasha.get("standard", "")] + parasha.get("variations", [])
+        if wanted in (name.lower() for name in names):
+            return parasha
+
+    return None
+
+def parse_verse_range(range_str):
+    """
+    Parses a verse range such as "Genesis 1:1–2:3" (en dash or hyphen).
+
+    :param range_str: str - The verse range
+    :return: tuple - (book, (start_chapter, start_verse), (end_chapter, end_verse))
+    :raises ValueError: If the string is not a valid range
+    """
+    try:
+        book, span = range_str.strip().rsplit(" ", 1)
+        start, end = span.replace("–", "-").split("-")
+        start_ch, start_vs = (int(n) for n in start.split(":"))
+        end_ch, end_vs = (int(n) for n in end.split(":"))
+    except ValueError:
+        raise ValueError(f"Invalid verse range: '{range_str}'")
+
+    return book, (start_ch, start_vs), (end_ch, end_vs)
+
+def load_aliyot_data(json_path=None):
+    """
+    Loads the aliyot and maftir ranges of the parshiyot.
+
+    :param json_path: Optional path to the aliyot_maftir_all_parshiyot.json file
+    :return: dict - {"parshiyot": [{"name", "aliyot", "maftir"}, ...]}
+    """
+    if json_path is None:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        json_path = os.path.join(current_dir, '..', 'data', 'aliyot_maftir_all_parshiyot.json')
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def get_aliyot_parasha_names(json_path=None):
+    """
+    Returns the names of the parshiyot whose aliyot are listed, in file order.
+
+    :param json_path: Optional path to the aliyot_maftir_all_parshiyot.json file
+    :return: list[str]
+    """
+    return [parasha.get("name", "") for parasha in load_aliyot_data(json_path).get("parshiyot", [])]
+
+def get_aliyah_range(parasha_name, aliyah, json_path=None):
+    """
+    Returns the verse range of one aliyah (or the maftir) of a parasha.
+
+    :param parasha_name: str - The parasha name as listed in aliyot_maftir_all_parshiyot.json
+    :param aliyah: str or int - The aliyah number ("1" to "7") or "maftir"
+    :param json_path: Optional path to the aliyot_maftir_all_parshiyot.json file
+    :return: tuple or None - (book, (start_chapter, start_verse), (end_chapter, end_verse)),
+             or None if the parasha or aliyah is not listed
+    """
+    data = load_aliyot_data(json_path)
+
+    for parasha in data.get("parshiyot", []):
+        if parasha.get("name", "").lower() != parasha_name.strip().lower():
+            continue
+
+        if str(aliyah).lower() == "maftir":
+            range_str = parasha.get("maftir")
+        else:
+            range_str = parasha.get("aliyot", {}).get(str(aliyah))
+
+        return parse_verse_range(range_str) if range_str else None
+
+    return None
@@ -0,0 +1,6 @@
+# Scraper settings shared by every scraper folder, including torah_web_scraper, whose own
+# utils module shadows the project's. Kept free of imports so a scraper can read them
+# without loading utils.py (selenium, openpyxl); utils.py re-exports them.
+
+# Ceiling, in seconds, on any wait for a scraped page element (dropdown, GO button, verses)
+WEB_WAIT_TIMEOUT = 10
@@ -51,6 +51,7 @@ EXCEL_ENGINE_DIR = PROJECT_ROOT / "excel_engine"
 OUTPUT_DATA_DIR = DATA_DIR / "output_data"
 METSUDAH_XLSX_ENG_FILES = DATA_DIR / "xlsx_data" / "metsudah_torah_eng"
 OUT_ENG_TORAH_XLSX = OUTPUT_DATA_DIR / "eng_torah_xlsx"
+OUT_BILINGUAL_TORAH_XLSX = OUTPUT_DATA_DIR / "bilingual_torah_xlsx"
 
 # Masoretic Text -  https://tanach.us/Tanach.xml
 # The Unicode/XML Leningrad Codex (UXLC) is a transcription of the Leningrad Codex (LC) 
@@ -62,9 +63,40 @@ METSUDAH_DOCX_ENG_OUTPUT = DATA_DIR / "docx_output_data" / "metsudah_docx_eng_ou
 # Specific json files.
 H_VERSE_NUM_JSON = DATA_DIR / "heb_verse_nums.json"
 
+# Verse notes (annotation store, see notes_engine)
+NOTES_DB = DATA_DIR / "notes.sqlite"
+
 # Sites metsudah
 METSUDAH_ENG_SITE = "http://www.mnemotrix.com/texis/vtx/chumash"
 
+# Ceiling, in seconds, on any wait for a scraped page element (dropdown, GO button, verses);
+# defined in scraper_settings so torah_web_scraper can share it without importing this module
+from scraper_settings import WEB_WAIT_TIMEOUT
+
+# Concurrent scraping: number of headless browsers, and per-host politeness limits
+SCRAPER_MAX_BROWSERS = 4
+HOST_MAX_CONCURRENT_REQUESTS = 2  # Page loads in flight at once against one host
+HOST_MIN_REQUEST_INTERVAL = 1.0  # Seconds between the starts of two page loads on one host
+
+# How Metsudah chapters are fetched: by driving Chrome, or by submitting the search form over HTTP
+METSUDAH_FETCHER_BROWSER = "browser"
+METSUDAH_FETCHER_HTTP = "http"
+METSUDAH_FETCHER = METSUDAH_FETCHER_BROWSER  # Default for a run; the scraping functions take a fetcher argument
+HTTP_TIMEOUT = 30  # Seconds per HTTP request
+HTTP_POOL_SIZE = 8  # Keep-alive connections per host in the HTTP client pool
+METSUDAH_SAMPLE_PAGES_DIR = PROJECT_ROOT / "tests" / "fixtures" / "metsudah"  # Saved search and chapter pages, the default input of the parser benchmark
+METSUDAH_EXCEL_CRAWL = "metsudah_excel"  # Failed chapters of the Metsudah Excel export (see crawl_manifest); done ones are in the sidecar manifests
+
+# The five books of the Torah, in order.
+TORAH_BOOKS = ["Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy"]
+TORAH_BOOKS_HEB = {
+    "Genesis": "בראשית",
+    "Exodus": "שמות",
+    "Leviticus": "ויקרא",
+    "Numbers": "במדבר",
+    "Deuteronomy": "דברים",
+}
+
 def terminal_prompt():
     # Ask the user to choose between the options
     print("Choose an option:")
@@ -76,7 +108,17 @@ def terminal_prompt():
     print("     6. Create a word document of A BOOK CHAPTER of mixed Heb and Metsudah Eng based on hard coded values.")
     print("     7. Create a word document with NOTES sections of A BOOK CHAPTER of mixed Heb and Metsudah Eng based on hard coded values.")
     print("     8. Create a word document of AN ENTIRE BOOK of mixed Heb and Metsudah Eng based on hard coded values.")
-    choice = input("Please enter a number: 1 through 2:      (input) -->  ").strip()
+    print("     9. Get ALL FIVE BOOKS from the Metsudah Eng translation site and save them in EXCEL, one book per worker process. ")
+    print("     10. Create a bilingual Heb/Eng EXCEL of ALL FIVE BOOKS from local data (no web access). ")
+    print("     11. Create word documents of EVERY CHAPTER OF ALL FIVE BOOKS of mixed Heb and Metsudah Eng, in parallel.")
+    print("     12. Create ONE word document of A WHOLE BOOK of mixed Heb and Metsudah Eng based on hard coded values.")
+    print("     13. Create ONE word document of A PARASHA of mixed Heb and Metsudah Eng based on hard coded values.")
+    print("     14. Create ONE word document of AN ALIYAH of mixed Heb and Metsudah Eng based on hard coded values.")
+    print("     15. Create ONE word document of THE WHOLE TORAH of mixed Heb and Metsudah Eng (streamed).")
+    print("     16. Create ONE word document of A PARASHA as a side by side Heb/Metsudah Eng table based on hard coded values.")
+    print("     17. Get ALL Torah books from the Metsudah site with parallel headless browsers and save them in excel.")
+    print("     18. Get ALL Torah books from the Metsudah site over HTTP (no browser) and save them in excel.")
+    choice = input("Please enter a number: 1 through 18:      (input) -->  ").strip()
     return choice
 
 def display_verse(verse_str, text_str):
@@ -137,6 +179,16 @@ def get_hebrew_verse_num(verse_number, json_filename):
     except Exception as e:
         return f"Error: {e}"
 
+def get_hebrew_verse_num_map(json_filename=H_VERSE_NUM_JSON):
+    """
+    Returns the full verse number -> Hebrew label mapping, loaded once from the JSON file.
+
+    :param json_filename: str - Name of the JSON file (inside /data) to load.
+    :return: dict - {verse_number (int): Hebrew label (str)}
+    """
+    verse_map = load_json(json_filename)
+    return {v: k for k, v in verse_map.items()}
+
 def get_torah_book_num_chapters(book_name, json_filename="TorahChapterLengths.json"):
     """
     Returns the number of chapters in a given Torah book.
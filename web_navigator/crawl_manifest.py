@@ -0,0 +1,194 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: msvcrt byte-range locks instead
+    fcntl = None
+    import msvcrt
+
+# Checkpoint manifests for long crawls. Each crawl (e.g. the Hebrew parashot scrape) has one
+# JSON file recording, per unit of work (a chapter or verse range), its status, number of
+# attempts, content hash and last error. The file is rewritten after every unit, so a rerun
+# after a crash skips completed units and resumes from the first incomplete one.
+# Files are written with file_utils' crash-safe writer. Standard library only (plus the
+# project's stdlib-only file_utils), so any scraper folder can import it.
+
+# -------------------------
+# Bootstrapping Dependencies
+# -------------------------
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+
+DEPENDENCY_DIRS = [
+    PROJECT_ROOT / "utils"
+]
+
+for path in DEPENDENCY_DIRS:
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.append(path_str)
+
+import file_utils                 # utils directory
+
+# -------------------------
+# Manifest Settings
+# -------------------------
+
+CRAWL_MANIFEST_DIR = PROJECT_ROOT / "data" / "crawl_manifests"
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# Pool threads record their chapters concurrently; worker processes (e.g. one per book)
+# are kept apart by a lock file next to the manifest (see locked_crawl_manifest())
+CRAWL_MANIFEST_LOCK = threading.Lock()
+
+def get_crawl_manifest_path(crawl_name: str, manifest_dir=None):
+    """
+    Returns the manifest file of a crawl (e.g. 'data/crawl_manifests/metsudah_excel.json').
+    """
+    return Path(manifest_dir or CRAWL_MANIFEST_DIR) / f"{crawl_name}.json"
+
+@contextmanager
+def locked_crawl_manifest(crawl_name: str, manifest_dir=None):
+    """
+    Holds the crawl's manifest exclusively, across threads and processes, for a
+    load-modify-save cycle, so concurrent writers never drop each other's entries.
+    """
+    manifest_path = get_crawl_manifest_path(crawl_name, manifest_dir)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with CRAWL_MANIFEST_LOCK, open(f"{manifest_path}.lock", "a+b") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+def load_crawl_manifest(crawl_name: str, manifest_dir=None):
+    """
+    Loads the manifest of a crawl.
+
+    Returns:
+        dict: {"units": {unit: {"status", "attempts", "updated_at", ...}}}. Empty if the
+              crawl has no manifest yet or it cannot be read.
+    """
+    manifest_path = get_crawl_manifest_path(crawl_name, manifest_dir)
+    if not manifest_path.exists():
+        return {"units": {}}
+
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[ERROR] Ignoring unreadable crawl manifest {manifest_path}: {e}")
+        return {"units": {}}
+
+    manifest.setdefault("units", {})
+    return manifest
+
+def save_crawl_manifest(crawl_name: str, manifest, manifest_dir=None):
+    """
+    Writes the manifest of a crawl to a temporary file and renames it into place, so a
+    crash never leaves a half-written manifest.
+    """
+    manifest_path = get_crawl_manifest_path(crawl_name, manifest_dir)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    file_utils.write_json_atomic(manifest_path, manifest)
+
+def record_unit(crawl_name: str, unit: str, status: str, content_hash=None, error=None, manifest_dir=None, **details):
+    """
+    Records the outcome of one attempt at a unit and persists the manifest immediately.
+
+    Args:
+        crawl_name (str): Name of the crawl (the manifest file name).
+        unit (str): Key of the unit, e.g. 'Genesis/1'.
+        status (str): STATUS_DONE or STATUS_FAILED.
+        content_hash (str, optional): Hash of the saved content (see
+                                      file_utils.get_content_hash()).
+        error (str or dict, optional): Why the attempt failed (a dict is stored as is,
+                                       e.g. a retry_policy failure event).
+        manifest_dir (str or Path, optional): Folder of the manifests. Defaults to CRAWL_MANIFEST_DIR.
+        **details: Extra fields to store, e.g. output="path/to/file.docx".
+
+    Returns:
+        dict: The unit's updated entry.
+    """
+    with locked_crawl_manifest(crawl_name, manifest_dir):
+        manifest = load_crawl_manifest(crawl_name, manifest_dir)
+        entry = manifest["units"].get(unit, {})
+
+        entry.update(details)
+        entry["status"] = status
+        entry["attempts"] = entry.get("attempts", 0) + 1
+        entry["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        if content_hash is not None:
+            entry["content_hash"] = content_hash
+        if error is not None:
+            entry["error"] = error if isinstance(error, dict) else str(error)
+        elif status == STATUS_DONE:
+            entry.pop("error", None)
+
+        manifest["units"][unit] = entry
+        save_crawl_manifest(crawl_name, manifest, manifest_dir)
+        return entry
+
+def clear_unit(crawl_name: str, unit: str, manifest_dir=None):
+    """
+    Removes a unit's entry, e.g. once its completion is recorded by its output itself
+    (see metsudah_chumash_web_nav.record_chapter_crawl()).
+    """
+    with locked_crawl_manifest(crawl_name, manifest_dir):
+        manifest = load_crawl_manifest(crawl_name, manifest_dir)
+        if manifest["units"].pop(unit, None) is not None:
+            save_crawl_manifest(crawl_name, manifest, manifest_dir)
+
+def is_unit_complete(crawl_name: str, unit: str, manifest=None, manifest_dir=None):
+    """
+    Returns True if a unit is recorded as done and its recorded output file, if any,
+    still exists (a deleted output means the unit has to be redone).
+
+    Args:
+        manifest (dict, optional): An already loaded manifest, to avoid rereading the file
+                                   for every unit.
+    """
+    if manifest is None:
+        manifest = load_crawl_manifest(crawl_name, manifest_dir)
+
+    entry = manifest["units"].get(unit)
+    if not entry or entry.get("status") != STATUS_DONE:
+        return False
+    return "output" not in entry or os.path.exists(entry["output"])
+
+def get_failed_units(crawl_name: str, manifest_dir=None):
+    """
+    Returns the units whose last attempt failed, with their entries.
+
+    Returns:
+        dict: {unit: entry}
+    """
+    manifest = load_crawl_manifest(crawl_name, manifest_dir)
+    return {unit: entry for unit, entry in manifest["units"].items() if entry.get("status") == STATUS_FAILED}
+
+def reset_crawl(crawl_name: str, manifest_dir=None):
+    """
+    Deletes the manifest of a crawl, so the next run starts from the beginning.
+    """
+    manifest_path = get_crawl_manifest_path(crawl_name, manifest_dir)
+    with locked_crawl_manifest(crawl_name, manifest_dir):
+        if manifest_path.exists():
+            manifest_path.unlink()
@@ -0,0 +1,162 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import SessionNotCreatedException
+
+# ChromeDriver resolution, done once instead of at every browser launch. The resolved
+# driver (path and version) is kept for the life of the process and in a small JSON file
+# for later runs. In offline mode a local driver is used without any network check.
+
+# -------------------------
+# Driver Settings
+# -------------------------
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+
+CHROMEDRIVER_CACHE_FILE = PROJECT_ROOT / "data" / "chromedriver.json"
+CHROMEDRIVER_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # Seconds before a resolved driver is checked for updates again
+
+# A local chromedriver to use (offline mode: CHROMEDRIVER_OFFLINE=1 means no network check at all)
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")
+CHROMEDRIVER_OFFLINE = os.environ.get("CHROMEDRIVER_OFFLINE", "").lower() in ("1", "true", "yes")
+
+# Resolved driver of this process: {"path", "version", "resolved_at"}
+RESOLVED_DRIVER = None
+RESOLVED_DRIVER_LOCK = threading.Lock()
+
+def get_chromedriver_version(driver_path):
+    """
+    Returns the version reported by `chromedriver --version` (e.g. '126.0.6478.126'), or None.
+    """
+    try:
+        output = subprocess.run([str(driver_path), "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"\d+(?:\.\d+)+", output)
+    return match.group(0) if match else None
+
+def load_cached_driver(max_age=None):
+    """
+    Returns the driver resolved by an earlier run, or None if there is none, it is older
+    than max_age seconds, or its binary is gone.
+
+    Args:
+        max_age (float, optional): Maximum age in seconds. Defaults to
+                                   CHROMEDRIVER_CACHE_MAX_AGE; float("inf") accepts any age.
+    """
+    max_age = CHROMEDRIVER_CACHE_MAX_AGE if max_age is None else max_age
+    try:
+        with open(CHROMEDRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not os.path.isfile(cached.get("path", "")) or time.time() - cached.get("resolved_at", 0) > max_age:
+        return None
+    return cached
+
+def save_cached_driver(resolved):
+    """
+    Stores a resolved driver for later runs.
+    """
+    CHROMEDRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(CHROMEDRIVER_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(resolved, f, indent=2)
+
+def resolve_local_driver():
+    """
+    Offline resolution: CHROMEDRIVER_PATH, else the last resolved driver (whatever its
+    age), else a chromedriver on the PATH. Never touches the network.
+
+    Raises:
+        FileNotFoundError: If no local chromedriver can be found.
+    """
+    if CHROMEDRIVER_PATH:
+        if not os.path.isfile(CHROMEDRIVER_PATH):
+            raise FileNotFoundError(f"CHROMEDRIVER_PATH does not exist: {CHROMEDRIVER_PATH}")
+        return CHROMEDRIVER_PATH
+
+    cached = load_cached_driver(max_age=float("inf"))
+    if cached:
+        return cached["path"]
+
+    driver_path = shutil.which("chromedriver")
+    if not driver_path:
+        raise FileNotFoundError("No local chromedriver found; set CHROMEDRIVER_PATH for offline mode.")
+    return driver_path
+
+def get_chromedriver_path(offline=None, refresh=False):
+    """
+    Returns the path of the chromedriver binary, resolving it at most once per process.
+
+    Resolution order: the process cache; in offline mode, resolve_local_driver(); an
+    explicit CHROMEDRIVER_PATH; the driver saved by an earlier run (if not older than
+    CHROMEDRIVER_CACHE_MAX_AGE); and only then webdriver_manager, which may go online.
+
+    Args:
+        offline (bool, optional): Never use the network. Defaults to CHROMEDRIVER_OFFLINE.
+        refresh (bool): Ignore the cached driver, e.g. after Chrome was updated.
+
+    Returns:
+        str: Path of the chromedriver binary.
+    """
+    global RESOLVED_DRIVER
+    offline = CHROMEDRIVER_OFFLINE if offline is None else offline
+
+    with RESOLVED_DRIVER_LOCK:
+        if RESOLVED_DRIVER and not refresh:
+            return RESOLVED_DRIVER["path"]
+
+        if offline:
+            driver_path, source = resolve_local_driver(), "local"
+        elif CHROMEDRIVER_PATH:
+            driver_path, source = CHROMEDRIVER_PATH, "local"
+        else:
+            cached = None if refresh else load_cached_driver()
+            if cached:
+                RESOLVED_DRIVER = cached
+                return cached["path"]
+
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver_path, source = ChromeDriverManager().install(), "webdriver_manager"
+
+        RESOLVED_DRIVER = {
+            "path": str(driver_path),
+            "version": get_chromedriver_version(driver_path),
+            "resolved_at": time.time(),
+        }
+        if source == "webdriver_manager":
+            save_cached_driver(RESOLVED_DRIVER)
+
+        print(f"[INFO] Using chromedriver {RESOLVED_DRIVER['version'] or '(unknown version)'} at {driver_path}")
+        return RESOLVED_DRIVER["path"]
+
+def new_chrome_driver(options=None, offline=None):
+    """
+    Launches Chrome with the resolved chromedriver. If a cached driver no longer
+    matches the installed Chrome, the driver is resolved again once and the launch is
+    retried (not in offline mode).
+
+    Args:
+        options (ChromeOptions, optional): Browser options.
+        offline (bool, optional): Never use the network. Defaults to CHROMEDRIVER_OFFLINE.
+
+    Returns:
+        WebDriver: The browser.
+    """
+    offline = CHROMEDRIVER_OFFLINE if offline is None else offline
+    try:
+        return webdriver.Chrome(service=Service(get_chromedriver_path(offline)), options=options)
+    except SessionNotCreatedException:
+        if offline or CHROMEDRIVER_PATH:
+            raise
+        print("[INFO] Cached chromedriver does not match Chrome, resolving it again...")
+        return webdriver.Chrome(service=Service(get_chromedriver_path(offline, refresh=True)), options=options)
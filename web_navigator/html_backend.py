@@ -0,0 +1,120 @@
+import time
+
+from bs4 import BeautifulSoup, Comment
+
+try:
+    import lxml.html
+except ImportError:  # Optional: everything falls back to BeautifulSoup's html.parser
+    lxml = None
+
+# HTML parser backend shared by the verse extractors. Once the scrapers stopped sleeping,
+# parsing became their main CPU cost. With the "lxml" backend, extractors that walk an
+# lxml tree (parse_html_tree()) skip BeautifulSoup entirely, and BeautifulSoup extractors
+# (make_soup()) use lxml's C parser. Without lxml, the pure-Python html.parser is used.
+
+# -------------------------
+# Parser Settings
+# -------------------------
+HTML_PARSER_LXML = "lxml"
+HTML_PARSER_BUILTIN = "html.parser"
+HTML_PARSER_PREFERENCE = [HTML_PARSER_LXML, HTML_PARSER_BUILTIN]  # Fastest first
+
+HTML_PARSER = None  # Set to force a backend; None picks the first available in HTML_PARSER_PREFERENCE
+
+def is_parser_available(parser: str):
+    """
+    Returns True if the given backend can be used here.
+    """
+    return parser == HTML_PARSER_BUILTIN or (parser == HTML_PARSER_LXML and lxml is not None)
+
+def get_html_parser():
+    """
+    Returns the parser backend to use: HTML_PARSER if set, else the fastest available.
+    """
+    if HTML_PARSER:
+        return HTML_PARSER
+
+    for parser in HTML_PARSER_PREFERENCE:
+        if is_parser_available(parser):
+            return parser
+    return HTML_PARSER_BUILTIN
+
+def parse_html_tree(page_source: str):
+    """
+    Parses a page into an lxml element tree (only with the "lxml" backend).
+
+    lxml rejects a str that starts with an XML encoding declaration (as XHTML pages
+    do), so the page is passed as UTF-8 bytes, with the encoding given explicitly so
+    a <meta charset> in the page cannot make lxml decode it differently.
+
+    Returns:
+        lxml.html.HtmlElement: The root <html> element.
+    """
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    return lxml.html.document_fromstring(page_source.encode("utf-8"), parser=parser)
+
+def is_comment(node):
+    """
+    Returns True if a BeautifulSoup node is an HTML comment. Comments are not shown
+    on the page, and lxml trees keep them out of the text too (only their tail is
+    text), so BeautifulSoup extractors skip them to get the same output.
+    """
+    return isinstance(node, Comment)
+
+def make_soup(page_source: str, parser=None):
+    """
+    Parses a page into a BeautifulSoup tree with the selected backend.
+
+    Args:
+        page_source (str): HTML of the page.
+        parser (str, optional): Backend to use. Defaults to get_html_parser().
+
+    Returns:
+        BeautifulSoup: The parsed page.
+    """
+    return BeautifulSoup(page_source, parser or get_html_parser())
+
+def benchmark_html_parsers(pages, extract, parsers=None, repeat=3):
+    """
+    Times an extractor over a set of pages with each available parser backend, and
+    checks that every backend extracts the same data as the first one.
+
+    Args:
+        pages (list[str]): HTML pages, e.g. saved chapter pages.
+        extract (callable): extract(page_source, parser=...) returning the extracted data.
+        parsers (list[str], optional): Backends to compare. Defaults to HTML_PARSER_PREFERENCE.
+        repeat (int): Passes over the pages; the fastest pass is kept.
+
+    Returns:
+        dict: {parser: {"seconds": best pass, "per_page_ms": ..., "matches": bool}}
+    """
+    parsers = [parser for parser in (parsers or HTML_PARSER_PREFERENCE) if is_parser_available(parser)]
+    results = {}
+    baseline = None
+
+    for parser in parsers:
+        best = float("inf")
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            extracted = [extract(page, parser=parser) for page in pages]
+            best = min(best, time.perf_counter() - start_time)
+
+        if baseline is None:
+            baseline = extracted
+        results[parser] = {
+            "seconds": best,
+            "per_page_ms": best * 1000 / max(len(pages), 1),
+            "matches": extracted == baseline,
+        }
+
+    return results
+
+def print_benchmark(results):
+    """
+    Prints benchmark_html_parsers() results with each backend's speedup over html.parser.
+    """
+    reference = results.get(HTML_PARSER_BUILTIN, {}).get("seconds")
+    for parser, result in results.items():
+        speedup = f", {reference / result['seconds']:.1f}x vs {HTML_PARSER_BUILTIN}" if reference and result["seconds"] else ""
+        same = "same output" if result["matches"] else "DIFFERENT output"
+        print(f"[INFO] {parser:12} {result['per_page_ms']:8.2f} ms/page{speedup} ({same})")
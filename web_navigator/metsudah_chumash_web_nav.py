@@ -3,18 +3,42 @@ import os
 import time
 from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from typing import Tuple
 import time
+import re
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlparse, urljoin
+from requests.adapters import HTTPAdapter
+import requests
+import threading
+import atexit
 
+# Matches the bold verse labels of a Metsudah chapter page, e.g. "Verse 17:"
+VERSE_LABEL_PATTERN = re.compile(r"Verse (\d+):")
+
+# Browser shared by every chapter and book of a run (per process), see get_session_driver()
+SESSION_DRIVER = None
+
+# Headless browser pool: one browser per pool thread, plus every browser launched so far
+POOL_THREAD_STATE = threading.local()
+POOL_DRIVERS = []
+POOL_DRIVERS_LOCK = threading.Lock()
+
+# Per-host politeness state shared by the pool threads, {host: {"slots", "lock", "last_start"}}
+HOST_POLITENESS = {}
+HOST_POLITENESS_LOCK = threading.Lock()
+
+# Browser-free fetcher: pooled HTTP client and the search page it submits (html, url), per process
+HTTP_SESSION = None
+HTTP_SESSION_LOCK = threading.Lock()
+CHUMASH_SEARCH_PAGE = None
 
 
 # -------------------------
@@ -38,6 +62,11 @@ from torah_search_bar import gui_getter, getSite
 import utils                      # utils directory
 import json_funcs                 # utils directory
 import excel_engine               # excel_engine directory
+import page_cache                 # web_navigator directory
+import crawl_manifest             # web_navigator directory
+import retry_policy               # web_navigator directory
+import html_backend               # web_navigator directory
+import driver_resolver            # web_navigator directory
 
 def inquireForParasha(book, chapter, verse):
 
@@ -121,6 +150,70 @@ def load_json_fields(json_filename, *fields, default=None, folder="data"):
     return tuple(data.get(field, default) for field in fields)
 
 
+def wait_for(driver, condition, timeout=None, description="condition"):
+    """
+    Blocks until condition(driver) returns a truthy value, polling every 0.1s.
+
+    :param driver: Selenium WebDriver object
+    :param condition: Callable taking the driver (e.g. an expected_conditions object)
+    :param timeout: Maximum wait in seconds. Defaults to, and is capped at, utils.WEB_WAIT_TIMEOUT.
+    :param description: What is being waited for, used in the timeout message
+    :return: The truthy value returned by the condition
+    :raises TimeoutException: If the condition is not met in time.
+    """
+    timeout = min(timeout or utils.WEB_WAIT_TIMEOUT, utils.WEB_WAIT_TIMEOUT)
+    wait = WebDriverWait(driver, timeout, poll_frequency=0.1,
+                         ignored_exceptions=(NoSuchElementException, StaleElementReferenceException))
+    return wait.until(condition, f"Timed out after {timeout}s waiting for {description}")
+
+def wait_for_page_loaded(driver, timeout=None):
+    """
+    Waits until the current document has finished loading.
+    """
+    return wait_for(driver, lambda d: d.execute_script("return document.readyState") == "complete",
+                    timeout, "page load")
+
+def wait_for_option(driver, dropdown_name, predicate, timeout=None):
+    """
+    Waits until the named dropdown is enabled and has an option whose text matches.
+
+    :param dropdown_name: The dropdown's name attribute (e.g. "chapterq")
+    :param predicate: Callable taking the stripped option text
+    :return: (Select, matching option text)
+    """
+    def option_ready(d):
+        element = d.find_element(By.NAME, dropdown_name)
+        if not element.is_enabled():
+            return False
+        select = Select(element)
+        for option in select.options:
+            if predicate(option.text.strip()):
+                return select, option.text.strip()
+        return False
+
+    return wait_for(driver, option_ready, timeout, f"an option in dropdown '{dropdown_name}'")
+
+def wait_for_verse_content(driver, timeout=None):
+    """
+    Waits until the verse labels ("Verse N:") of a chapter page are present.
+    """
+    return wait_for(driver, EC.presence_of_element_located((By.XPATH, "//b[starts-with(normalize-space(.), 'Verse ')]")),
+                    timeout, "verse content")
+
+def launch_chrome_driver(headless=False):
+    """
+    Launches a new Chrome browser controlled by Selenium.
+
+    :param headless: Run without a window (used by the concurrent scraping pool).
+
+    The chromedriver binary is resolved once and cached (see driver_resolver).
+    """
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1280,2000")
+    return driver_resolver.new_chrome_driver(options)
+
 def open_website_from_json(json_filename):
     """
     Load URL from given JSON file and open it using a Selenium WebDriver. Returns the driver.
@@ -131,16 +224,17 @@ def open_website_from_json(json_filename):
         print("No valid URL found in JSON.")
         return None
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = launch_chrome_driver()
 
     try:
         print(f"Opening {url} for {book} ch:{chapter} parasha:({parasha})")
         driver.get(url)
-        time.sleep(2)
+        wait_for_page_loaded(driver)
 
         final_url = driver.current_url
         driver.get(final_url)
-        time.sleep(2)
+        wait_for_page_loaded(driver)
+        wait_for_option(driver, "bookq", bool)
 
         return driver
 
@@ -149,6 +243,59 @@ def open_website_from_json(json_filename):
         driver.quit()
         return None
 
+def return_to_search_page(driver, json_filename="current_verse_target.json"):
+    """
+    Brings an already open browser back to the Chumash search form, so it can fetch
+    another chapter through select_chumash_options() and click_go_button().
+
+    :param driver: Selenium WebDriver object
+    :param json_filename: JSON file in the data directory holding the site URL
+    :return: Selenium WebDriver object
+    """
+    url, _, _, _ = load_eng_website_link(json_filename)
+    driver.get(url)
+    wait_for_page_loaded(driver)
+    wait_for_option(driver, "bookq", bool)
+    return driver
+
+def get_session_driver():
+    """
+    Returns the browser of the current run, launching it and opening the Metsudah search
+    page on first use. The browser is reused for every following chapter and book and
+    quit when the process exits (or by close_session_driver()).
+
+    :return: Selenium WebDriver object, or None if the browser could not be started.
+    """
+    global SESSION_DRIVER
+    if SESSION_DRIVER is None:
+        SESSION_DRIVER = open_website_from_json("current_verse_target.json")
+    return SESSION_DRIVER
+
+def close_session_driver():
+    """
+    Quits the browser of the current run, if one is open.
+    """
+    global SESSION_DRIVER
+    if SESSION_DRIVER is None:
+        return
+    try:
+        SESSION_DRIVER.quit()
+    except Exception as e:
+        print(f"[ERROR] Could not quit the browser: {e}")
+    SESSION_DRIVER = None
+
+# Quit the run's browser at exit; registered once, as the session's browser may be
+# replaced many times during a long crawl (see recycle_session_driver())
+atexit.register(close_session_driver)
+
+def recycle_session_driver():
+    """
+    Drops the run's browser after a failure; the next get_session_driver() call starts
+    a fresh one.
+    """
+    print("[INFO] Recycling the browser session.")
+    close_session_driver()
+
 def select_chumash_options(driver, book="Genesis", chapter="1", verse="1", debug=False):
     """
     Selects the given book, chapter, and verse from the dropdown menus
@@ -161,69 +308,68 @@ def select_chumash_options(driver, book="Genesis", chapter="1", verse="1", debug
         verse (str): Verse number as string (e.g., "1")
         debug (bool): Whether to print debug information
 
+    Each dropdown is used as soon as it holds the wanted option (the chapter and verse
+    lists are refreshed after the book is chosen), with no fixed delay.
+
     Returns:
-        None
+        WebDriver: The driver.
+
+    Raises:
+        Exception: If an option could not be selected, so the search is never submitted
+                   with the wrong book, chapter or verse (see retry_policy.call_with_retry()).
     """
     try:
         # Locate and select the book
-        book_select = Select(driver.find_element(By.NAME, "bookq"))
-        book_select.select_by_visible_text(book)
-        time.sleep(0.5)
+        book_select, book_text = wait_for_option(driver, "bookq", lambda text: text == book)
+        book_select.select_by_visible_text(book_text)
     except Exception as e:
         print(f"Error selecting book dropdown: {e}")
+        raise
 
     # Select the chapter
-    chapter_select = Select(driver.find_element(By.NAME, "chapterq"))
+    chapter_number = int(chapter)
     try:
-        # Extract all option texts to debug
-        all_chapter_options = [opt.text.strip() for opt in chapter_select.options if opt.text.strip()]
-        if debug:
-            print("Available chapter options:", all_chapter_options)
-
         # Attempt matching using startswith (since some options have leading spaces)
-        chapter_number = int(chapter)
-        matching_option = None
-        for option_text in all_chapter_options:
-            if option_text.startswith(f"Chapter {chapter_number}"):
-                matching_option = option_text
-                break
-
-        if matching_option:
-            chapter_select.select_by_visible_text(matching_option)
-            if debug:
-                print(f"Chapter selected: {matching_option}")
-        else:
-            print(f"Chapter option not found for Chapter {chapter_number}. Options were: {all_chapter_options}")
-
-        time.sleep(0.5)
+        chapter_select, matching_option = wait_for_option(
+            driver, "chapterq", lambda text: text.startswith(f"Chapter {chapter_number}"))
+        chapter_select.select_by_visible_text(matching_option)
+        if debug:
+            print(f"Chapter selected: {matching_option}")
+    except TimeoutException:
+        all_chapter_options = [opt.text.strip() for opt in Select(driver.find_element(By.NAME, "chapterq")).options
+                               if opt.text.strip()]
+        print(f"Chapter option not found for Chapter {chapter_number}. Options were: {all_chapter_options}")
+        raise
     except Exception as e:
         print(f"Error selecting chapter dropdown: {e}")
+        raise
 
     # Select the verse
-    verse_select = Select(driver.find_element(By.NAME, "textq"))
     try:
-        verse_select.select_by_visible_text(str(int(verse)))
+        verse_select, verse_text = wait_for_option(driver, "textq", lambda text: text == str(int(verse)))
+        verse_select.select_by_visible_text(verse_text)
     except Exception as e:
         print(f"Verse option not found: {verse}. Error: {e}")
-    time.sleep(0.5)
+        raise
 
     return driver
 
-def click_go_button(driver, timeout=10):
+def click_go_button(driver, timeout=None):
     """
-    Clicks the "GO" button on the Chumash search page and returns the driver.
+    Clicks the "GO" button on the Chumash search page and returns the driver once the
+    resulting page has replaced the search page and finished loading.
 
     :param driver: Selenium WebDriver object
-    :param timeout: Maximum wait time in seconds for the button to become clickable
+    :param timeout: Maximum wait time in seconds for each step. Defaults to utils.WEB_WAIT_TIMEOUT.
     :return: Selenium WebDriver object
+    :raises TimeoutException: If the button or the results page did not show up in time.
     """
-    try:
-        go_button = WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable((By.XPATH, "//input[@type='submit' and @value='GO']"))
-        )
-        go_button.click()
-    except Exception as e:
-        print(f"[ERROR] Could not click GO button: {e}")
+    go_button = wait_for(driver, EC.element_to_be_clickable((By.XPATH, "//input[@type='submit' and @value='GO']")),
+                         timeout, "the GO button")
+    old_page = driver.find_element(By.TAG_NAME, "html")
+    go_button.click()
+    wait_for(driver, EC.staleness_of(old_page), timeout, "the GO results page")
+    wait_for_page_loaded(driver, timeout)
 
     return driver
 
@@ -241,29 +387,109 @@ def extract_verse_data(driver: WebDriver, verse_number: int) -> Tuple[str, str,
             - The verse text (everything after </b> and before the next <p>)
             - The WebDriver instance
     """
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    target_label = f"Verse {verse_number}:"
+    verse_string, verse_text = extract_chapter_verses(driver.page_source).get(verse_number, ("", ""))
+    return verse_string, verse_text, driver  # ("", "") fallback if verse not found
+
+def get_verse_text_after_label(bold) -> str:
+    """
+    Returns the verse text following a bold verse label: everything after the </b>
+    and before the next <p>.
+    """
+    text_parts = []
+    for sibling in bold.next_siblings:
+        if sibling.name == 'p':
+            break
+        if html_backend.is_comment(sibling):
+            continue  # Not shown on the page, and not in the lxml extractor's text either
+        if isinstance(sibling, str):
+            text_parts.append(sibling.strip())
+        elif sibling.name is None:
+            text_parts.append(str(sibling).strip())
+
+    return ' '.join(filter(None, text_parts)).replace('\n', ' ').strip()
+
+def extract_chapter_verses(page_source: str, parser=None) -> dict:
+    """
+    Extracts every verse of a Metsudah Chumash chapter page in a single parse.
+
+    The page is parsed once and each "Verse N:" label is visited once, instead of
+    rebuilding the tree and scanning all the <b> tags for every verse.
+
+    Parameters:
+        page_source (str): HTML of the chapter page (e.g. driver.page_source).
+        parser (str, optional): HTML parser backend. Defaults to html_backend.get_html_parser()
+                                (lxml when installed).
+
+    Returns:
+        dict: {verse number: (verse label, verse text)}, e.g. {17: ('Verse 17:', '...')}
+    """
+    parser = parser or html_backend.get_html_parser()
+    if parser == html_backend.HTML_PARSER_LXML:
+        return extract_chapter_verses_lxml(page_source)
+
+    soup = html_backend.make_soup(page_source, parser)
+    verses = {}
 
-    # Find all <b> tags
     for bold in soup.find_all("b"):
-        if bold.text.strip() == target_label:
-            verse_tag = bold
-            verse_string = bold.text.strip()
+        label = bold.text.strip()
+        match = VERSE_LABEL_PATTERN.fullmatch(label)
+        if match and int(match.group(1)) not in verses:
+            verses[int(match.group(1))] = (label, get_verse_text_after_label(bold))
+
+    return verses
+
+def benchmark_verse_extraction(page_dir=None, repeat=3):
+    """
+    Times extract_chapter_verses() with each HTML parser backend over saved Metsudah
+    chapter pages and prints the speedup. By default it runs over the sample pages
+    committed with the tests, so the numbers can be reproduced on any checkout.
 
-            # Extract all the text after the </b> until the next <p>
-            text_parts = []
-            for sibling in bold.next_siblings:
-                if sibling.name == 'p':
-                    break
-                if isinstance(sibling, str):
-                    text_parts.append(sibling.strip())
-                elif sibling.name is None:
-                    text_parts.append(str(sibling).strip())
+    Args:
+        page_dir (str or Path, optional): Folder of saved .html chapter pages, searched
+                                          recursively (so page_cache.PAGE_CACHE_DIR works too).
+                                          Defaults to utils.METSUDAH_SAMPLE_PAGES_DIR.
+        repeat (int): Passes over the pages; the fastest pass is kept.
+
+    Returns:
+        dict: html_backend.benchmark_html_parsers() results, or {} if there are no pages.
+    """
+    page_dir = Path(page_dir or utils.METSUDAH_SAMPLE_PAGES_DIR)
+    pages = [path.read_text(encoding="utf-8") for path in sorted(page_dir.rglob("*.html"))]
+    pages = [page for page in pages if VERSE_LABEL_PATTERN.search(page)]
 
-            verse_text = ' '.join(filter(None, text_parts)).replace('\n', ' ').strip()
-            return verse_string, verse_text, driver
+    if not pages:
+        print("[ERROR] No saved Metsudah chapter pages to benchmark.")
+        return {}
+
+    print(f"[INFO] Benchmarking verse extraction over {len(pages)} chapter pages...")
+    results = html_backend.benchmark_html_parsers(pages, extract_chapter_verses, repeat=repeat)
+    html_backend.print_benchmark(results)
+    return results
+
+def extract_chapter_verses_lxml(page_source: str) -> dict:
+    """
+    extract_chapter_verses() on an lxml tree, without building a BeautifulSoup tree.
+    A verse's text is the text after its </b> label up to the next <p>, as in
+    get_verse_text_after_label().
+    """
+    verses = {}
 
-    return "", "", driver  # fallback if verse not found
+    for bold in html_backend.parse_html_tree(page_source).iter("b"):
+        label = bold.text_content().strip()
+        match = VERSE_LABEL_PATTERN.fullmatch(label)
+        if not match or int(match.group(1)) in verses:
+            continue
+
+        text_parts = [(bold.tail or "").strip()]
+        for sibling in bold.itersiblings():
+            if sibling.tag == "p":
+                break
+            text_parts.append((sibling.tail or "").strip())
+
+        verse_text = ' '.join(filter(None, text_parts)).replace('\n', ' ').strip()
+        verses[int(match.group(1))] = (label, verse_text)
+
+    return verses
 
 def get_metsudah_verse(book, chapter, verse):
     # Open the English website
@@ -276,13 +502,14 @@ def get_metsudah_verse(book, chapter, verse):
         print("Initial Page Title:", driver.title)
 
         # Select book, chapter, and verse
-        driver = select_chumash_options(driver, book, chapter, verse)
-        time.sleep(3)  # Allow the page to update
+        host = retry_policy.get_host(utils.METSUDAH_ENG_SITE)
+        driver = retry_policy.call_with_retry(select_chumash_options, driver, book, chapter, verse,
+                                              step="select_chumash_options", host=host)
 
         # Click the GO button
-        driver = click_go_button(driver)
+        driver = retry_policy.call_with_retry(click_go_button, driver, step="click_go_button", host=host)
         print("After GO Click Page Title:", driver.title)
-        time.sleep(3)  # Wait for content to load
+        wait_for_verse_content(driver)
 
         # Extract the verse and text
         verse_str, text_str, driver = extract_verse_data(driver, verse)
@@ -322,34 +549,135 @@ def metsudah_eng_verse_getter(book, chapter, verse, website, parasha):
 
     return driver, verse_str, text_str
 
-def get_metsudah_ch(book, chapter):
+def get_chapter_verse_data(book, chapter, page_source):
+    """
+    Builds the {verse label: verse text} mapping of a chapter from its result page.
+
+    Raises:
+        ValueError: If verses of the chapter are missing from the page (an error or
+                    half-loaded page), so it is never saved or cached as the chapter.
+    """
+    chapter_verses = extract_chapter_verses(page_source)
+    total_verses_in_ch = utils.get_torah_ch_verse_num(book, chapter)
+
+    missing_verses = [verse for verse in range(1, total_verses_in_ch + 1) if verse not in chapter_verses]
+    if missing_verses:
+        raise ValueError(f"{book} Chapter {chapter}: verse(s) {missing_verses} not found on the page")
+
+    verse_data = {}  # Dictionary to hold verse:text mapping
+    for verse in range(1, total_verses_in_ch + 1):
+        verse_str, text_str = chapter_verses[verse]
+        verse_data[verse_str] = text_str
+    return verse_data
+
+def read_chapter_page(book, chapter, get_page_source, attempts=None):
+    """
+    Reads a chapter's verses from its result page and caches the page once it is
+    complete. An incomplete page counts as a failed fetch step against the Metsudah host.
+
+    Args:
+        book (str): Name of the Torah book (e.g., "Genesis").
+        chapter (int): Chapter number.
+        get_page_source (callable): Returns the page's HTML; called again on each retry
+                                    (e.g. a browser's page_source, which may still be loading).
+        attempts (int, optional): Total tries. Defaults to retry_policy.RETRY_ATTEMPTS.
+
+    Returns:
+        dict: {verse label: verse text}
+
+    Raises:
+        retry_policy.FetchError: If the page still lacked verses after the retries.
+    """
+    def read_page():
+        page_source = get_page_source()
+        return page_source, get_chapter_verse_data(book, chapter, page_source)
+
+    page_source, verse_data = retry_policy.call_with_retry(read_page, step="read_chapter_verses",
+                                                           host=retry_policy.get_host(utils.METSUDAH_ENG_SITE),
+                                                           attempts=attempts, retry_on=(ValueError,))
+    store_chapter_page(book, chapter, page_source)
+    return verse_data
+
+def get_cached_chapter(book, chapter):
+    """
+    Returns the verse data of a chapter from the on-disk page cache, or None if the
+    chapter page is not cached (or has expired, or is incomplete).
+    """
+    page_source = page_cache.get_cached_page(source="metsudah", book=book, chapter=int(chapter))
+    if page_source is None:
+        return None
+
+    try:
+        verse_data = get_chapter_verse_data(book, chapter, page_source)
+    except ValueError as e:
+        print(f"[INFO] Ignoring the cached page of {book} Chapter {chapter}: {e}")
+        return None
+
+    print(f"[INFO] {book} Chapter {chapter} loaded from the page cache.")
+    return verse_data
+
+def store_chapter_page(book, chapter, page_source):
+    """
+    Caches a chapter's result page. Only complete pages get here (see read_chapter_page()),
+    so an error or half-loaded page is never served from the cache later.
+    """
+    page_cache.store_page(page_source, source="metsudah", book=book, chapter=int(chapter))
+
+def get_metsudah_ch(book, chapter, driver=None, polite=False):
+    """
+    Fetches every verse of a chapter from the Metsudah site.
+
+    Args:
+        book (str): Name of the Torah book (e.g., "Genesis").
+        chapter (int): Chapter number.
+        driver (WebDriver, optional): An open browser to reuse (see get_session_driver());
+                                      it is navigated back to the search form first.
+                                      By default a new browser is launched.
+        polite (bool): Hold a polite_host_slot() around each request to the site, as the
+                       concurrent pool does. Each try holds its own slot, so no slot is
+                       held during retry pauses.
+
+    Chapter pages are cached on disk (see page_cache), so a cached chapter is returned
+    without opening or navigating a browser.
+
+    Returns:
+        tuple: ({verse label: verse text} or None on failure, driver)
+    """
+    reuse_driver = driver is not None
+
+    # A cached copy of the chapter page saves the whole browser round trip
+    verse_data = get_cached_chapter(book, chapter)
+    if verse_data is not None:
+        return verse_data, driver
+
     # Open the English website
-    driver = open_website_from_json("current_verse_target.json")
+    if not reuse_driver:
+        driver = open_website_from_json("current_verse_target.json")
 
     if not driver:
         return None, None
 
+    host_slot = (lambda: polite_host_slot(utils.METSUDAH_ENG_SITE)) if polite else None
+
     try:
+        if reuse_driver:
+            with (host_slot or nullcontext)():
+                return_to_search_page(driver)
         print("Initial Page Title:", driver.title)
 
-        # Select book, chapter, and verse
+        # Select book, chapter, and verse (each step is retried with backoff)
         starting_verse = "1"
-        driver = select_chumash_options(driver, book, chapter, starting_verse)
-        time.sleep(3)  # Allow the page to update
+        host = retry_policy.get_host(utils.METSUDAH_ENG_SITE)
+        driver = retry_policy.call_with_retry(select_chumash_options, driver, book, chapter, starting_verse,
+                                              step="select_chumash_options", host=host, hold=host_slot)
 
         # Click the GO button
-        driver = click_go_button(driver)
+        driver = retry_policy.call_with_retry(click_go_button, driver, step="click_go_button", host=host,
+                                              hold=host_slot)
         print("After GO Click Page Title:", driver.title)
-        time.sleep(3)  # Wait for content to load
-
-        total_verses_in_ch = utils.get_torah_ch_verse_num(book, chapter)
-        verse_data = {}  # Dictionary to hold verse:text mapping
-
-        for verse in range(1, total_verses_in_ch + 1):
-            verse_str, text_str, driver = extract_verse_data(driver, verse)
-            verse_data[verse_str] = text_str
-            #print(f"{verse_str} {text_str}")
+        wait_for_verse_content(driver)
 
+        verse_data = read_chapter_page(book, chapter, lambda: driver.page_source)
         return verse_data, driver
 
     except Exception as e:
@@ -365,7 +693,161 @@ def get_and_display_metsudah_verse_m():
     utils.display_verse(verse_str, text_str)
     driver.quit()
 
-def save_torah_chapter_to_excel_m(torah_book: str, chapter: int):
+def get_http_session():
+    """
+    Returns the process's pooled HTTP client (keep-alive connections are reused across
+    requests and threads), creating it on first use.
+    """
+    global HTTP_SESSION
+    with HTTP_SESSION_LOCK:
+        if HTTP_SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=utils.HTTP_POOL_SIZE, pool_maxsize=utils.HTTP_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            HTTP_SESSION = session
+    return HTTP_SESSION
+
+def get_chumash_search_page(json_filename="current_verse_target.json"):
+    """
+    Downloads the Chumash search page once per process.
+
+    Returns:
+        tuple: (page html, final page url)
+    """
+    global CHUMASH_SEARCH_PAGE
+    if CHUMASH_SEARCH_PAGE is None:
+        url, _, _, _ = load_eng_website_link(json_filename)
+        with polite_host_slot(url):
+            response = get_http_session().get(url, timeout=utils.HTTP_TIMEOUT)
+        response.raise_for_status()
+        CHUMASH_SEARCH_PAGE = (response.text, response.url)
+    return CHUMASH_SEARCH_PAGE
+
+def get_form_option_value(select, predicate):
+    """
+    Returns the value of the first <option> of a parsed <select> whose stripped text
+    matches, or None.
+    """
+    for option in select.find_all("option"):
+        text = option.get_text(strip=True)
+        if predicate(text):
+            return option.get("value", text)
+    return None
+
+def build_chumash_form_request(page_html, page_url, book, chapter, verse="1"):
+    """
+    Fills in the Chumash search form the way select_chumash_options() and
+    click_go_button() do in the browser.
+
+    Args:
+        page_html (str): HTML of the search page.
+        page_url (str): URL of the search page (for a relative form action).
+        book (str): Name of the book (e.g., "Genesis").
+        chapter (int): Chapter number.
+        verse (str): Verse number.
+
+    Returns:
+        tuple: (method, action url, {field name: value})
+
+    Raises:
+        ValueError: If the page has no Chumash search form, or it has no option for the
+                    book, chapter or verse (sending a guessed value could return another
+                    chapter's page).
+    """
+    soup = html_backend.make_soup(page_html)
+    book_select = soup.find("select", attrs={"name": "bookq"})
+    form = book_select.find_parent("form") if book_select else None
+    if form is None:
+        raise ValueError(f"Chumash search form not found on {page_url}")
+
+    # Default values of every field, as the browser would send them
+    fields = {}
+    for element in form.find_all(["input", "select"]):
+        name = element.get("name")
+        if not name:
+            continue
+        if element.name == "select":
+            option = element.find("option", selected=True) or element.find("option")
+            fields[name] = option.get("value", option.get_text(strip=True)) if option else ""
+        elif element.get("type", "text").lower() in ("checkbox", "radio"):
+            if element.has_attr("checked"):
+                fields[name] = element.get("value", "on")
+        elif element.get("type", "text").lower() not in ("submit", "button", "image", "reset"):
+            fields[name] = element.get("value", "")
+
+    go_button = form.find("input", attrs={"type": "submit", "value": "GO"})
+    if go_button is not None and go_button.get("name"):
+        fields[go_button["name"]] = go_button["value"]
+
+    # Book, chapter and verse, matched on the option text like in the browser
+    wanted_options = [
+        ("bookq", book, lambda text: text == book),
+        ("chapterq", f"Chapter {int(chapter)}", lambda text: text.startswith(f"Chapter {int(chapter)}")),
+        ("textq", f"verse {int(verse)}", lambda text: text == str(int(verse))),
+    ]
+    for name, wanted, predicate in wanted_options:
+        select = form.find("select", attrs={"name": name})
+        value = get_form_option_value(select, predicate) if select else None
+        if value is None:
+            raise ValueError(f"No '{name}' option for {wanted} in the Chumash search form on {page_url}")
+        fields[name] = value
+
+    method = form.get("method", "get").lower()
+    action = urljoin(page_url, form.get("action") or page_url)
+    return method, action, fields
+
+def submit_chumash_form(method, action, fields):
+    """
+    Sends the filled-in search form with the pooled HTTP client, inside a polite slot
+    for the host.
+
+    Returns:
+        requests.Response: The results page.
+
+    Raises:
+        requests.RequestException: On a network error or an HTTP error status.
+    """
+    session = get_http_session()
+    with polite_host_slot(action):
+        if method == "post":
+            response = session.post(action, data=fields, timeout=utils.HTTP_TIMEOUT)
+        else:
+            response = session.get(action, params=fields, timeout=utils.HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response
+
+def get_metsudah_ch_http(book, chapter):
+    """
+    Browser-free version of get_metsudah_ch(): submits the search form with the pooled
+    HTTP client and extracts the verses with extract_chapter_verses().
+
+    Args:
+        book (str): Name of the Torah book (e.g., "Genesis").
+        chapter (int): Chapter number.
+
+    Returns:
+        dict: {verse label: verse text}, or None on failure.
+    """
+    verse_data = get_cached_chapter(book, chapter)
+    if verse_data is not None:
+        return verse_data
+
+    try:
+        page_html, page_url = get_chumash_search_page()
+        method, action, fields = build_chumash_form_request(page_html, page_url, book, chapter)
+
+        response = retry_policy.call_with_retry(submit_chumash_form, method, action, fields,
+                                                step="submit_chumash_form", host=retry_policy.get_host(action),
+                                                retry_on=(requests.RequestException,))
+
+        # The reply is final, so an incomplete page is not read again
+        return read_chapter_page(book, chapter, lambda: response.text, attempts=1)
+    except (retry_policy.FetchError, requests.RequestException, ValueError) as e:
+        print(f"[ERROR] Could not fetch {book} Chapter {chapter} over HTTP: {e}")
+        return None
+
+def save_torah_chapter_to_excel_m(torah_book: str, chapter: int, driver=None):
     """
     Fetches English Metsudah Torah text for a given book and chapter,
     and writes the verse references and texts to an Excel file.
@@ -373,58 +855,410 @@ def save_torah_chapter_to_excel_m(torah_book: str, chapter: int):
     Args:
         torah_book (str): Name of the Torah book (e.g., "Genesis").
         chapter (int): Chapter number to retrieve.
+        driver (WebDriver, optional): An open browser to reuse; it is left open. By
+                                      default a browser is launched and quit for this chapter.
+
+    Returns:
+        bool: True if the sheet was written or already up to date, False on failure.
     """
+    owns_driver = driver is None
 
     # Step 1: Fetch the verse data from Metsudah
-    verse_data, driver = get_metsudah_ch(torah_book, chapter)
+    verse_data, driver = get_metsudah_ch(torah_book, chapter, driver)
+
+    try:
+        return write_chapter_to_excel(torah_book, chapter, verse_data)
+    finally:
+        if owns_driver and driver:
+            driver.quit()
 
+def write_chapter_to_excel(torah_book: str, chapter: int, verse_data):
+    """
+    Writes the fetched verses of a chapter to its sheet in the book's Excel file.
+
+    Args:
+        torah_book (str): Name of the Torah book (e.g., "Genesis").
+        chapter (int): Chapter number.
+        verse_data (dict): {verse label: verse text} from get_metsudah_ch().
+
+    Returns:
+        bool: True if the sheet was written or already up to date, False on failure.
+    """
     if not isinstance(verse_data, dict):
         print("[ERROR] verse_data is not a dictionary. Exiting.")
-        return
+        return False
 
     # Step 2: Prepare Excel writing
     sheet_name = f"{torah_book} CH{chapter}"
     directory = utils.OUT_ENG_TORAH_XLSX
     filename = torah_book
     headers = ["Verse", "Verse_String"]
+    rows = list(verse_data.items())
+
+    # Skip the rewrite entirely if the sheet already holds exactly this content
+    content_hash = excel_engine.get_sheet_content_hash(headers, rows)
+    if excel_engine.is_sheet_up_to_date(directory / f"{filename}.xlsx", sheet_name, content_hash):
+        print(f"[INFO] {sheet_name} is unchanged, skipping rewrite.")
+        return True
 
     # Step 3: Create Excel file with headers
     xlsx_path = excel_engine.create_excel_m(filename, directory, headers, sheet_name)
 
-    # Step 4: Write verse data
+    # Step 4: Write verse data (column widths are fitted while writing)
     if xlsx_path:
-        start_row = 2
-        for idx, (verse_ref, verse_text) in enumerate(verse_data.items(), start=start_row):
-            verse_cell = f"A{idx}"
-            text_cell = f"B{idx}"
-            excel_engine.write_string_to_excel(xlsx_path, sheet_name=sheet_name, cell=verse_cell, text=verse_ref)
-            excel_engine.write_string_to_excel(xlsx_path, sheet_name=sheet_name, cell=text_cell, text=verse_text)
-
+        row_count = excel_engine.write_rows_to_excel(xlsx_path, sheet_name, rows, start_row=2)
+        excel_engine.mark_sheet_complete(xlsx_path, sheet_name, rows=row_count, content_hash=content_hash)
         #print(f"Data written to {xlsx_path}")
     else:
         print("Failed to create Excel file.")
 
-    driver.quit()
+    return bool(xlsx_path)
+
+def record_chapter_crawl(torah_book: str, chapter: int, saved: bool, error=None):
+    """
+    Records a chapter attempt in the Metsudah crawl manifest.
+
+    A saved chapter is recorded as complete only in its workbook's sidecar manifest
+    (see write_chapter_to_excel()), the record the resume reads, so its crawl entry is
+    dropped. A failed chapter is kept in the crawl manifest with its attempt count and
+    error (e.g. a retry_policy failure event) until it succeeds.
+    """
+    unit = f"{torah_book}/{chapter}"
+    if saved:
+        crawl_manifest.clear_unit(utils.METSUDAH_EXCEL_CRAWL, unit)
+    else:
+        crawl_manifest.record_unit(utils.METSUDAH_EXCEL_CRAWL, unit, crawl_manifest.STATUS_FAILED,
+                                   error=error or "chapter could not be fetched or saved")
+
+def save_torah_chapter_with_session(torah_book: str, chapter: int, attempts: int = 2, fetcher=None):
+    """
+    Saves a chapter to Excel with the run's shared browser. If the chapter fails, the
+    browser is recycled and the chapter is tried again with a fresh one.
+
+    Args:
+        torah_book (str): Name of the Torah book (e.g., "Genesis").
+        chapter (int): Chapter number to retrieve.
+        attempts (int): Total number of tries, each after a browser recycle.
+        fetcher (str, optional): utils.METSUDAH_FETCHER_BROWSER or utils.METSUDAH_FETCHER_HTTP.
+                                 Defaults to utils.METSUDAH_FETCHER.
+
+    Returns:
+        bool: True if the chapter was saved.
+    """
+    fetcher = fetcher or utils.METSUDAH_FETCHER
+
+    for attempt in range(1, attempts + 1):
+        retry_policy.pop_last_fetch_error()  # Only report this attempt's failure
+
+        if fetcher == utils.METSUDAH_FETCHER_HTTP:
+            saved = write_chapter_to_excel(torah_book, chapter, get_metsudah_ch_http(torah_book, chapter))
+        else:
+            driver = get_session_driver()
+            saved = driver is not None and save_torah_chapter_to_excel_m(torah_book, chapter, driver=driver)
+            if not saved:
+                recycle_session_driver()
+
+        record_chapter_crawl(torah_book, chapter, saved, error=None if saved else retry_policy.pop_last_fetch_error())
+        if saved:
+            return True
 
-    # Step 5: Auto-adjust column widths
-    final_xlsx_file = directory / f"{filename}.xlsx"
-    excel_engine.autofit_excel_columns(final_xlsx_file, sheet_name)
+        if attempt < attempts:
+            print(f"[INFO] Retrying {torah_book} Chapter {chapter}...")
 
-def save_entire_torah_book_to_excel_m(book_name):
+    print(f"[ERROR] {torah_book} Chapter {chapter} failed after {attempts} attempt(s).")
+    return False
+
+def save_entire_torah_book_to_excel_m(book_name, resume=True, close_session=True, fetcher=None):
     """
     Given a Torah book name, retrieves each chapter from the Metsudah English
     translation site and saves each chapter to a separate sheet in a single Excel file.
     One sheet per chapter of book and one excel per book will be saved one book at a time.
 
+    Chapters whose sheet is recorded as complete in the workbook's sidecar manifest are
+    skipped, so an interrupted export resumes from the first unfinished chapter. Chapters
+    that failed are listed with their attempt count and last error in the crawl manifest
+    (utils.METSUDAH_EXCEL_CRAWL) until they are saved.
+
+    A single browser is launched for the whole book and navigated from chapter to
+    chapter; it is only replaced when a chapter fails.
+
     Args:
         book_name (str): Name of the Torah book (e.g., 'Genesis')
+        resume (bool): Skip chapters already completed by a previous run. Defaults to True.
+        close_session (bool): Quit the browser when the book is done. Pass False to keep
+                              it for the next book.
+        fetcher (str, optional): utils.METSUDAH_FETCHER_BROWSER or utils.METSUDAH_FETCHER_HTTP
+                                 (no browser). Defaults to utils.METSUDAH_FETCHER.
+
+    Returns:
+        list[int]: The chapters left incomplete (empty if the whole book is saved).
     """
 
     chapter_count = utils.get_torah_book_num_chapters(book_name)
+    xlsx_path = utils.OUT_ENG_TORAH_XLSX / f"{book_name}.xlsx"
+    completed_sheets = excel_engine.get_completed_sheets(xlsx_path) if resume else set()
+
+    pending_chapters = [ch for ch in range(1, chapter_count + 1) if f"{book_name} CH{ch}" not in completed_sheets]
+    if resume and pending_chapters and len(pending_chapters) < chapter_count:
+        print(f"[INFO] Resuming {book_name} from Chapter {pending_chapters[0]} ({chapter_count - len(pending_chapters)} chapters already complete).")
+
+    failed_chapters = []
+    try:
+        for num_chapter in pending_chapters:
+            print(f"Processing {book_name} Chapter {num_chapter}...")
+            if not save_torah_chapter_with_session(book_name, num_chapter, fetcher=fetcher):
+                failed_chapters.append(num_chapter)
+    finally:
+        if close_session:
+            close_session_driver()
+
+    if failed_chapters:
+        print(f"[ERROR] {book_name} chapters left incomplete (rerun to resume): {failed_chapters}")
+    return failed_chapters
+
+def export_torah_book_to_excel_worker(book_name):
+    """
+    Process pool worker: exports one whole Torah book to its own Excel file, with one
+    browser session for the whole book.
+
+    Args:
+        book_name (str): Name of the Torah book (e.g., 'Genesis')
+
+    Returns:
+        tuple: (book_name, chapter_count, elapsed_seconds, failed chapters)
+    """
+    start_time = time.perf_counter()
+    # Pool workers do not run atexit handlers, so the session's browser must be quit
+    # by the export itself once the book is done
+    failed_chapters = save_entire_torah_book_to_excel_m(book_name, close_session=True)
+    chapter_count = utils.get_torah_book_num_chapters(book_name)
+    return book_name, chapter_count, time.perf_counter() - start_time, failed_chapters
+
+def save_torah_books_to_excel_parallel_m(book_names=None, max_workers=None):
+    """
+    Exports several Torah books to Excel concurrently, one worker process per book.
+
+    Each worker owns a single output workbook (one file per book), so there is no
+    write contention between processes. Progress is printed as each book finishes,
+    followed by a wall-clock summary. A book with chapters left incomplete does not
+    count as finished; its failed chapters are listed in the summary.
+
+    Args:
+        book_names (list[str], optional): Books to export. Defaults to all five Torah books.
+        max_workers (int, optional): Maximum number of worker processes.
+                                     Defaults to one per book.
+
+    Returns:
+        dict: {book_name: elapsed_seconds} for every book whose chapters were all saved.
+    """
+    book_names = book_names or utils.TORAH_BOOKS
+    max_workers = max_workers or len(book_names)
+
+    start_time = time.perf_counter()
+    finished = {}
+    incomplete = {}  # {book_name: failed chapters}
+
+    print(f"[INFO] Exporting {len(book_names)} books with {max_workers} worker processes...")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(export_torah_book_to_excel_worker, book): book for book in book_names}
+
+        for done_count, future in enumerate(as_completed(futures), start=1):
+            book = futures[future]
+            try:
+                book_name, chapter_count, elapsed, failed_chapters = future.result()
+                if failed_chapters:
+                    incomplete[book_name] = failed_chapters
+                    print(f"[ERROR] ({done_count}/{len(book_names)}) {book_name}: {len(failed_chapters)} of "
+                          f"{chapter_count} chapters failed in {elapsed:.1f}s")
+                else:
+                    finished[book_name] = elapsed
+                    print(f"[INFO] ({done_count}/{len(book_names)}) {book_name}: {chapter_count} chapters in {elapsed:.1f}s")
+            except Exception as e:
+                print(f"[ERROR] ({done_count}/{len(book_names)}) {book} failed: {e}")
+
+    total_elapsed = time.perf_counter() - start_time
+    failed = [book for book in book_names if book not in finished and book not in incomplete]
+    print(f"[INFO] Finished {len(finished)}/{len(book_names)} books in {total_elapsed:.1f}s wall-clock "
+          f"({sum(finished.values()):.1f}s of worker time).")
+    for book, failed_chapters in incomplete.items():
+        print(f"[ERROR] {book} chapters left incomplete (rerun to resume): {failed_chapters}")
+    if failed:
+        print(f"[ERROR] Failed books: {', '.join(failed)}")
+
+    return finished
+
+@contextmanager
+def polite_host_slot(url):
+    """
+    Holds one of the host's request slots for the duration of the block.
 
-    for num_chapter in range(1, chapter_count + 1):
-        print(f"Processing {book_name} Chapter {num_chapter}...")
-        save_torah_chapter_to_excel_m(book_name, num_chapter)
+    At most utils.HOST_MAX_CONCURRENT_REQUESTS blocks run at once against the same host,
+    and each starts at least utils.HOST_MIN_REQUEST_INTERVAL seconds after the previous
+    one, whichever thread runs it.
+
+    :param url: Any URL on the host
+    """
+    host = urlparse(url).netloc
+    with HOST_POLITENESS_LOCK:
+        state = HOST_POLITENESS.setdefault(host, {
+            "slots": threading.BoundedSemaphore(utils.HOST_MAX_CONCURRENT_REQUESTS),
+            "lock": threading.Lock(),
+            "last_start": 0.0,
+        })
+
+    with state["slots"]:
+        with state["lock"]:
+            delay = state["last_start"] + utils.HOST_MIN_REQUEST_INTERVAL - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            state["last_start"] = time.monotonic()
+        yield
+
+def get_pool_driver():
+    """
+    Returns the headless browser of the calling pool thread, launching it on first use.
+    """
+    driver = getattr(POOL_THREAD_STATE, "driver", None)
+    if driver is None:
+        driver = launch_chrome_driver(headless=True)
+        POOL_THREAD_STATE.driver = driver
+        with POOL_DRIVERS_LOCK:
+            POOL_DRIVERS.append(driver)
+    return driver
+
+def recycle_pool_driver():
+    """
+    Quits the calling pool thread's browser after a failure; the thread's next
+    get_pool_driver() call launches a fresh one.
+    """
+    driver = getattr(POOL_THREAD_STATE, "driver", None)
+    POOL_THREAD_STATE.driver = None
+    if driver is None:
+        return
+    with POOL_DRIVERS_LOCK:
+        if driver in POOL_DRIVERS:
+            POOL_DRIVERS.remove(driver)
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"[ERROR] Could not quit a pool browser: {e}")
+
+def close_pool_drivers():
+    """
+    Quits every browser launched by the pool.
+    """
+    with POOL_DRIVERS_LOCK:
+        drivers = list(POOL_DRIVERS)
+        POOL_DRIVERS.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[ERROR] Could not quit a pool browser: {e}")
+
+def fetch_chapter_pooled(torah_book: str, chapter: int, attempts: int = 2, fetcher=None):
+    """
+    Pool worker: fetches one chapter with the calling thread's headless browser. Each
+    request to the Metsudah host holds a polite slot, released before any retry pause.
+    A failed chapter recycles the browser and is tried again. With the HTTP fetcher no
+    browser is used.
+
+    Returns:
+        tuple: (torah_book, chapter, {verse label: verse text} or None on failure,
+                error of the last failed attempt or None), the error being recorded in
+                the crawl manifest by the writing thread (see record_chapter_crawl())
+    """
+    # Cached chapters need neither a browser nor a slot on the host
+    verse_data = get_cached_chapter(torah_book, chapter)
+    if verse_data is not None:
+        return torah_book, chapter, verse_data, None
+
+    error = None
+    for attempt in range(1, attempts + 1):
+        retry_policy.pop_last_fetch_error()  # Only report this attempt's failure
+
+        if (fetcher or utils.METSUDAH_FETCHER) == utils.METSUDAH_FETCHER_HTTP:
+            verse_data = get_metsudah_ch_http(torah_book, chapter)
+            if verse_data is not None:
+                return torah_book, chapter, verse_data, None
+            error = retry_policy.pop_last_fetch_error() or f"{torah_book} Chapter {chapter} could not be fetched over HTTP"
+            continue
+
+        try:
+            driver = get_pool_driver()
+            verse_data, _ = get_metsudah_ch(torah_book, chapter, driver, polite=True)
+        except Exception as e:
+            print(f"[ERROR] {torah_book} Chapter {chapter}, attempt {attempt}: {e}")
+            verse_data = None
+
+        if isinstance(verse_data, dict):
+            return torah_book, chapter, verse_data, None
+        error = retry_policy.pop_last_fetch_error() or f"{torah_book} Chapter {chapter} could not be fetched"
+        recycle_pool_driver()
+
+    return torah_book, chapter, None, error
+
+def save_torah_books_to_excel_pooled_m(book_names=None, max_browsers=None, resume=True, fetcher=None):
+    """
+    Scrapes the chapters of several Torah books concurrently with a bounded pool of
+    headless browsers and saves each chapter to its Excel sheet.
+
+    Browsers fetch different chapters at the same time, while polite_host_slot() keeps
+    the load on the Metsudah site within the per-host limits. Fetched chapters are
+    written by the calling thread as they arrive, so the workbooks have a single writer.
+
+    Args:
+        book_names (list[str], optional): Books to scrape. Defaults to all five Torah books.
+        max_browsers (int, optional): Number of headless browsers. Defaults to utils.SCRAPER_MAX_BROWSERS.
+        resume (bool): Skip chapters already completed by a previous run. Defaults to True.
+        fetcher (str, optional): utils.METSUDAH_FETCHER_BROWSER or utils.METSUDAH_FETCHER_HTTP
+                                 (pool threads then share the HTTP client instead of browsers).
+                                 Defaults to utils.METSUDAH_FETCHER.
+
+    Returns:
+        int: Number of chapters saved.
+    """
+    book_names = book_names or utils.TORAH_BOOKS
+    max_browsers = max_browsers or utils.SCRAPER_MAX_BROWSERS
+
+    jobs = []
+    for book in book_names:
+        completed_sheets = excel_engine.get_completed_sheets(utils.OUT_ENG_TORAH_XLSX / f"{book}.xlsx") if resume else set()
+        jobs += [(book, chapter) for chapter in range(1, utils.get_torah_book_num_chapters(book) + 1)
+                 if f"{book} CH{chapter}" not in completed_sheets]
+
+    start_time = time.perf_counter()
+    saved = 0
+    failed = []
+    print(f"[INFO] Scraping {len(jobs)} chapters with {max_browsers} workers ({fetcher or utils.METSUDAH_FETCHER})...")
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_browsers) as executor:
+            futures = {executor.submit(fetch_chapter_pooled, book, chapter, fetcher=fetcher): (book, chapter) for book, chapter in jobs}
+
+            for done_count, future in enumerate(as_completed(futures), start=1):
+                book, chapter = futures[future]
+                try:
+                    _, _, verse_data, error = future.result()
+                except Exception as e:
+                    print(f"[ERROR] {book} Chapter {chapter} failed: {e}")
+                    verse_data, error = None, f"{type(e).__name__}: {e}"
+
+                chapter_saved = verse_data is not None and write_chapter_to_excel(book, chapter, verse_data)
+                record_chapter_crawl(book, chapter, chapter_saved, error=None if chapter_saved else error)
+                if chapter_saved:
+                    saved += 1
+                    print(f"[INFO] ({done_count}/{len(jobs)}) Saved {book} Chapter {chapter}")
+                else:
+                    failed.append(f"{book} {chapter}")
+    finally:
+        close_pool_drivers()
+
+    print(f"[INFO] Saved {saved}/{len(jobs)} chapters in {time.perf_counter() - start_time:.1f}s")
+    if failed:
+        print(f"[ERROR] Failed chapters: {', '.join(failed)}")
+    return saved
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# On-disk cache of scraped pages, shared by the web_navigator and torah_web_scraper scrapers.
+# Entries are keyed by a hash of the request parameters (site, book, chapter, ...), expire
+# after a TTL, and the least recently used entries are evicted once the cache outgrows its
+# size limit. Standard library only (plus the project's stdlib-only file_utils), so any
+# scraper folder can import it.
+
+# -------------------------
+# Bootstrapping Dependencies
+# -------------------------
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+
+DEPENDENCY_DIRS = [
+    PROJECT_ROOT / "utils"
+]
+
+for path in DEPENDENCY_DIRS:
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.append(path_str)
+
+import file_utils                 # utils directory
+
+# -------------------------
+# Cache Settings
+# -------------------------
+
+PAGE_CACHE_DIR = PROJECT_ROOT / "data" / "page_cache"
+PAGE_CACHE_TTL = 30 * 24 * 60 * 60  # Seconds an entry stays valid (the texts rarely change)
+PAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Evict least recently used entries beyond this size
+
+def get_cache_key(**params):
+    """
+    Returns the cache key of a request: the SHA-256 of its parameters.
+
+    Args:
+        **params: The request parameters, e.g. source="metsudah", book="Genesis", chapter=1.
+
+    Returns:
+        str: Hex digest.
+    """
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def get_cache_path(key: str, cache_dir=None):
+    """
+    Returns the file of a cache entry (entries are spread over 256 subfolders).
+    """
+    return Path(cache_dir or PAGE_CACHE_DIR) / key[:2] / f"{key}.html"
+
+def get_cached_page(ttl=None, cache_dir=None, **params):
+    """
+    Returns a cached page, or None if it is missing or older than the TTL.
+
+    Args:
+        ttl (float, optional): Maximum age in seconds. Defaults to PAGE_CACHE_TTL.
+        cache_dir (str or Path, optional): Cache folder. Defaults to PAGE_CACHE_DIR.
+        **params: The request parameters the page was stored under.
+
+    Returns:
+        str: The page, or None.
+    """
+    path = get_cache_path(get_cache_key(**params), cache_dir)
+    ttl = PAGE_CACHE_TTL if ttl is None else ttl
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    now = time.time()
+    if now - stat.st_mtime > ttl:
+        return None
+
+    # Record the use (access time) for the eviction order, keeping the write time for the TTL
+    os.utime(path, (now, stat.st_mtime))
+    return path.read_text(encoding="utf-8")
+
+def store_page(page: str, cache_dir=None, max_bytes=None, **params):
+    """
+    Stores a page under its request parameters, then evicts old entries if the cache
+    has grown past its size limit.
+
+    The entry is written to a temporary file and renamed into place (see
+    file_utils.write_text_atomic()), so concurrent readers never see a partial page.
+
+    Args:
+        page (str): The page content.
+        cache_dir (str or Path, optional): Cache folder. Defaults to PAGE_CACHE_DIR.
+        max_bytes (int, optional): Size limit of the cache. Defaults to PAGE_CACHE_MAX_BYTES.
+        **params: The request parameters.
+
+    Returns:
+        Path: The entry's file.
+    """
+    path = get_cache_path(get_cache_key(**params), cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    file_utils.write_text_atomic(path, page)
+
+    evict_cache(cache_dir, max_bytes)
+    return path
+
+def evict_cache(cache_dir=None, max_bytes=None, ttl=None):
+    """
+    Deletes expired entries, then the least recently used ones until the cache fits
+    in max_bytes.
+
+    Returns:
+        int: Number of entries deleted.
+    """
+    cache_dir = Path(cache_dir or PAGE_CACHE_DIR)
+    max_bytes = PAGE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    ttl = PAGE_CACHE_TTL if ttl is None else ttl
+    now = time.time()
+
+    entries = []
+    deleted = 0
+    for path in cache_dir.glob("*/*.html"):
+        try:
+            stat = path.stat()
+            if now - stat.st_mtime > ttl:
+                path.unlink()
+                deleted += 1
+            else:
+                entries.append((stat.st_atime, stat.st_size, path))
+        except FileNotFoundError:
+            continue  # Removed by another process
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total_size <= max_bytes:
+            break
+        try:
+            path.unlink()
+            deleted += 1
+        except FileNotFoundError:
+            pass
+        total_size -= size
+
+    return deleted
+
+def iter_cached_pages(cache_dir=None):
+    """
+    Yields the content of every entry in the cache (expired or not), e.g. to benchmark
+    the extractors on real pages.
+    """
+    for path in sorted(Path(cache_dir or PAGE_CACHE_DIR).glob("*/*.html")):
+        try:
+            yield path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            continue  # Evicted meanwhile
+
+def fetch_with_cache(fetch_func, ttl=None, cache_dir=None, **params):
+    """
+    Returns the cached page for these request parameters, or calls fetch_func() and
+    caches what it returns. Empty results (failed fetches) are not cached.
+
+    Args:
+        fetch_func (callable): Fetches the page; returns the page text or None.
+        ttl (float, optional): Maximum age of a cached page in seconds.
+        cache_dir (str or Path, optional): Cache folder. Defaults to PAGE_CACHE_DIR.
+        **params: The request parameters.
+
+    Returns:
+        str: The page, or None if it is not cached and the fetch failed.
+    """
+    page = get_cached_page(ttl=ttl, cache_dir=cache_dir, **params)
+    if page is not None:
+        return page
+
+    page = fetch_func()
+    if page:
+        store_page(page, cache_dir=cache_dir, **params)
+    return page
@@ -0,0 +1,237 @@
+import contextlib
+import json
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+# Retry policy for the scrapers' fetch steps (selecting options, submitting the form,
+# reading the verses). A failed step is retried with bounded exponential backoff and
+# jitter. A per-host circuit breaker pauses every step against a host that keeps failing.
+# Each failure is reported as a structured event. Standard library only, so any scraper
+# folder can import it.
+
+# -------------------------
+# Retry Settings
+# -------------------------
+RETRY_ATTEMPTS = 3  # Tries per step, the first one included
+RETRY_BASE_DELAY = 1.0  # Seconds; the backoff ceiling doubles after every failed try
+RETRY_MAX_DELAY = 30.0  # Seconds; cap on the backoff ceiling
+
+CIRCUIT_FAILURE_THRESHOLD = 5  # Consecutive failed tries that open a host's circuit
+CIRCUIT_RESET_TIMEOUT = 60.0  # Seconds an open circuit rejects calls before one trial call is let through
+CIRCUIT_TRIAL_POLL_INTERVAL = 1.0  # Seconds between checks while another caller's trial call is running
+
+FETCH_ERROR_LOG_SIZE = 500  # Most recent failure events kept for get_fetch_errors()
+
+# Per-host circuit state: {host: {"failures": consecutive failures, "opened_at": time or None,
+#                                 "trial_in_flight": True while the half-open circuit's one trial call runs}}
+HOST_CIRCUITS = {}
+HOST_CIRCUITS_LOCK = threading.Lock()
+
+FETCH_ERROR_LOG = []
+FETCH_ERROR_LOG_LOCK = threading.Lock()
+
+# Last failure of the calling thread, for callers that record it (e.g. in a crawl manifest)
+LAST_FETCH_ERROR = threading.local()
+
+class FetchError(Exception):
+    """
+    A fetch step that still failed after its retries.
+    """
+    def __init__(self, step, host, attempts, cause):
+        super().__init__(f"{step} failed on {host} after {attempts} attempt(s): {type(cause).__name__}: {cause}")
+        self.step = step
+        self.host = host
+        self.attempts = attempts
+        self.cause = cause
+
+    def to_dict(self):
+        return {
+            "step": self.step,
+            "host": self.host,
+            "attempts": self.attempts,
+            "error_type": type(self.cause).__name__,
+            "error": str(self.cause),
+        }
+
+class CircuitOpenError(FetchError):
+    """
+    A fetch step rejected without being tried, because its host's circuit is open.
+    """
+    def __init__(self, step, host, retry_in):
+        FetchError.__init__(self, step, host, 0, RuntimeError("circuit open"))
+        self.args = (f"{step} not tried: the circuit for {host} stays open for another {retry_in:.1f}s",)
+        self.retry_in = retry_in
+
+def get_host(url: str):
+    """
+    Returns the host of a URL, the unit the circuit breaker tracks (e.g. 'www.mnemotrix.com').
+    """
+    return urlparse(url).netloc or url
+
+def get_backoff_delay(attempt: int, base_delay=None, max_delay=None):
+    """
+    Returns the pause before retry number `attempt` (1 for the first retry): a random
+    delay up to base_delay * 2 ** (attempt - 1), capped at max_delay ("full jitter",
+    so parallel workers do not retry in lockstep).
+    """
+    base_delay = RETRY_BASE_DELAY if base_delay is None else base_delay
+    max_delay = RETRY_MAX_DELAY if max_delay is None else max_delay
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+
+def get_circuit_wait(host: str):
+    """
+    Returns how many seconds the host's circuit will keep rejecting calls, or 0 if the
+    caller may go ahead.
+
+    Once an open circuit has waited CIRCUIT_RESET_TIMEOUT it is half-open: the first
+    caller to get 0 makes the one trial call, and every other caller waits for its
+    outcome (record_success() closes the circuit, record_failure() reopens it).
+    """
+    with HOST_CIRCUITS_LOCK:
+        circuit = HOST_CIRCUITS.get(host)
+        if not circuit or circuit["opened_at"] is None:
+            return 0.0
+
+        wait = circuit["opened_at"] + CIRCUIT_RESET_TIMEOUT - time.monotonic()
+        if wait > 0:
+            return wait
+        if circuit["trial_in_flight"]:
+            return CIRCUIT_TRIAL_POLL_INTERVAL
+        circuit["trial_in_flight"] = True
+        return 0.0
+
+def end_circuit_trial(host: str):
+    """
+    Lets another caller make the trial call, after a call that ended without telling
+    whether the host works (an exception not worth retrying).
+    """
+    with HOST_CIRCUITS_LOCK:
+        circuit = HOST_CIRCUITS.get(host)
+        if circuit:
+            circuit["trial_in_flight"] = False
+
+def record_success(host: str):
+    """
+    Closes the host's circuit and clears its failure count.
+    """
+    with HOST_CIRCUITS_LOCK:
+        HOST_CIRCUITS.pop(host, None)
+
+def record_failure(host: str):
+    """
+    Counts a failed try against the host, opening (or reopening, after a failed trial
+    call) its circuit once the failures reach CIRCUIT_FAILURE_THRESHOLD.
+
+    Returns:
+        bool: True if the circuit is now open.
+    """
+    with HOST_CIRCUITS_LOCK:
+        circuit = HOST_CIRCUITS.setdefault(host, {"failures": 0, "opened_at": None, "trial_in_flight": False})
+        circuit["failures"] += 1
+        circuit["trial_in_flight"] = False
+        if circuit["failures"] >= CIRCUIT_FAILURE_THRESHOLD:
+            if circuit["opened_at"] is None:
+                print(f"[ERROR] Circuit opened for {host} after {circuit['failures']} consecutive failures.")
+            circuit["opened_at"] = time.monotonic()
+            return True
+        return False
+
+def report_fetch_error(step, host, attempt, attempts, error, retry_in=None):
+    """
+    Records a failed try as a structured event, prints it as one JSON line, and makes
+    it the calling thread's last error (see pop_last_fetch_error()).
+
+    Returns:
+        dict: The event.
+    """
+    event = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "step": step,
+        "host": host,
+        "attempt": attempt,
+        "attempts": attempts,
+        "error_type": type(error).__name__,
+        "error": str(error).strip().splitlines()[0] if str(error).strip() else "",
+        "retry_in": None if retry_in is None else round(retry_in, 2),
+    }
+
+    with FETCH_ERROR_LOG_LOCK:
+        FETCH_ERROR_LOG.append(event)
+        del FETCH_ERROR_LOG[:-FETCH_ERROR_LOG_SIZE]
+    LAST_FETCH_ERROR.event = event
+
+    print(f"[ERROR] Fetch step failed: {json.dumps(event, ensure_ascii=False)}")
+    return event
+
+def get_fetch_errors():
+    """
+    Returns the most recent failure events (see report_fetch_error()), oldest first.
+    """
+    with FETCH_ERROR_LOG_LOCK:
+        return list(FETCH_ERROR_LOG)
+
+def pop_last_fetch_error():
+    """
+    Returns and clears the calling thread's last failure event, or None.
+    """
+    event = getattr(LAST_FETCH_ERROR, "event", None)
+    LAST_FETCH_ERROR.event = None
+    return event
+
+def call_with_retry(func, *args, step=None, host="", attempts=None, retry_on=(Exception,), wait_for_circuit=True,
+                    hold=None, **kwargs):
+    """
+    Calls func(*args, **kwargs), retrying failures with exponential backoff and jitter
+    and honouring the host's circuit breaker.
+
+    Args:
+        func (callable): The fetch step.
+        step (str, optional): Name of the step in error reports. Defaults to func's name.
+        host (str): Host the step talks to (see get_host()); failures are counted per host.
+        attempts (int, optional): Total tries. Defaults to RETRY_ATTEMPTS.
+        retry_on (tuple): Exception types worth retrying; others propagate at once.
+        wait_for_circuit (bool): If the host's circuit is open, sleep until it lets a
+                                 trial call through (True, for long crawls) or raise
+                                 CircuitOpenError at once (False).
+        hold (callable, optional): Returns a context manager held around each try only,
+                                   e.g. a politeness slot on the host; it is released
+                                   before any backoff or circuit pause.
+
+    Returns:
+        The value returned by func.
+
+    Raises:
+        FetchError: If every try failed.
+        CircuitOpenError: If the circuit is open and wait_for_circuit is False.
+    """
+    step = step or getattr(func, "__name__", "fetch")
+    attempts = attempts or RETRY_ATTEMPTS
+
+    for attempt in range(1, attempts + 1):
+        circuit_wait = get_circuit_wait(host)
+        if circuit_wait:
+            if not wait_for_circuit:
+                raise CircuitOpenError(step, host, circuit_wait)
+            print(f"[INFO] Circuit for {host} is open, pausing {circuit_wait:.1f}s before {step}...")
+        while circuit_wait:  # Until the circuit closes, or this caller gets the trial call
+            time.sleep(circuit_wait)
+            circuit_wait = get_circuit_wait(host)
+
+        try:
+            with (hold or contextlib.nullcontext)():
+                result = func(*args, **kwargs)
+        except retry_on as e:
+            record_failure(host)
+            retry_in = get_backoff_delay(attempt) if attempt < attempts else None
+            report_fetch_error(step, host, attempt, attempts, e, retry_in)
+            if retry_in is None:
+                raise FetchError(step, host, attempts, e) from e
+            time.sleep(retry_in)
+        except BaseException:
+            end_circuit_trial(host)
+            raise
+        else:
+            record_success(host)
+            return result
@@ -52,6 +52,75 @@ def get_verse(filepath, filename, chapter, verse):
 
     return [w.text for w in verse_node.findall("w")]
 
+def get_book_verses(filepath, filename):
+    """
+    Returns every verse of the given XML Torah book, parsed in a single pass.
+
+    Args:
+        filepath (str): Directory where the XML file is located.
+        filename (str): Name of the XML file (e.g., 'Genesis.xml').
+
+    Returns:
+        Dict[int, Dict[int, List[str]]]: {chapter: {verse: [Hebrew words]}}
+    """
+    full_path = os.path.join(filepath, filename)
+    root = ET.parse(full_path).getroot()
+
+    book = {}
+    for chapter_node in root.iter("c"):
+        chapter = int(chapter_node.get("n"))
+        book[chapter] = {
+            int(verse_node.get("n")): [w.text for w in verse_node.findall("w")]
+            for verse_node in chapter_node.findall("v")
+        }
+
+    return book
+
+def iter_book_verses(filepath, filename):
+    """
+    Yields the verses of the given XML Torah book one at a time, without building the
+    whole tree, so memory use does not grow with the size of the book.
+
+    Args:
+        filepath (str): Directory where the XML file is located.
+        filename (str): Name of the XML file (e.g., 'Genesis.xml').
+
+    Yields:
+        Tuple[int, int, List[str]]: (chapter, verse, [Hebrew words])
+    """
+    full_path = os.path.join(filepath, filename)
+    chapter = None
+
+    for event, elem in ET.iterparse(full_path, events=("start", "end")):
+        if event == "start" and elem.tag == "c":
+            chapter = int(elem.get("n"))
+        elif event == "end" and elem.tag == "v":
+            yield chapter, int(elem.get("n")), [w.text for w in elem.findall("w")]
+            elem.clear()
+        elif event == "end" and elem.tag == "c":
+            elem.clear()
+
+def get_chapter_verses(filepath, filename, chapter):
+    """
+    Returns every verse of one chapter as lists of words, from a single parse of the XML.
+
+    Args:
+        filepath (str): Directory where the XML file is located.
+        filename (str): Name of the XML file (e.g., 'Genesis.xml').
+        chapter (int): Chapter number.
+
+    Returns:
+        Dict[int, List[str]]: {verse: [Hebrew words]}
+    """
+    full_path = os.path.join(filepath, filename)
+    root = ET.parse(full_path).getroot()
+
+    chapter_node = root.find(f".//c[@n='{chapter}']")
+    if chapter_node is None:
+        raise ValueError(f"Chapter not found: {chapter} in {filename}")
+
+    return {int(v.get("n")): [w.text for w in v.findall("w")] for v in chapter_node.findall("v")}
+
 def get_word_in_verse(filepath, filename, chapter, verse, word_index):
     """
     Returns the N-th word in a specified verse (1-based index).